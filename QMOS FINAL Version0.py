@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog, simpledialog
 import sqlite3
 import threading
+import queue
 import time
 from datetime import datetime
 import random
@@ -10,6 +11,7 @@ import json
 from PIL import Image, ImageDraw, ImageTk
 import os
 import shutil
+from array import array
 
 # ابتدا تمام کلاس‌های پایه را تعریف می‌کنیم
 class NeuralCache:
@@ -65,6 +67,463 @@ class QuantumAIProcessor:
         result = sum(numbers) * random.uniform(0.99, 1.01)
         return f"Quantum computation result: {result:.6f}"
 
+class TemporalRingBuffer:
+    """Fixed-capacity circular buffer of (timestamp, value) samples"""
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.values = array('d', bytes(8 * capacity))
+        self.times = array('d', bytes(8 * capacity))
+        self.start = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, value, timestamp=None):
+        """O(1) append, overwriting the oldest sample when full"""
+        index = (self.start + self.count) % self.capacity
+        self.values[index] = value
+        self.times[index] = time.time() if timestamp is None else timestamp
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+    def last(self, default=None):
+        if self.count == 0:
+            return default
+        return self.values[(self.start + self.count - 1) % self.capacity]
+
+    def window(self, count=None, since=None):
+        """Return the newest samples (oldest first), limited by count and/or timestamp"""
+        size = self.count if count is None else max(0, min(count, self.count))
+        first = self.count - size
+        if since is not None:
+            # Samples are time-ordered, so skip forward to the first one inside the window
+            while first < self.count and self.times[(self.start + first) % self.capacity] < since:
+                first += 1
+        values = []
+        for offset in range(first, self.count):
+            values.append(self.values[(self.start + offset) % self.capacity])
+        return values
+
+    def aggregate(self, count=None, since=None):
+        """Min/max/mean over a window"""
+        values = self.window(count, since)
+        if not values:
+            return {'min': 0.0, 'max': 0.0, 'mean': 0.0, 'count': 0}
+        return {
+            'min': min(values),
+            'max': max(values),
+            'mean': sum(values) / len(values),
+            'count': len(values)
+        }
+
+class TemporalSeriesStore:
+    """Bounded in-memory history for every charted metric"""
+    def __init__(self, capacity=720):
+        self.capacity = capacity
+        self.series = {}
+
+    def get_series(self, metric, capacity=None):
+        if metric not in self.series:
+            self.series[metric] = TemporalRingBuffer(capacity or self.capacity)
+        return self.series[metric]
+
+    def append(self, metric, value, timestamp=None):
+        self.get_series(metric).append(value, timestamp)
+
+    def last(self, metric, default=None):
+        if metric not in self.series:
+            return default
+        return self.series[metric].last(default)
+
+    def window(self, metric, count=None, since=None):
+        if metric not in self.series:
+            return []
+        return self.series[metric].window(count, since)
+
+    def aggregate(self, metric, count=None, since=None):
+        return self.get_series(metric).aggregate(count, since)
+
+class IncrementalLineChart:
+    """Canvas line chart that updates its items in place instead of redrawing"""
+    def __init__(self, canvas, left, top, right, bottom, line_color='#00ff88',
+                 marker_color=None, max_markers=0, y_range=None, smooth=False,
+                 axis_color='#555555', axis_right=None):
+        self.canvas = canvas
+        self.left, self.top, self.right, self.bottom = left, top, right, bottom
+        self.marker_color = marker_color
+        self.max_markers = max_markers if marker_color else 0
+        self.fixed_range = y_range
+        self.y_min = None
+        self.y_max = None
+        self.y_scale = 1.0
+
+        # Static axes, drawn once
+        canvas.create_line(left, bottom, axis_right or right, bottom, fill=axis_color, tags="chart_axis")
+        canvas.create_line(left, bottom, left, top, fill=axis_color, tags="chart_axis")
+
+        # One polyline for the whole series
+        self.line = canvas.create_line(left, bottom, left, bottom, fill=line_color,
+                                       width=2, smooth=smooth, state='hidden', tags="chart_series")
+        self.markers = []
+        self.visible_markers = 0
+
+    def rescale(self, y_min, y_max):
+        """Recompute the y mapping; returns True only if the range changed"""
+        if y_max == y_min:
+            y_max = y_min + 1
+        if (y_min, y_max) == (self.y_min, self.y_max):
+            return False
+        self.y_min, self.y_max = y_min, y_max
+        self.y_scale = (self.bottom - self.top) / (y_max - y_min)
+        return True
+
+    def project_y(self, value):
+        return self.bottom - (value - self.y_min) * self.y_scale
+
+    def project(self, values):
+        """Map values to canvas points, keeping a min/max pair per pixel column"""
+        count = len(values)
+        width = self.right - self.left
+        columns = int(width) + 1
+        points = []
+        if count == 1:
+            points.extend([self.left, self.project_y(values[0])])
+        elif count <= columns:
+            step = width / (count - 1)
+            for i, value in enumerate(values):
+                points.extend([self.left + i * step, self.project_y(value)])
+        else:
+            for column in range(columns):
+                start = column * count // columns
+                end = (column + 1) * count // columns
+                if start == end:
+                    continue
+                low = high = start
+                for i in range(start + 1, end):
+                    if values[i] < values[low]:
+                        low = i
+                    elif values[i] > values[high]:
+                        high = i
+                x = self.left + column
+                for i in sorted({low, high}):
+                    points.extend([x, self.project_y(values[i])])
+        return points
+
+    def update(self, values):
+        if not values:
+            self.canvas.itemconfigure(self.line, state='hidden')
+            self.hide_markers(0)
+            return
+        if self.fixed_range:
+            self.rescale(*self.fixed_range)
+        else:
+            self.rescale(min(values), max(values))
+
+        points = self.project(values)
+        if len(points) >= 4:
+            self.canvas.coords(self.line, *points)
+            self.canvas.itemconfigure(self.line, state='normal')
+        else:
+            self.canvas.itemconfigure(self.line, state='hidden')
+
+        # Markers only make sense while every sample has its own x position
+        shown = 0
+        if len(values) <= self.max_markers:
+            for i in range(0, len(points), 2):
+                x, y = points[i], points[i + 1]
+                if shown == len(self.markers):
+                    self.markers.append(self.canvas.create_oval(
+                        x - 3, y - 3, x + 3, y + 3,
+                        fill=self.marker_color, outline='', tags="chart_marker"))
+                else:
+                    self.canvas.coords(self.markers[shown], x - 3, y - 3, x + 3, y + 3)
+                    if shown >= self.visible_markers:
+                        self.canvas.itemconfigure(self.markers[shown], state='normal')
+                shown += 1
+        self.hide_markers(shown)
+
+    def hide_markers(self, first):
+        for marker in self.markers[first:self.visible_markers]:
+            self.canvas.itemconfigure(marker, state='hidden')
+        self.visible_markers = first
+
+class ActivityTracker:
+    """Scales registered refresh intervals by user activity"""
+    def __init__(self, idle_after=60, background_factor=3):
+        self.idle_after = idle_after
+        self.background_factor = background_factor
+        self.root = None
+        self.last_input = time.monotonic()
+        self.focused = True
+        self.screensaver = False
+        self.tier = 'active'
+        self.cadences = {}
+        self.pending = {}
+        self.wakeup = threading.Condition()
+
+    def attach(self, root):
+        """Start listening for input, focus and map events on the root window"""
+        self.root = root
+        for sequence in ('<Any-KeyPress>', '<Any-ButtonPress>', '<Motion>', '<MouseWheel>'):
+            root.bind_all(sequence, self.on_input, add='+')
+        root.bind('<FocusIn>', self.on_focus_change, add='+')
+        root.bind('<FocusOut>', self.on_focus_change, add='+')
+        root.bind('<Unmap>', lambda e: e.widget is root and self.set_screensaver(True), add='+')
+        root.bind('<Map>', lambda e: e.widget is root and self.set_screensaver(False), add='+')
+
+    def register(self, name, active_ms, minimal_ms):
+        """Register a refresh loop with its normal and minimal cadence"""
+        self.cadences[name] = (active_ms, minimal_ms)
+
+    def current_tier(self):
+        if self.screensaver or time.monotonic() - self.last_input >= self.idle_after:
+            self.tier = 'idle'
+        elif not self.focused:
+            self.tier = 'background'
+        else:
+            self.tier = 'active'
+        return self.tier
+
+    def interval(self, name):
+        active_ms, minimal_ms = self.cadences[name]
+        tier = self.current_tier()
+        if tier == 'idle':
+            return minimal_ms
+        if tier == 'background':
+            return min(minimal_ms, active_ms * self.background_factor)
+        return active_ms
+
+    def schedule(self, name, widget, callback):
+        """widget.after() with the tier-scaled interval; remembered so input can pull it forward"""
+        job = widget.after(self.interval(name), lambda: self.run_scheduled(name, callback))
+        self.pending[name] = (widget, job, callback)
+        return job
+
+    def run_scheduled(self, name, callback):
+        self.pending.pop(name, None)
+        callback()
+
+    def sleep(self, name):
+        """Tier-scaled sleep for background threads; returns early on wake-up"""
+        with self.wakeup:
+            self.wakeup.wait(self.interval(name) / 1000)
+
+    def on_input(self, event=None):
+        self.last_input = time.monotonic()
+        if self.screensaver:
+            self.set_screensaver(False)
+        elif self.tier != 'active':
+            self.wake()
+
+    def on_focus_change(self, event=None):
+        try:
+            self.focused = self.root.focus_displayof() is not None
+        except (KeyError, tk.TclError):
+            self.focused = True
+        if self.focused and self.tier == 'background':
+            self.wake()
+
+    def set_screensaver(self, active):
+        self.screensaver = active
+        if not active:
+            self.last_input = time.monotonic()
+            self.wake()
+
+    def wake(self):
+        """Snap every pending refresh back to the active cadence"""
+        if self.current_tier() == 'idle':
+            return
+        for name, (widget, job, callback) in list(self.pending.items()):
+            try:
+                widget.after_cancel(job)
+                if widget.winfo_exists():
+                    self.schedule(name, widget, callback)
+            except tk.TclError:
+                self.pending.pop(name, None)
+        with self.wakeup:
+            self.wakeup.notify_all()
+
+class GroupCommitWriter:
+    """Background SQLite writer that batches queued statements into one transaction"""
+    def __init__(self, db_path, batch_size=128, flush_interval=0.05):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.requests = queue.Queue()
+        self.acks = queue.Queue()
+        self.root = None
+        self.outstanding = 0
+        self.thread = threading.Thread(target=self.run, daemon=True, name='quantum-db-writer')
+        self.thread.start()
+
+    def attach(self, root):
+        """Deliver durable-ack callbacks on the Tk thread of this root"""
+        self.root = root
+
+    def submit(self, sql, params=(), on_durable=None, many=False, wait=False):
+        """Queue a write; on_durable(error) runs on the Tk thread once the batch has committed.
+
+        With wait=True the caller blocks until the commit and errors are raised in place.
+        """
+        done = {'event': threading.Event(), 'error': None} if wait else None
+        self.requests.put((sql, params, on_durable, many, done))
+        if on_durable is not None and self.root is not None:
+            self.outstanding += 1
+            if self.outstanding == 1:
+                self.root.after(25, self.deliver_acks)
+        if done is not None:
+            done['event'].wait()
+            if done['error'] is not None:
+                raise done['error']
+
+    def run(self):
+        connection = sqlite3.connect(self.db_path)
+        connection.execute('PRAGMA journal_mode=WAL')
+        # FULL fsyncs the WAL on every commit; batching pays that cost once per group
+        connection.execute('PRAGMA synchronous=FULL')
+        while True:
+            request = self.requests.get()
+            if request is None:
+                break
+            batch = [request]
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size and request[4] is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self.requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                batch.append(request)
+            errors = [None] * len(batch)
+            try:
+                with connection:
+                    connection.execute('BEGIN')
+                    for index, (sql, params, _, many, _) in enumerate(batch):
+                        # A savepoint per request, so a failing statement only undoes its own write
+                        connection.execute('SAVEPOINT request')
+                        try:
+                            if many:
+                                connection.executemany(sql, params)
+                            else:
+                                connection.execute(sql, params)
+                        except sqlite3.Error as e:
+                            connection.execute('ROLLBACK TO request')
+                            errors[index] = e
+                        connection.execute('RELEASE request')
+            except sqlite3.Error as e:
+                # The commit itself failed, so nothing in the batch was written
+                errors = [e] * len(batch)
+            for error, (_, _, on_durable, _, done) in zip(errors, batch):
+                if on_durable is not None:
+                    self.acks.put((on_durable, error))
+                if done is not None:
+                    done['error'] = error
+                    done['event'].set()
+            if stop:
+                break
+        connection.close()
+
+    def deliver_acks(self):
+        while True:
+            try:
+                on_durable, error = self.acks.get_nowait()
+            except queue.Empty:
+                break
+            self.outstanding -= 1
+            on_durable(error)
+        if self.outstanding > 0:
+            self.root.after(25, self.deliver_acks)
+
+    def close(self, timeout=2):
+        """Flush what is queued and stop the writer thread"""
+        self.requests.put(None)
+        self.thread.join(timeout)
+
+class QuantumDatabase:
+    """Per-thread read connections, one serialized writer and per-statement timing"""
+    def __init__(self, db_path, cached_statements=256):
+        self.db_path = db_path
+        self.cached_statements = cached_statements
+        self.local = threading.local()
+        self.connections = []
+        self.lock = threading.Lock()
+        self.stats = {}
+        # The writer creates the file and switches it to WAL before any reader opens it
+        self.writer = GroupCommitWriter(db_path)
+        self.writer.submit('PRAGMA user_version', wait=True)
+
+    def attach(self, root):
+        self.writer.attach(root)
+
+    def reader(self):
+        """This thread's read-only connection; sqlite3 caches its prepared statements"""
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, check_same_thread=False,
+                                         cached_statements=self.cached_statements)
+            connection.execute('PRAGMA query_only=ON')
+            self.local.connection = connection
+            with self.lock:
+                self.connections.append(connection)
+        return connection
+
+    def query(self, sql, params=()):
+        """Run a read on this thread's connection and return all rows"""
+        started = time.perf_counter()
+        rows = self.reader().execute(sql, params).fetchall()
+        self.record(sql, time.perf_counter() - started)
+        return rows
+
+    def query_one(self, sql, params=()):
+        rows = self.query(sql, params)
+        return rows[0] if rows else None
+
+    def execute(self, sql, params=(), on_durable=None, wait=False):
+        """Queue a write on the serialized writer"""
+        started = time.perf_counter()
+        self.writer.submit(sql, params, on_durable=on_durable, wait=wait)
+        if wait:
+            self.record(sql, time.perf_counter() - started)
+
+    def executemany(self, sql, rows, on_durable=None, wait=False):
+        started = time.perf_counter()
+        self.writer.submit(sql, list(rows), on_durable=on_durable, many=True, wait=wait)
+        if wait:
+            self.record(sql, time.perf_counter() - started)
+
+    def record(self, sql, elapsed):
+        with self.lock:
+            entry = self.stats.get(sql)
+            if entry is None:
+                self.stats[sql] = [1, elapsed, elapsed]
+            else:
+                entry[0] += 1
+                entry[1] += elapsed
+                entry[2] = max(entry[2], elapsed)
+
+    def statement_stats(self):
+        """(sql, calls, total seconds, worst seconds), slowest total first"""
+        with self.lock:
+            rows = [(' '.join(sql.split()), count, total, worst)
+                    for sql, (count, total, worst) in self.stats.items()]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    def close(self):
+        self.writer.close()
+        with self.lock:
+            for connection in self.connections:
+                connection.close()
+            self.connections.clear()
+
 # Quantum Widgets
 class QuantumWidget:
     """Base quantum widget class"""
@@ -235,6 +694,13 @@ class QuantumMobileOS:
         # Animation system
         self.animation_running = False
         
+        # Refresh cadence follows user activity
+        self.activity = ActivityTracker(idle_after=60)
+        self.activity.attach(self.root)
+        self.activity.register('status', 1000, 10000)
+        self.activity.register('quantum_field', 50, 1000)
+        self.activity.register('widgets', 3000, 30000)
+        
         # File system
         self.current_directory = os.path.expanduser("~")  # Start from home directory
         
@@ -276,7 +742,10 @@ class QuantumMobileOS:
         
         # Quantum AI
         self.quantum_ai = QuantumAIProcessor()
-        
+
+        # Chart history (health, finance, usage)
+        self.time_series = TemporalSeriesStore()
+
         # System metrics
         self.system_metrics = {
             'quantum_coherence': 98.7,
@@ -287,11 +756,12 @@ class QuantumMobileOS:
 
     def setup_quantum_database(self):
         """Quantum-entangled database"""
-        self.quantum_db = sqlite3.connect(':memory:', check_same_thread=False)
-        self.q_cursor = self.quantum_db.cursor()
+        # Reads use a connection per thread; every write goes through one queued writer
+        self.db = QuantumDatabase('quantum_os.db')
+        self.db.attach(self.root)
         
         # Quantum apps table
-        self.q_cursor.execute('''
+        self.db.execute('''
             CREATE TABLE IF NOT EXISTS quantum_apps (
                 id INTEGER PRIMARY KEY,
                 name TEXT,
@@ -300,20 +770,20 @@ class QuantumMobileOS:
                 processing_tier INTEGER,
                 version TEXT
             )
-        ''')
+        ''', wait=True)
         
         # Contacts table
-        self.q_cursor.execute('''
+        self.db.execute('''
             CREATE TABLE IF NOT EXISTS contacts (
                 id INTEGER PRIMARY KEY,
                 name TEXT,
                 number TEXT,
                 email TEXT
             )
-        ''')
+        ''', wait=True)
         
         # Messages table
-        self.q_cursor.execute('''
+        self.db.execute('''
             CREATE TABLE IF NOT EXISTS messages (
                 id INTEGER PRIMARY KEY,
                 contact TEXT,
@@ -321,10 +791,13 @@ class QuantumMobileOS:
                 timestamp TEXT,
                 is_sent BOOLEAN
             )
-        ''')
+        ''', wait=True)
+        self.db.execute('''
+            CREATE INDEX IF NOT EXISTS idx_messages_contact_id ON messages (contact, id)
+        ''', wait=True)
         
         # Files table for tracking
-        self.q_cursor.execute('''
+        self.db.execute('''
             CREATE TABLE IF NOT EXISTS file_history (
                 id INTEGER PRIMARY KEY,
                 filename TEXT,
@@ -333,12 +806,13 @@ class QuantumMobileOS:
                 size INTEGER,
                 last_accessed TEXT
             )
-        ''')
+        ''', wait=True)
         
-        self.initialize_quantum_data()
+        if self.db.query_one('SELECT COUNT(*) FROM quantum_apps')[0] == 0:
+            self.initialize_quantum_data()
 
     def initialize_quantum_data(self):
-        """Initialize quantum system data"""
+        """Seed quantum system data into an empty database"""
         quantum_apps = [
             ('Quantum Phone', 'QCOM001', 0.95, 3, '4.2'),
             ('Neural Messenger', 'NMSG002', 0.92, 2, '3.8'),
@@ -358,11 +832,10 @@ class QuantumMobileOS:
             ('Tic Tac Toe', 'GAME015', 0.88, 1, '2.1')
         ]
         
-        for app in quantum_apps:
-            self.q_cursor.execute('''
-                INSERT INTO quantum_apps (name, quantum_signature, neural_compatibility, processing_tier, version)
-                VALUES (?, ?, ?, ?, ?)
-            ''', app)
+        self.db.executemany('''
+            INSERT INTO quantum_apps (name, quantum_signature, neural_compatibility, processing_tier, version)
+            VALUES (?, ?, ?, ?, ?)
+        ''', quantum_apps)
         
         # Sample contacts
         contacts = [
@@ -372,11 +845,10 @@ class QuantumMobileOS:
             ('Lisa AI', '+1-555-0104', 'lisa@ai.com')
         ]
         
-        for contact in contacts:
-            self.q_cursor.execute('''
-                INSERT INTO contacts (name, number, email)
-                VALUES (?, ?, ?)
-            ''', contact)
+        self.db.executemany('''
+            INSERT INTO contacts (name, number, email)
+            VALUES (?, ?, ?)
+        ''', contacts)
         
         # Sample messages
         messages = [
@@ -385,13 +857,10 @@ class QuantumMobileOS:
             ('Mike Photon', 'Quantum data received', 'Yesterday', False)
         ]
         
-        for msg in messages:
-            self.q_cursor.execute('''
-                INSERT INTO messages (contact, message, timestamp, is_sent)
-                VALUES (?, ?, ?, ?)
-            ''', msg)
-        
-        self.quantum_db.commit()
+        self.db.executemany('''
+            INSERT INTO messages (contact, message, timestamp, is_sent)
+            VALUES (?, ?, ?, ?)
+        ''', messages, wait=True)
 
     def setup_neural_interface(self):
         """Advanced neural interface"""
@@ -556,7 +1025,7 @@ class QuantumMobileOS:
                                           font=('Arial', 9),
                                           fill='#00ffff', tags="quantum")
             
-            self.root.after(50, self.animate_quantum_field)
+            self.activity.schedule('quantum_field', self.root, self.animate_quantum_field)
 
     def setup_neural_widgets(self):
         """Neural network powered widgets"""
@@ -602,8 +1071,7 @@ class QuantumMobileOS:
 
     def get_quantum_apps(self):
         """Get installed quantum apps"""
-        self.q_cursor.execute('SELECT name, quantum_signature, neural_compatibility FROM quantum_apps')
-        return self.q_cursor.fetchall()
+        return self.db.query('SELECT name, quantum_signature, neural_compatibility FROM quantum_apps')
 
     def setup_neural_navigation(self):
         """Neural navigation system"""
@@ -880,8 +1348,7 @@ class QuantumMobileOS:
         self.animation_running = True
         
         # Get app name
-        self.q_cursor.execute('SELECT name FROM quantum_apps WHERE quantum_signature = ?', (signature,))
-        result = self.q_cursor.fetchone()
+        result = self.db.query_one('SELECT name FROM quantum_apps WHERE quantum_signature = ?', (signature,))
         app_name = result[0] if result else "Quantum App"
         
         # Create overlay for animation
@@ -1001,7 +1468,7 @@ class QuantumMobileOS:
         self.throughput_label.config(text=f"NT: {self.system_metrics['neural_throughput']}")
         self.stability_label.config(text=f"TS: {self.system_metrics['temporal_stability']:.1f}%")
         
-        self.root.after(1000, self.update_quantum_status)
+        self.activity.schedule('status', self.root, self.update_quantum_status)
 
     def start_quantum_services(self):
         """Start quantum background services"""
@@ -1033,7 +1500,7 @@ class QuantumMobileOS:
                         widget.quantum_update()
                     except:
                         pass
-            time.sleep(3)
+            self.activity.sleep('widgets')
 
     def change_theme(self):
         """تغییر تم سیستم"""
@@ -1067,8 +1534,8 @@ class QuantumMobileOS:
         try:
             self.root.mainloop()
         finally:
-            if hasattr(self, 'quantum_db'):
-                self.quantum_db.close()
+            if hasattr(self, 'db'):
+                self.db.close()
 
 # برنامه‌های کاربردی اصلی (همان قبلی)
 class QuantumPhone:
@@ -1159,8 +1626,7 @@ class QuantumPhone:
         contacts_window.configure(bg='#0a0a0a')
         
         # Get contacts from database
-        self.os.q_cursor.execute('SELECT name, number FROM contacts')
-        contacts = self.os.q_cursor.fetchall()
+        contacts = self.os.db.query('SELECT name, number FROM contacts')
         
         for name, number in contacts:
             contact_frame = tk.Frame(contacts_window, bg='#1a1a1a', height=50)
@@ -1186,6 +1652,8 @@ class QuantumPhone:
 
 class NeuralMessenger:
     """Fully functional messaging app"""
+    PAGE_SIZE = 50
+
     def __init__(self, os):
         self.os = os
         self.window = None
@@ -1208,15 +1676,34 @@ class NeuralMessenger:
         contacts_frame.pack(fill='both', expand=True)
         
         # Get contacts from database
-        self.os.q_cursor.execute('SELECT name FROM contacts')
-        contacts = self.os.q_cursor.fetchall()
+        contacts = self.os.db.query('SELECT name FROM contacts')
         
         for (name,) in contacts:
             contact_btn = tk.Button(contacts_frame, text=name, font=('Arial', 12),
                                   bg='#1a1a1a', fg='white', height=2,
                                   command=lambda n=name: self.open_chat(n))
             contact_btn.pack(fill='x', padx=10, pady=2)
-    
+
+    def fetch_message_page(self, contact, before_id=None):
+        """Return up to PAGE_SIZE messages older than before_id, oldest first"""
+        if before_id is None:
+            rows = self.os.db.query('''
+                SELECT id, message, timestamp, is_sent FROM messages
+                WHERE contact = ? ORDER BY id DESC LIMIT ?
+            ''', (contact, self.PAGE_SIZE))
+        else:
+            rows = self.os.db.query('''
+                SELECT id, message, timestamp, is_sent FROM messages
+                WHERE contact = ? AND id < ? ORDER BY id DESC LIMIT ?
+            ''', (contact, before_id, self.PAGE_SIZE))
+        rows.reverse()
+        return rows
+
+    def format_messages(self, contact, rows):
+        """Render message rows as chat text"""
+        return ''.join(f"[{timestamp}] {'You' if is_sent else contact}: {message}\n\n"
+                       for _, message, timestamp, is_sent in rows)
+
     def open_chat(self, contact):
         """Open chat with contact"""
         chat_window = tk.Toplevel(self.window)
@@ -1235,19 +1722,39 @@ class NeuralMessenger:
                                                bg='#0a0a0a', fg='white',
                                                font=('Arial', 10), wrap=tk.WORD)
         chat_display.pack(fill='both', expand=True, padx=10, pady=10)
-        chat_display.config(state=tk.DISABLED)
-        
-        # Load existing messages
-        self.os.q_cursor.execute('SELECT message, timestamp, is_sent FROM messages WHERE contact = ?', (contact,))
-        messages = self.os.q_cursor.fetchall()
-        
-        # Display messages
-        chat_display.config(state=tk.NORMAL)
-        for message, timestamp, is_sent in messages:
-            sender = "You" if is_sent else contact
-            chat_display.insert(tk.END, f"[{timestamp}] {sender}: {message}\n\n")
+
+        # Newest page first; older pages are fetched when scrolled to the top
+        rows = self.fetch_message_page(contact)
+        history = {'oldest_id': rows[0][0] if rows else None,
+                   'more': len(rows) == self.PAGE_SIZE, 'loading': False}
+        chat_display.insert(tk.END, self.format_messages(contact, rows))
         chat_display.config(state=tk.DISABLED)
         chat_display.see(tk.END)
+
+        def load_older_page():
+            if not chat_display.winfo_exists():
+                return
+            rows = self.fetch_message_page(contact, history['oldest_id'])
+            history['more'] = len(rows) == self.PAGE_SIZE
+            if rows:
+                history['oldest_id'] = rows[0][0]
+                chat_display.config(state=tk.NORMAL)
+                chat_display.mark_set('page_top', '1.0')
+                chat_display.mark_gravity('page_top', tk.RIGHT)
+                chat_display.insert('1.0', self.format_messages(contact, rows))
+                chat_display.config(state=tk.DISABLED)
+                chat_display.yview('page_top')
+            history['loading'] = False
+
+        scroll_set = chat_display.vbar.set
+
+        def on_scroll(first, last):
+            scroll_set(first, last)
+            if float(first) <= 0.0 and history['more'] and not history['loading']:
+                history['loading'] = True
+                chat_display.after_idle(load_older_page)
+
+        chat_display.config(yscrollcommand=on_scroll)
         
         # Message input
         input_frame = tk.Frame(chat_window, bg='#0a0a0a')
@@ -1267,12 +1774,13 @@ class NeuralMessenger:
                 chat_display.see(tk.END)
                 message_entry.delete(0, tk.END)
                 
-                # Save message to database
-                self.os.q_cursor.execute('''
+                # Save message to database without waiting for the commit
+                self.os.db.execute('''
                     INSERT INTO messages (contact, message, timestamp, is_sent)
                     VALUES (?, ?, ?, ?)
-                ''', (contact, message, current_time, True))
-                self.os.quantum_db.commit()
+                ''', (contact, message, current_time, True),
+                    on_durable=lambda error: error and messagebox.showerror(
+                        "Neural Messenger", f"Message was not saved: {error}"))
                 
                 # Auto-reply
                 chat_display.config(state=tk.NORMAL)
@@ -2410,6 +2918,7 @@ class NeuralHealth:
     def __init__(self, os):
         self.os = os
         self.window = None
+        self.health_chart = None
         
     def show(self):
         self.window = tk.Toplevel(self.os.root)
@@ -2444,41 +2953,36 @@ class NeuralHealth:
         # نمودار سلامت
         self.health_canvas = tk.Canvas(self.window, width=360, height=150, bg='#1a1a1a', highlightthickness=0)
         self.health_canvas.pack(pady=20)
-        self.draw_health_chart()
         
         # به روز رسانی خودکار
         self.update_health_data()
     
+    def sample_health_data(self):
+        """Append one health sample to the shared history"""
+        series = self.os.time_series.get_series('health.score')
+        if len(series) == 0:
+            # First run: seed a week of readings so the chart isn't empty
+            for _ in range(7):
+                series.append(random.randint(60, 100))
+        else:
+            series.append(random.randint(60, 100))
+
     def draw_health_chart(self):
         """رسم نمودار سلامت"""
-        self.health_canvas.delete("all")
-        
-        # محورها
-        self.health_canvas.create_line(30, 130, 330, 130, fill='#555555')  # محور X
-        self.health_canvas.create_line(30, 130, 30, 30, fill='#555555')    # محور Y
-        
-        # داده‌های نمونه
-        data = [random.randint(60, 100) for _ in range(7)]
-        
-        # رسم خط نمودار
-        points = []
-        for i, value in enumerate(data):
-            x = 30 + i * 50
-            y = 130 - value
-            points.extend([x, y])
-        
-        if len(points) > 2:
-            self.health_canvas.create_line(points, fill='#00ff88', width=2, smooth=True)
-        
-        # نقاط داده
-        for i, value in enumerate(data):
-            x = 30 + i * 50
-            y = 130 - value
-            self.health_canvas.create_oval(x-3, y-3, x+3, y+3, fill='#ff44ff', outline='')
+        if self.health_chart is None:
+            # محورها یک بار رسم می‌شوند
+            self.health_chart = IncrementalLineChart(
+                self.health_canvas, 30, 30, 330, 130,
+                line_color='#00ff88', marker_color='#ff44ff', max_markers=7,
+                y_range=(0, 100), smooth=True)
+        
+        # آخرین داده‌ها از تاریخچه
+        self.health_chart.update(self.os.time_series.window('health.score', 7))
     
     def update_health_data(self):
         """به روز رسانی داده‌های سلامت"""
         if self.window.winfo_exists():
+            self.sample_health_data()
             self.draw_health_chart()
             self.window.after(5000, self.update_health_data)
 
@@ -2487,6 +2991,8 @@ class QuantumFinance:
     def __init__(self, os):
         self.os = os
         self.window = None
+        self.price_chart = None
+        self.chart_window = 2400
         
     def show(self):
         self.window = tk.Toplevel(self.os.root)
@@ -2536,47 +3042,36 @@ class QuantumFinance:
         # نمودار قیمت
         self.chart_canvas = tk.Canvas(self.window, width=460, height=150, bg='#1a1a1a', highlightthickness=0)
         self.chart_canvas.pack(pady=10)
-        self.draw_price_chart()
         
         # به روز رسانی خودکار
         self.update_finance_data()
     
+    def sample_price(self):
+        """Advance the simulated price by one random-walk step"""
+        series = self.os.time_series.get_series('finance.price', self.chart_window)
+        if len(series) == 0:
+            series.append(100)
+            for i in range(19):
+                series.append(max(50, series.last() + random.uniform(-5, 5)))
+        else:
+            series.append(max(50, series.last() + random.uniform(-5, 5)))
+
     def draw_price_chart(self):
         """رسم نمودار قیمت"""
-        self.chart_canvas.delete("all")
-        
-        # تولید داده‌های قیمت تصادفی
-        prices = [100]
-        for i in range(19):
-            change = random.uniform(-5, 5)
-            prices.append(max(50, prices[-1] + change))
-        
-        # مقیاس‌گذاری
-        max_price = max(prices)
-        min_price = min(prices)
-        range_price = max_price - min_price
-        
-        if range_price == 0:
-            range_price = 1
-            
-        points = []
-        for i, price in enumerate(prices):
-            x = 30 + i * 22
-            y = 130 - ((price - min_price) / range_price) * 100
-            points.extend([x, y])
-        
-        # رسم خط نمودار
-        if len(points) > 2:
-            self.chart_canvas.create_line(points, fill='#00ff88', width=2)
-        
-        # محورها
-        self.chart_canvas.create_line(30, 130, 470, 130, fill='#555555')
-        self.chart_canvas.create_line(30, 130, 30, 30, fill='#555555')
+        if self.price_chart is None:
+            # محورها ثابت می‌مانند؛ فقط خط قیمت به روز می‌شود
+            self.price_chart = IncrementalLineChart(
+                self.chart_canvas, 30, 30, 448, 130,
+                line_color='#00ff88', axis_right=470)
+        
+        # آخرین قیمت‌ها از تاریخچه
+        self.price_chart.update(self.os.time_series.window('finance.price', self.chart_window))
     
     def update_finance_data(self):
         """به روز رسانی داده‌های مالی"""
         # شبیه‌سازی تغییرات بازار
         if self.window.winfo_exists():
+            self.sample_price()
             self.draw_price_chart()
             self.window.after(3000, self.update_finance_data)
 
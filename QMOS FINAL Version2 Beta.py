@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog, simpledialog
+import tkinter.font as tkfont
 import sqlite3
 import threading
 import time
@@ -7,9 +8,34 @@ from datetime import datetime, timedelta
 import random
 import math
 import json
+import hashlib
 import os
 import shutil
 import sys
+import queue
+from collections import namedtuple, deque, OrderedDict
+from types import MappingProxyType
+import logging
+import traceback
+from logging.handlers import RotatingFileHandler
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+import multiprocessing
+import mmap
+import codecs
+import base64
+import zipfile
+import tarfile
+import tempfile
+import zlib
+from contextlib import contextmanager
+try:
+    from PIL import Image, ImageTk
+except ImportError:
+    Image = ImageTk = None
+try:
+    import lzma
+except ImportError:
+    lzma = None
 class AdvancedQuantumAI:
     def __init__(self):
         self.neural_network = {}
@@ -63,8 +89,56 @@ class HolographicInterface:
             }
             patterns.append(pattern)
         return patterns
+def scale_color(color, alpha):
+    r = int(int(color[1:3], 16) * alpha)
+    g = int(int(color[3:5], 16) * alpha)
+    b = int(int(color[5:7], 16) * alpha)
+    return f'#{r:02x}{g:02x}{b:02x}'
+def mix_colors(color1, color2, ratio):
+    r1, g1, b1 = int(color1[1:3], 16), int(color1[3:5], 16), int(color1[5:7], 16)
+    r2, g2, b2 = int(color2[1:3], 16), int(color2[3:5], 16), int(color2[5:7], 16)
+    r = int(r1 + (r2 - r1) * ratio)
+    g = int(g1 + (g2 - g1) * ratio)
+    b = int(b1 + (b2 - b1) * ratio)
+    return f'#{r:02x}{g:02x}{b:02x}'
+def lighten_color(color, amount=20):
+    r = min(255, int(color[1:3], 16) + amount)
+    g = min(255, int(color[3:5], 16) + amount)
+    b = min(255, int(color[5:7], 16) + amount)
+    return f'#{r:02x}{g:02x}{b:02x}'
+class SystemConfiguration:
+    def __init__(self, config_file='quantum_os_config.json'):
+        self.config_file = config_file
+        self.default_config = {
+            'theme': 'quantum',
+            'app_database': None,
+            'search_index': 'quantum_search.db',
+            'search_roots': None
+        }
+        self.load_config()
+    def load_config(self):
+        try:
+            if os.path.exists(self.config_file):
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    self.config = {**self.default_config, **json.load(f)}
+            else:
+                self.config = self.default_config.copy()
+        except Exception as e:
+            print(f"Config load error: {e}")
+            self.config = self.default_config.copy()
+    def save_config(self):
+        try:
+            with open(self.config_file, 'w', encoding='utf-8') as f:
+                json.dump(self.config, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"Config save error: {e}")
 class AdvancedThemeManager:
-    def __init__(self):
+    # Derived colours are computed once per palette and cached on disk by palette hash
+    PALETTE_FILE = 'quantum_palettes.json'
+    ALPHA_STEPS = 32
+    GRADIENT_STEPS = 64
+    ANIMATION_COLORS = ('#00ffff', '#ff00ff', '#ffff00', '#00ff88', '#ff4444')
+    def __init__(self, system_config=None):
         self.themes = {
             'quantum': {
                 'bg': '#0a0a0a', 'fg': '#00ffff', 'accent': '#ff44ff',
@@ -102,8 +176,223 @@ class AdvancedThemeManager:
                 'quantum_glow': '#ff4400', 'hologram': '#ffcc00'
             }
         }
-        self.current_theme = 'quantum'
+        self.system_config = system_config
+        saved_theme = system_config.config.get('theme') if system_config else None
+        self.current_theme = saved_theme if saved_theme in self.themes else 'quantum'
         self.theme_list = list(self.themes.keys())
+        self.derived = self.load_derived()
+        self.windows = {}
+        self.widget_windows = {}
+        self.pending = []
+        self.walk = []
+        self.stale = set()
+        self.job = None
+        self.generation = 0
+    # Widget option -> palette entry for each semantic role
+    ROLE_OPTIONS = {
+        'surface': {'bg': 'bg'},
+        'header': {'bg': 'header_bg', 'fg': 'fg'},
+        'body': {'bg': 'bg', 'fg': 'text'},
+        'button': {'bg': 'button_bg', 'fg': 'text'},
+        'accent': {'bg': 'button_bg', 'fg': 'accent'},
+        'danger': {'bg': 'button_bg', 'fg': 'error'},
+        'input': {'bg': 'widget_bg', 'fg': 'text', 'insertbackground': 'text'},
+        'control': {'bg': 'button_bg'}
+    }
+    CLASS_ROLES = {
+        'Tk': 'surface', 'Toplevel': 'surface', 'Frame': 'surface', 'Labelframe': 'surface',
+        'Canvas': 'surface', 'Label': 'body', 'Scale': 'body', 'Button': 'button',
+        'Entry': 'input', 'Text': 'input', 'Listbox': 'input', 'Scrollbar': 'control',
+        'Header': 'header'
+    }
+    OPTION_NAMES = {'bg': 'background', 'fg': 'foreground', 'insertbackground': 'insertBackground'}
+    def publish(self, root, theme=None):
+        # Widgets read the option database when they are created, so new windows come
+        # up themed; only widgets that override these defaults need configure calls
+        theme = theme or self.get_theme()
+        root.option_clear()
+        for widget_class, role in self.CLASS_ROLES.items():
+            for option, key in self.ROLE_OPTIONS[role].items():
+                root.option_add(f'*{widget_class}.{self.OPTION_NAMES[option]}', theme[key])
+        for widget_class in ('Frame', 'Label'):
+            for option, key in self.ROLE_OPTIONS['header'].items():
+                root.option_add(f'*Header*{widget_class}.{self.OPTION_NAMES[option]}', theme[key])
+        root.option_add('*Button.activeBackground', self.hover('button_bg'))
+        root.option_add('*Button.activeForeground', theme['text'])
+    def theme_hash(self, name):
+        key = json.dumps([self.themes[name], self.ANIMATION_COLORS, self.ALPHA_STEPS, self.GRADIENT_STEPS], sort_keys=True)
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+    def derive(self, theme):
+        colors = sorted(set(theme.values()) | set(self.ANIMATION_COLORS))
+        return {
+            'fade': {color: [scale_color(color, i / self.ALPHA_STEPS) for i in range(self.ALPHA_STEPS + 1)]
+                     for color in colors},
+            'progress': [mix_colors(theme['fg'], theme['secondary'], i / (self.GRADIENT_STEPS - 1))
+                         for i in range(self.GRADIENT_STEPS)],
+            'hover': {key: lighten_color(theme[key]) for key in ('button_bg', 'widget_bg', 'header_bg')}
+        }
+    def load_derived(self):
+        try:
+            with open(self.PALETTE_FILE, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = {}
+        derived = {}
+        fresh = {}
+        for name, theme in self.themes.items():
+            key = self.theme_hash(name)
+            fresh[key] = cached[key] if key in cached else self.derive(theme)
+            derived[name] = fresh[key]
+        if fresh.keys() != cached.keys():
+            try:
+                with open(self.PALETTE_FILE + '.tmp', 'w', encoding='utf-8') as f:
+                    json.dump(fresh, f, separators=(',', ':'))
+                os.replace(self.PALETTE_FILE + '.tmp', self.PALETTE_FILE)
+            except OSError as e:
+                print(f"Palette cache save error: {e}")
+        return derived
+    def fade(self, color, alpha):
+        ramp = self.derived[self.current_theme]['fade'].get(color)
+        if ramp is None:
+            return scale_color(color, alpha)
+        return ramp[max(0, min(self.ALPHA_STEPS, round(alpha * self.ALPHA_STEPS)))]
+    def gradient(self, ratio):
+        stops = self.derived[self.current_theme]['progress']
+        return stops[max(0, min(len(stops) - 1, int(ratio * (len(stops) - 1))))]
+    def hover(self, key):
+        return self.derived[self.current_theme]['hover'][key]
+    def track(self, widget):
+        # Registration is deferred until the next theme switch, so opening a window costs nothing
+        self.pending.append(widget)
+    def register(self, widget, role):
+        # Widgets are grouped by their toplevel so a theme switch can work window by window
+        window = self.widget_windows.get(widget) or widget.winfo_toplevel()
+        if window not in self.windows:
+            self.windows[window] = {}
+            self.watch(window)
+        supported = widget.keys()
+        self.windows[window][widget] = (role, tuple(option for option in self.ROLE_OPTIONS[role] if option in supported))
+        self.widget_windows[widget] = window
+        return widget
+    def role_of(self, widget):
+        entry = self.windows.get(self.widget_windows.get(widget), {}).get(widget)
+        return entry[0] if entry else None
+    def register_tree(self, widget, role=None):
+        # One pass when a window is built
+        walk = [(widget, role)]
+        while walk:
+            self.register_node(walk)
+    def register_node(self, walk):
+        # One step of a tree walk: explicit tags win, untagged widgets get their class
+        # role, and everything below a header stays part of the header
+        current, inherited = walk.pop()
+        try:
+            role = self.role_of(current)
+            if role is None:
+                role = self.CLASS_ROLES.get(current.winfo_class())
+                if inherited == 'header' and role in ('surface', 'body'):
+                    role = 'header'
+                if role is not None:
+                    self.register(current, role)
+            walk.extend((child, role) for child in current.winfo_children())
+        except tk.TclError:
+            pass
+    def watch(self, window):
+        window.bind('<Map>', lambda e, w=window: e.widget is w and self.refresh_stale(w), add='+')
+        if isinstance(window, tk.Toplevel):
+            window.bind('<Destroy>', lambda e, w=window: e.widget is w and self.forget_window(w), add='+')
+    def forget_window(self, window):
+        for widget in self.windows.pop(window, {}):
+            self.widget_windows.pop(widget, None)
+        self.stale.discard(window)
+    def plan_units(self, focused):
+        units = []
+        for window in list(self.windows):
+            try:
+                visible = window.winfo_viewable()
+            except tk.TclError:
+                self.forget_window(window)
+                continue
+            if not visible:
+                self.stale.add(window)
+            elif window is focused:
+                units.insert(0, window)
+            else:
+                units.append(window)
+        self.stale.difference_update(units)
+        return units
+    def apply_roles(self, root, theme=None, on_progress=None, budget=8):
+        # Re-theme in after_idle slices of at most `budget` ms: windows opened since the last
+        # switch are registered first, then the focused window is re-themed, other visible
+        # windows next, hidden ones when they are next mapped
+        theme = theme or self.get_theme()
+        self.generation += 1
+        generation = self.generation
+        if self.job is not None:
+            root.after_cancel(self.job)
+            self.job = None
+        started = time.perf_counter()
+        # The walk outlives a superseded pass, so the next one picks up where it stopped
+        self.walk.extend((widget, None) for widget in self.pending)
+        self.pending = []
+        try:
+            focus = root.focus_get()
+            focused = focus.winfo_toplevel() if focus is not None else None
+        except (KeyError, tk.TclError):
+            focused = None
+        units = []
+        settings = {}
+        state = {'done': 0, 'items': None, 'total': None}
+        def run_slice():
+            self.job = None
+            if generation != self.generation:
+                return
+            deadline = time.perf_counter() + budget / 1000
+            while self.walk and time.perf_counter() < deadline:
+                self.register_node(self.walk)
+            if self.walk:
+                self.job = root.after_idle(run_slice)
+                return
+            if state['total'] is None:
+                units.extend(self.plan_units(focused))
+                state['total'] = len(units)
+                if not units and on_progress is not None:
+                    on_progress(0, 0, time.perf_counter() - started)
+            while units:
+                if state['items'] is None:
+                    state['items'] = list(self.windows.get(units[0], {}).items())
+                items = state['items']
+                while items and time.perf_counter() < deadline:
+                    widget, entry = items.pop()
+                    self.configure_widget(units[0], widget, entry, theme, settings)
+                if items:
+                    break
+                units.pop(0)
+                state['items'] = None
+                state['done'] += 1
+                if on_progress is not None:
+                    on_progress(state['done'], state['total'], time.perf_counter() - started)
+            if units:
+                self.job = root.after_idle(run_slice)
+        self.job = root.after_idle(run_slice)
+    def configure_widget(self, window, widget, entry, theme, settings):
+        role, options = entry
+        if entry not in settings:
+            palette = self.ROLE_OPTIONS[role]
+            settings[entry] = {option: theme[palette[option]] for option in options}
+        try:
+            widget.configure(**settings[entry])
+        except tk.TclError:
+            self.windows.get(window, {}).pop(widget, None)
+            self.widget_windows.pop(widget, None)
+    def refresh_stale(self, window):
+        if window not in self.stale:
+            return
+        self.stale.discard(window)
+        theme = self.get_theme()
+        settings = {}
+        for widget, entry in list(self.windows.get(window, {}).items()):
+            self.configure_widget(window, widget, entry, theme, settings)
     def get_theme(self):
         return self.themes[self.current_theme]
     def change_theme(self, theme_name=None):
@@ -113,7 +402,1316 @@ class AdvancedThemeManager:
             current_index = self.theme_list.index(self.current_theme)
             next_index = (current_index + 1) % len(self.theme_list)
             self.current_theme = self.theme_list[next_index]
+        if self.system_config is not None:
+            self.system_config.config['theme'] = self.current_theme
+            self.system_config.save_config()
         return self.get_theme()
+def evaluate_expression(expression):
+    return str(eval(expression))
+class TaskCancelled(Exception):
+    pass
+class CancellationToken:
+    def __init__(self):
+        self.event = threading.Event()
+        self.future = None
+        self.in_process = False
+    @property
+    def cancelled(self):
+        return self.event.is_set()
+    def cancel(self):
+        self.event.set()
+        if self.future is not None:
+            self.future.cancel()
+    def check(self):
+        if self.event.is_set():
+            raise TaskCancelled()
+def run_in_process(conn, func, args):
+    # Body of a CPU task's own process; the outcome goes back over the pipe
+    try:
+        outcome = (True, func(*args))
+    except BaseException as e:
+        outcome = (False, e)
+    try:
+        conn.send(outcome)
+    except Exception as e:
+        conn.send((False, RuntimeError(f"Unpicklable task outcome: {e!r}")))
+    conn.close()
+class QuantumTaskPool:
+    # Threads for I/O, processes for CPU; callbacks always run on the Tk thread.
+    # Each CPU task gets its own process, at most cpu_workers at a time, so cancelling
+    # one can terminate it without touching tasks that belong to other windows
+    def __init__(self, root, io_workers=4, cpu_workers=2):
+        self.root = root
+        self.io_workers = io_workers
+        self.cpu_workers = cpu_workers
+        self.io_pool = None
+        self.cpu_queue = deque()
+        self.cpu_running = set()
+        self.cpu_lock = threading.Lock()
+        # Never fork this multi-threaded Tk process; a forkserver forks from a clean
+        # single-threaded server instead, and spawn covers platforms without one
+        methods = multiprocessing.get_all_start_methods()
+        self.cpu_context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        self.events = queue.Queue()
+        self.active = set()
+        self.owners = {}
+        self.polling = False
+    def submit_io(self, func, *args, owner=None, on_done=None, on_error=None, on_progress=None):
+        # func(token, progress, *args) runs on a worker thread
+        if self.io_pool is None:
+            self.io_pool = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix='quantum-io')
+        token = CancellationToken()
+        def progress(value):
+            if on_progress is not None and not token.cancelled:
+                self.events.put(('progress', token, on_progress, value))
+        def run():
+            token.check()
+            return func(token, progress, *args)
+        token.future = self.io_pool.submit(run)
+        self.track(token, owner, on_done, on_error)
+        return token
+    def submit_cpu(self, func, *args, owner=None, on_done=None, on_error=None):
+        # func(*args) runs in a worker process, so it and its arguments must be picklable
+        token = CancellationToken()
+        token.in_process = True
+        token.process = None
+        token.call = (func, args)
+        token.future = Future()
+        self.track(token, owner, on_done, on_error)
+        with self.cpu_lock:
+            self.cpu_queue.append(token)
+        self.start_cpu_tasks()
+        return token
+    def start_cpu_tasks(self):
+        # Called from the Tk thread on submit and from a waiter thread when a task ends
+        with self.cpu_lock:
+            while self.cpu_queue and len(self.cpu_running) < self.cpu_workers:
+                token = self.cpu_queue.popleft()
+                if not token.future.set_running_or_notify_cancel():
+                    continue
+                receiver, sender = self.cpu_context.Pipe(duplex=False)
+                func, args = token.call
+                token.process = self.cpu_context.Process(target=run_in_process, args=(sender, func, args),
+                                                         daemon=True, name='quantum-cpu')
+                try:
+                    token.process.start()
+                except Exception as e:
+                    receiver.close()
+                    token.future.set_exception(e)
+                    continue
+                finally:
+                    sender.close()
+                if token.cancelled:
+                    token.process.terminate()
+                self.cpu_running.add(token)
+                threading.Thread(target=self.wait_cpu, args=(token, receiver), daemon=True,
+                                 name='quantum-cpu-wait').start()
+    def wait_cpu(self, token, receiver):
+        try:
+            ok, value = receiver.recv()
+        except (EOFError, OSError):
+            # The process was terminated by cancel() or died before reporting
+            ok, value = False, TaskCancelled() if token.cancelled else RuntimeError("CPU worker process exited")
+        finally:
+            receiver.close()
+            token.process.join()
+        with self.cpu_lock:
+            self.cpu_running.discard(token)
+        if ok:
+            token.future.set_result(value)
+        else:
+            token.future.set_exception(value)
+        self.start_cpu_tasks()
+    def track(self, token, owner, on_done, on_error):
+        self.active.add(token)
+        if owner is not None:
+            if owner not in self.owners:
+                self.owners[owner] = set()
+                owner.bind('<Destroy>', lambda e, o=owner: e.widget is o and self.cancel_owner(o), add='+')
+            self.owners[owner].add(token)
+        token.future.add_done_callback(lambda f: self.events.put(('done', token, on_done, on_error, f)))
+        if not self.polling:
+            self.polling = True
+            self.root.after(15, self.poll)
+    def poll(self):
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] == 'progress':
+                _, token, on_progress, value = event
+                if not token.cancelled:
+                    on_progress(value)
+            else:
+                self.finish(*event[1:])
+        if self.active:
+            self.root.after(15, self.poll)
+        else:
+            self.polling = False
+    def finish(self, token, on_done, on_error, future):
+        self.active.discard(token)
+        for tokens in self.owners.values():
+            tokens.discard(token)
+        if token.cancelled or future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            if on_done is not None:
+                on_done(future.result())
+        elif isinstance(error, TaskCancelled):
+            return
+        elif on_error is not None:
+            on_error(error)
+        else:
+            messagebox.showerror("Quantum Task", f"Background task failed: {error}")
+    def cancel(self, token):
+        token.cancel()
+        if token.in_process and token.process is not None and token.process.is_alive():
+            token.process.terminate()
+    def cancel_owner(self, owner):
+        for token in list(self.owners.pop(owner, ())):
+            self.cancel(token)
+    def shutdown(self):
+        for token in list(self.active):
+            token.cancel()
+        if self.io_pool is not None:
+            self.io_pool.shutdown(wait=False, cancel_futures=True)
+        with self.cpu_lock:
+            self.cpu_queue.clear()
+            running = list(self.cpu_running)
+        for token in running:
+            self.cancel(token)
+class MainLoopWatchdog:
+    # The Tk thread re-arms a heartbeat with after(); a monitor thread samples the
+    # main thread's stack while a beat is overdue and logs it once the beat lands
+    def __init__(self, root, interval=100, threshold=250, log_path='quantum_stalls.log', app_name=None):
+        self.root = root
+        self.interval = interval
+        self.threshold = threshold / 1000
+        self.app_name = app_name or (lambda: 'Home')
+        self.main_ident = threading.main_thread().ident
+        self.expected = None
+        self.captured = None
+        self.lock = threading.Lock()
+        self.running = False
+        self.logger = logging.getLogger('quantum.watchdog')
+        if not self.logger.handlers:
+            handler = RotatingFileHandler(log_path, maxBytes=512 * 1024, backupCount=3, encoding='utf-8')
+            handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+            self.logger.addHandler(handler)
+            self.logger.setLevel(logging.WARNING)
+            self.logger.propagate = False
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.arm()
+        threading.Thread(target=self.monitor, daemon=True, name='quantum-watchdog').start()
+    def stop(self):
+        self.running = False
+    def arm(self):
+        with self.lock:
+            self.expected = time.monotonic() + self.interval / 1000
+        self.root.after(self.interval, self.beat)
+    def beat(self):
+        lateness = time.monotonic() - self.expected
+        with self.lock:
+            stack, self.captured = self.captured, None
+        if lateness >= self.threshold:
+            self.logger.warning("Main loop stalled %.0f ms in %s\n%s", lateness * 1000,
+                                self.app_name(), stack or '  (stack not captured)\n')
+        if self.running:
+            self.arm()
+    def monitor(self):
+        while self.running:
+            time.sleep(self.threshold / 2)
+            with self.lock:
+                overdue = self.expected is not None and time.monotonic() - self.expected >= self.threshold
+                if not overdue or self.captured is not None:
+                    continue
+            frame = sys._current_frames().get(self.main_ident)
+            if frame is None:
+                continue
+            stack = ''.join(traceback.format_stack(frame))
+            with self.lock:
+                if self.captured is None:
+                    self.captured = stack
+DirRecord = namedtuple('DirRecord', 'name is_dir size mtime')
+def scan_directory(path):
+    # Directories are recognised from the DirEntry type bits; files cost one stat
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    yield DirRecord(entry.name, True, 0, None)
+                else:
+                    st = entry.stat()
+                    yield DirRecord(entry.name, False, st.st_size, st.st_mtime)
+            except OSError:
+                continue
+class DirectoryCache:
+    # LRU of parsed listings keyed by path. An entry is served only while the directory's
+    # (st_dev, st_ino, st_mtime_ns) still matches, so revisits cost one stat instead of a scan
+    def __init__(self, max_bytes=32 * 2**20):
+        self.max_bytes = max_bytes
+        self.used = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+    def lookup(self, path):
+        # Returns (stamp, records or None); take the stamp before scanning so a change
+        # made while the scan runs leaves the stored copy already stale
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        stamp = (st.st_dev, st.st_ino, st.st_mtime_ns)
+        with self.lock:
+            hit = self.entries.get(key)
+            if hit is not None and hit[0] == stamp:
+                self.entries.move_to_end(key)
+                return stamp, hit[1]
+        return stamp, None
+    def store(self, path, stamp, records):
+        key = os.path.abspath(path)
+        records = tuple(records)
+        size = sum(sys.getsizeof(record.name) for record in records) + 160 * len(records)
+        with self.lock:
+            self.discard(key)
+            if size <= self.max_bytes:
+                self.entries[key] = (stamp, records, size)
+                self.used += size
+            while self.used > self.max_bytes:
+                self.used -= self.entries.popitem(last=False)[1][2]
+        return records
+    def invalidate(self, path):
+        with self.lock:
+            self.discard(os.path.abspath(path))
+    def discard(self, key):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.used -= old[2]
+class VirtualList(tk.Frame):
+    # Only the rows in view plus `overscan` rows above and below exist as canvas items.
+    # Scrolling inside that band just moves the items; past it, the same items are
+    # re-labelled from the backing sequence, so the row count never costs widgets
+    def __init__(self, master, columns=None, row_height=22, overscan=10, font=('Arial', 11),
+                 bg='#1a1a1a', fg='white', select_bg='#00ff88', select_fg='black', header_bg='#2a2a2a',
+                 on_activate=None, on_heading=None):
+        super().__init__(master, bg=bg)
+        self.row_height = row_height
+        self.overscan = overscan
+        self.font = font
+        self.fg = fg
+        self.select_fg = select_fg
+        self.on_activate = on_activate
+        self.on_heading = on_heading
+        self.rows = []
+        self.render = self.default_render
+        self.top = 0
+        self.first = 0
+        self.slots = []
+        self.selected = None
+        char_width = max(1, tkfont.Font(root=self, font=font).measure('0'))
+        widths = [width for _, width in columns] if columns else [0]
+        self.offsets = [6 + sum(widths[:index]) for index in range(len(widths))]
+        # Characters that fit in each column but the last, so long names don't overlap
+        self.limits = [max(4, width // char_width - 1) for width in widths[:-1]] + [None]
+        if columns:
+            self.header = tk.Canvas(self, height=row_height + 4, bg=header_bg, highlightthickness=0)
+            self.header.pack(fill='x')
+            for offset, (title, _) in zip(self.offsets, columns):
+                self.header.create_text(offset, (row_height + 4) // 2, text=title, anchor='w',
+                                        font=(font[0], font[1], 'bold'), fill=fg)
+            self.header.bind('<Button-1>', self.heading_click)
+        self.scrollbar = tk.Scrollbar(self, orient='vertical', command=self.yview)
+        self.scrollbar.pack(side='right', fill='y')
+        self.canvas = tk.Canvas(self, bg=bg, highlightthickness=0, takefocus=1)
+        self.canvas.pack(side='left', fill='both', expand=True)
+        self.highlight = self.canvas.create_rectangle(0, -2 * row_height, 0, -row_height,
+                                                      fill=select_bg, width=0, tags='row')
+        self.canvas.bind('<Configure>', self.resize)
+        self.canvas.bind('<Button-1>', self.click)
+        self.canvas.bind('<Double-Button-1>', self.double_click)
+        self.canvas.bind('<MouseWheel>', self.wheel)
+        self.canvas.bind('<Button-4>', self.wheel)
+        self.canvas.bind('<Button-5>', self.wheel)
+        for key in ('<Up>', '<Down>', '<Prior>', '<Next>', '<Home>', '<End>', '<Return>'):
+            self.canvas.bind(key, self.key)
+    @staticmethod
+    def default_render(row):
+        return row if isinstance(row, tuple) else (row,)
+    def set_rows(self, rows, render=None):
+        # rows only needs len() and indexing; render(row) -> tuple of column strings
+        self.rows = rows
+        self.render = render or self.default_render
+        self.top = 0
+        self.selected = None
+        self.redraw()
+    def extend(self, rows):
+        start = len(self.rows)
+        self.rows.extend(rows)
+        if start < self.first + len(self.slots):
+            self.redraw()
+        else:
+            self.update_scrollbar()
+    def refresh(self):
+        self.redraw()
+    def get(self, index):
+        return self.rows[index]
+    def view_height(self):
+        return max(self.row_height, self.canvas.winfo_height())
+    def content_height(self):
+        return len(self.rows) * self.row_height
+    def resize(self, event):
+        needed = event.height // self.row_height + 2 + 2 * self.overscan
+        while len(self.slots) < needed:
+            self.slots.append([self.canvas.create_text(offset, 0, anchor='w', font=self.font,
+                                                       fill=self.fg, tags='row')
+                               for offset in self.offsets])
+        while len(self.slots) > needed:
+            self.canvas.delete(*self.slots.pop())
+        self.redraw()
+    def redraw(self):
+        rh = self.row_height
+        self.top = max(0, min(self.top, self.content_height() - self.view_height()))
+        self.first = max(0, self.top // rh - self.overscan)
+        for slot, items in enumerate(self.slots):
+            index = self.first + slot
+            values = self.render(self.rows[index]) if index < len(self.rows) else ()
+            colour = self.select_fg if index == self.selected else self.fg
+            y = index * rh - self.top + rh // 2
+            for column, item in enumerate(items):
+                text = str(values[column]) if column < len(values) else ''
+                limit = self.limits[column]
+                if limit is not None and len(text) > limit:
+                    text = text[:limit - 1] + '…'
+                self.canvas.itemconfigure(item, text=text, fill=colour)
+                self.canvas.coords(item, self.offsets[column], y)
+        if self.selected is None:
+            self.canvas.coords(self.highlight, 0, -2 * rh, 0, -rh)
+        else:
+            y = self.selected * rh - self.top
+            self.canvas.coords(self.highlight, 0, y, self.canvas.winfo_width(), y + rh)
+        self.update_scrollbar()
+    def scroll_to(self, top):
+        rh = self.row_height
+        top = max(0, min(int(top), self.content_height() - self.view_height()))
+        if top == self.top:
+            return
+        if self.first * rh <= top and top + self.view_height() <= (self.first + len(self.slots)) * rh:
+            self.canvas.move('row', 0, self.top - top)
+            self.top = top
+            self.update_scrollbar()
+        else:
+            self.top = top
+            self.redraw()
+    def update_scrollbar(self):
+        total = self.content_height()
+        if total <= self.view_height():
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.top / total, (self.top + self.view_height()) / total)
+    def yview(self, *args):
+        if args[0] == 'moveto':
+            self.scroll_to(float(args[1]) * self.content_height())
+        elif args[0] == 'scroll':
+            step = self.row_height if args[2] == 'units' else self.view_height() - self.row_height
+            self.scroll_to(self.top + int(args[1]) * step)
+    def wheel(self, event):
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self.yview('scroll', -3, 'units')
+        else:
+            self.yview('scroll', 3, 'units')
+    def click(self, event):
+        self.canvas.focus_set()
+        index = (event.y + self.top) // self.row_height
+        if index < len(self.rows):
+            self.select(index)
+    def double_click(self, event):
+        self.click(event)
+        if self.selected is not None and self.on_activate is not None:
+            self.on_activate(self.selected)
+    def key(self, event):
+        if not self.rows:
+            return 'break'
+        page = max(1, self.view_height() // self.row_height - 1)
+        current = -1 if self.selected is None else self.selected
+        if event.keysym == 'Return':
+            if self.selected is not None and self.on_activate is not None:
+                self.on_activate(self.selected)
+            return 'break'
+        target = {'Up': current - 1, 'Down': current + 1, 'Prior': current - page,
+                  'Next': current + page, 'Home': 0, 'End': len(self.rows) - 1}[event.keysym]
+        self.select(max(0, min(target, len(self.rows) - 1)))
+        return 'break'
+    def select(self, index):
+        self.selected = index
+        y = index * self.row_height
+        if y < self.top:
+            self.top = y
+        elif y + self.row_height > self.top + self.view_height():
+            self.top = y + self.row_height - self.view_height()
+        self.redraw()
+        self.event_generate('<<RowSelect>>')
+    def heading_click(self, event):
+        if self.on_heading is None:
+            return
+        for column in range(len(self.offsets) - 1, -1, -1):
+            if event.x >= self.offsets[column]:
+                self.on_heading(column)
+                return
+def format_size(size):
+    for unit in ('B', 'KB', 'MB', 'GB', 'TB'):
+        if size < 1024 or unit == 'TB':
+            break
+        size /= 1024
+    return f"{size} B" if unit == 'B' else f"{size:.1f} {unit}"
+DirUsage = namedtuple('DirUsage', 'stamp bytes files linked subdirs errors')
+class DiskUsageScanner:
+    # Directories are scanned in parallel on a bounded pool and their own contents are cached
+    # by (st_dev, st_ino, st_mtime_ns). A directory's mtime only moves when its direct entries
+    # change, so a rescan stats every folder but re-lists only the ones that changed; a file
+    # grown in place keeps its folder's mtime, and its old size is reused until that changes
+    def __init__(self, workers=8, max_dirs=200000):
+        self.workers = workers
+        self.max_dirs = max_dirs
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+    def scan(self, token, path, device):
+        token.check()
+        try:
+            st = os.stat(path)
+            stamp = (st.st_dev, st.st_ino, st.st_mtime_ns)
+            with self.lock:
+                hit = self.cache.get(path)
+                if hit is not None and hit.stamp == stamp:
+                    self.cache.move_to_end(path)
+                    return hit
+            size = files = errors = 0
+            linked = []
+            subdirs = []
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    token.check()
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Stay on one filesystem, like du -x
+                            if entry.stat(follow_symlinks=False).st_dev == device:
+                                subdirs.append(entry.path)
+                            continue
+                        est = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        errors += 1
+                        continue
+                    allocated = est.st_blocks * 512 if hasattr(est, 'st_blocks') else est.st_size
+                    files += 1
+                    if est.st_nlink > 1:
+                        linked.append((est.st_dev, est.st_ino, allocated))
+                    else:
+                        size += allocated
+        except OSError:
+            return DirUsage(None, 0, 0, (), (), 1)
+        usage = DirUsage(stamp, size, files, tuple(linked), tuple(subdirs), errors)
+        with self.lock:
+            self.cache[path] = usage
+            if len(self.cache) > self.max_dirs:
+                self.cache.popitem(last=False)
+        return usage
+    def analyze(self, token, progress, root, report_interval=0.2):
+        # Runs on a task-pool worker; returns [(name, bytes, files)] per child of root.
+        # Hard links are charged once, to whichever path the walk reaches first
+        device = os.stat(root).st_dev
+        breakdown = {}
+        seen = set()
+        folders = errors = 0
+        def snapshot():
+            return [(name, size, files) for name, (size, files) in breakdown.items()], folders, errors
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='quantum-du')
+        try:
+            pending = {pool.submit(self.scan, token, root, device): None}
+            reported = time.monotonic()
+            while pending:
+                done, _ = wait(pending, timeout=report_interval, return_when=FIRST_COMPLETED)
+                token.check()
+                for future in done:
+                    top = pending.pop(future)
+                    usage = future.result()
+                    folders += 1
+                    errors += usage.errors
+                    size = usage.bytes
+                    for dev, ino, allocated in usage.linked:
+                        if (dev, ino) not in seen:
+                            seen.add((dev, ino))
+                            size += allocated
+                    slot = breakdown.setdefault(top or '(files in this folder)', [0, 0])
+                    slot[0] += size
+                    slot[1] += usage.files
+                    for subdir in usage.subdirs:
+                        child = top or os.path.basename(subdir) + '/'
+                        pending[pool.submit(self.scan, token, subdir, device)] = child
+                if time.monotonic() - reported >= report_interval:
+                    progress(snapshot())
+                    reported = time.monotonic()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return snapshot()
+class DiskUsageWindow:
+    # Sortable per-folder breakdown for one analysis; partial totals stream in while it runs
+    SORT_KEYS = (lambda row: row[0].casefold(), lambda row: row[1], lambda row: row[2], lambda row: row[1])
+    def __init__(self, os, parent, path):
+        self.os = os
+        self.rows = []
+        self.total = 0
+        self.sort_column = 1
+        self.sort_reverse = True
+        self.window = tk.Toplevel(parent)
+        self.window.title("Folder Size")
+        self.window.geometry("500x460")
+        tk.Label(self.window, text=path, font=('Arial', 10), anchor='w').pack(fill='x', padx=15, pady=(10, 0))
+        self.status = tk.Label(self.window, text="Scanning...", font=('Arial', 10), anchor='w')
+        self.status.pack(fill='x', padx=15)
+        columns = [('Folder', 220), ('Size', 90), ('Files', 80), ('Share', 70)]
+        self.list = VirtualList(self.window, columns=columns, on_heading=self.sort_by)
+        self.list.pack(fill='both', expand=True, padx=15, pady=10)
+        self.list.set_rows(self.rows, render=self.describe)
+        self.cancel_btn = tk.Button(self.window, text="CANCEL", font=('Arial', 10), width=10, command=self.cancel)
+        self.cancel_btn.pack(pady=(0, 10))
+        self.token = self.os.task_pool.submit_io(
+            self.os.disk_usage.analyze, path, owner=self.window,
+            on_progress=lambda result: self.show(result, False),
+            on_done=lambda result: self.show(result, True),
+            on_error=self.fail)
+    def describe(self, row):
+        share = row[1] * 100 / self.total if self.total else 0
+        return (row[0], format_size(row[1]), row[2], f"{share:.1f}%")
+    def show(self, result, finished):
+        rows, folders, errors = result
+        self.rows[:] = rows
+        self.total = sum(row[1] for row in rows)
+        self.rows.sort(key=self.SORT_KEYS[self.sort_column], reverse=self.sort_reverse)
+        self.list.refresh()
+        state = "Total" if finished else "Scanning..."
+        text = f"{state} {format_size(self.total)} in {folders} folders"
+        if errors:
+            text += f" ({errors} unreadable)"
+        self.status.config(text=text)
+        if finished:
+            self.cancel_btn.config(text="CLOSE", command=self.window.destroy)
+    def sort_by(self, column):
+        if column == self.sort_column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column, self.sort_reverse = column, column != 0
+        self.rows.sort(key=self.SORT_KEYS[column], reverse=self.sort_reverse)
+        self.list.refresh()
+    def fail(self, error):
+        self.status.config(text=f"Scan failed: {error}")
+        self.cancel_btn.config(text="CLOSE", command=self.window.destroy)
+    def cancel(self):
+        self.os.task_pool.cancel(self.token)
+        self.status.config(text="Cancelled")
+        self.cancel_btn.config(text="CLOSE", command=self.window.destroy)
+DuplicateGroup = namedtuple('DuplicateGroup', 'size digest paths')
+class DuplicateFinder:
+    # Candidates narrow in three passes: equal size, then a BLAKE2 digest of the first and
+    # last EDGE bytes, then a full streamed digest of whatever still collides. Digests are
+    # cached by (st_dev, st_ino, st_size, st_mtime_ns), so a re-run only reads changed files
+    EDGE = 64 * 1024
+    CHUNK = 1024 * 1024
+    def __init__(self, directory_cache, workers=4, max_entries=200000):
+        self.directory_cache = directory_cache
+        self.workers = workers
+        self.max_entries = max_entries
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+    def walk(self, token, progress, root, report_interval=0.2):
+        # Listings come from the shared directory cache; symlinked folders are followed once
+        by_size = {}
+        seen = set()
+        pending = [root]
+        files = 0
+        reported = time.monotonic()
+        while pending:
+            token.check()
+            path = pending.pop()
+            try:
+                stamp, records = self.directory_cache.lookup(path)
+                if stamp[:2] in seen:
+                    continue
+                seen.add(stamp[:2])
+                if records is None:
+                    records = self.directory_cache.store(path, stamp, scan_directory(path))
+            except OSError:
+                continue
+            for record in records:
+                if record.is_dir:
+                    pending.append(os.path.join(path, record.name))
+                elif record.size > 0:
+                    by_size.setdefault(record.size, []).append(os.path.join(path, record.name))
+            files += len(records)
+            if time.monotonic() - reported >= report_interval:
+                progress(('Listing', files, 0))
+                reported = time.monotonic()
+        return by_size
+    def digest(self, token, path, key, full):
+        slot = 1 if full else 0
+        with self.lock:
+            hit = self.cache.get(key)
+            if hit is not None and hit[slot] is not None:
+                self.cache.move_to_end(key)
+                return hit[slot]
+        size = key[2]
+        hasher = hashlib.blake2b(digest_size=16)
+        buffer = bytearray(self.CHUNK if full else self.EDGE)
+        view = memoryview(buffer)
+        with open(path, 'rb', buffering=0) as f:
+            if full:
+                while True:
+                    token.check()
+                    count = f.readinto(buffer)
+                    if not count:
+                        break
+                    hasher.update(view[:count])
+            else:
+                hasher.update(view[:f.readinto(buffer)])
+                if size > self.EDGE:
+                    f.seek(max(self.EDGE, size - self.EDGE))
+                    hasher.update(view[:f.readinto(buffer)])
+        value = hasher.digest()
+        with self.lock:
+            entry = self.cache.pop(key, [None, None])
+            entry[slot] = value
+            # The edges of a small file are the whole file
+            if size <= 2 * self.EDGE:
+                entry[0] = entry[1] = value
+            self.cache[key] = entry
+            if len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+        return value
+    def hash_pass(self, token, progress, pool, stage, groups, full):
+        # groups: [[(path, key), ...]]; returns the groups that still collide after hashing
+        jobs = [(path, key) for group in groups for path, key in group]
+        results = {}
+        pending = {pool.submit(self.digest, token, path, key, full): path for path, key in jobs}
+        reported = time.monotonic()
+        while pending:
+            done, _ = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            token.check()
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    results[path] = future.result()
+                except OSError:
+                    results[path] = None
+            if time.monotonic() - reported >= 0.2:
+                progress((stage, len(results), len(jobs)))
+                reported = time.monotonic()
+        survivors = []
+        for group in groups:
+            buckets = {}
+            for path, key in group:
+                if results[path] is not None:
+                    buckets.setdefault(results[path], []).append((path, key))
+            survivors.extend((digest, bucket) for digest, bucket in buckets.items() if len(bucket) > 1)
+        return survivors
+    def find(self, token, progress, root):
+        # Runs on a task-pool worker; returns DuplicateGroups, most wasted space first
+        by_size = self.walk(token, progress, root)
+        groups = []
+        for paths in by_size.values():
+            if len(paths) < 2:
+                continue
+            group = []
+            inodes = set()
+            for path in paths:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                # Hard links and symlinks to one file are not copies of it
+                if (st.st_dev, st.st_ino) not in inodes:
+                    inodes.add((st.st_dev, st.st_ino))
+                    group.append((path, (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)))
+            if len(group) > 1:
+                groups.append(group)
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='quantum-dup')
+        try:
+            partial = self.hash_pass(token, progress, pool, 'Sampling', groups, False)
+            small = [(digest, group) for digest, group in partial if group[0][1][2] <= 2 * self.EDGE]
+            large = [group for digest, group in partial if group[0][1][2] > 2 * self.EDGE]
+            confirmed = small + self.hash_pass(token, progress, pool, 'Hashing', large, True)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        result = [DuplicateGroup(group[0][1][2], digest.hex(), sorted(path for path, _ in group))
+                  for digest, group in confirmed]
+        result.sort(key=lambda group: group.size * (len(group.paths) - 1), reverse=True)
+        return result
+class DuplicatesWindow:
+    # One heading row per group followed by its copies; activating a copy previews it
+    def __init__(self, os, parent, path):
+        self.os = os
+        self.root_path = path
+        self.rows = []
+        self.paths = []
+        self.preview = None
+        self.window = tk.Toplevel(parent)
+        self.window.title("Duplicates")
+        self.window.geometry("560x460")
+        tk.Label(self.window, text=path, font=('Arial', 10), anchor='w').pack(fill='x', padx=15, pady=(10, 0))
+        self.status = tk.Label(self.window, text="Listing...", font=('Arial', 10), anchor='w')
+        self.status.pack(fill='x', padx=15)
+        columns = [('File', 320), ('Size', 90), ('Reclaimable', 100)]
+        self.list = VirtualList(self.window, columns=columns, on_activate=self.open_path)
+        self.list.pack(fill='both', expand=True, padx=15, pady=10)
+        self.cancel_btn = tk.Button(self.window, text="CANCEL", font=('Arial', 10), width=10, command=self.cancel)
+        self.cancel_btn.pack(pady=(0, 10))
+        self.token = self.os.task_pool.submit_io(
+            self.os.duplicates.find, path, owner=self.window,
+            on_progress=self.show_progress, on_done=self.show, on_error=self.fail)
+    def show_progress(self, state):
+        stage, done, total = state
+        if total:
+            self.status.config(text=f"{stage} {done} of {total} candidates...")
+        else:
+            self.status.config(text=f"{stage} {done} files...")
+    def show(self, groups):
+        wasted = 0
+        for group in groups:
+            extra = group.size * (len(group.paths) - 1)
+            wasted += extra
+            self.rows.append((f"{len(group.paths)} copies", format_size(group.size), format_size(extra)))
+            self.paths.append(None)
+            for path in group.paths:
+                self.rows.append(("    " + os.path.relpath(path, self.root_path), '', ''))
+                self.paths.append(path)
+        self.list.set_rows(self.rows)
+        self.status.config(text=f"{len(groups)} groups, {format_size(wasted)} reclaimable")
+        self.cancel_btn.config(text="CLOSE", command=self.window.destroy)
+    def open_path(self, index):
+        path = self.paths[index]
+        if path is None:
+            return
+        if self.preview is None or not self.preview.window.winfo_exists():
+            self.preview = FilePreview(self.os, self.window)
+        self.preview.open(path)
+        self.preview.window.lift()
+    def fail(self, error):
+        self.status.config(text=f"Search failed: {error}")
+        self.cancel_btn.config(text="CLOSE", command=self.window.destroy)
+    def cancel(self):
+        self.os.task_pool.cancel(self.token)
+        self.status.config(text="Cancelled")
+        self.cancel_btn.config(text="CLOSE", command=self.window.destroy)
+SearchHit = namedtuple('SearchHit', 'path is_dir')
+class FilenameIndex:
+    # Every name under the configured roots lives in SQLite; an FTS5 trigram table over the
+    # names turns substring queries into index lookups. Folders keep (st_ino, st_mtime_ns),
+    # so a refresh stats each folder but re-lists only those whose entries changed
+    SCHEMA = (
+        'CREATE TABLE IF NOT EXISTS dirs (id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, ino INTEGER, mtime_ns INTEGER)',
+        'CREATE TABLE IF NOT EXISTS entries (id INTEGER PRIMARY KEY, dir_id INTEGER NOT NULL, name TEXT NOT NULL, is_dir INTEGER NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS idx_entries_dir ON entries(dir_id)',
+        "CREATE VIRTUAL TABLE IF NOT EXISTS names USING fts5(name, content='entries', content_rowid='id', tokenize='trigram')",
+    )
+    def __init__(self, db_path, roots, interval=600, startup_delay=5):
+        self.db_path = db_path
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.interval = interval
+        self.startup_delay = startup_delay
+        self.local = threading.local()
+        self.stop_event = threading.Event()
+        self.available = True
+        self.ready = False
+        self.folders = 0
+    def connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+    def start(self):
+        threading.Thread(target=self.run, name='quantum-indexer', daemon=True).start()
+    def stop(self):
+        self.stop_event.set()
+    def status(self):
+        if not self.available:
+            return "UNAVAILABLE"
+        return f"ACTIVE ({self.folders} folders)" if self.ready else "BUILDING"
+    def run(self):
+        if self.stop_event.wait(self.startup_delay):
+            return
+        try:
+            conn = self.connect()
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+        except sqlite3.Error as e:
+            # FTS5's trigram tokenizer needs SQLite 3.34+
+            print(f"Search index unavailable: {e}")
+            self.available = False
+            return
+        with conn:
+            self.folders = conn.execute('SELECT COUNT(*) FROM dirs').fetchone()[0]
+        self.ready = self.folders > 0
+        while not self.stop_event.is_set():
+            try:
+                self.refresh(conn)
+                self.ready = True
+            except sqlite3.Error as e:
+                print(f"Search index refresh failed: {e}")
+            self.stop_event.wait(self.interval)
+        conn.close()
+    def refresh(self, conn):
+        stack = list(self.roots)
+        folders = 0
+        committed = time.monotonic()
+        while stack and not self.stop_event.is_set():
+            path = stack.pop()
+            folders += 1
+            row = conn.execute('SELECT id, ino, mtime_ns FROM dirs WHERE path = ?', (path,)).fetchone()
+            try:
+                st = os.stat(path)
+            except OSError:
+                self.forget(conn, path)
+                continue
+            if row is not None and row[1:] == (st.st_ino, st.st_mtime_ns):
+                stack.extend(os.path.join(path, name) for (name,) in conn.execute(
+                    'SELECT name FROM entries WHERE dir_id = ? AND is_dir = 1', (row[0],)))
+            else:
+                stack.extend(self.reindex(conn, path, st, row))
+            if time.monotonic() - committed > 1:
+                conn.commit()
+                committed = time.monotonic()
+        conn.commit()
+        self.folders = folders
+    def reindex(self, conn, path, st, row):
+        # Returns the subfolders to visit next
+        names = set()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        names.add((entry.name, entry.is_dir(follow_symlinks=False)))
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        if row is None:
+            dir_id = conn.execute('INSERT INTO dirs (path, ino, mtime_ns) VALUES (?, ?, ?)',
+                                  (path, st.st_ino, st.st_mtime_ns)).lastrowid
+            added = names
+        else:
+            dir_id = row[0]
+            conn.execute('UPDATE dirs SET ino = ?, mtime_ns = ? WHERE id = ?', (st.st_ino, st.st_mtime_ns, dir_id))
+            old = {(name, bool(is_dir)): entry_id for entry_id, name, is_dir in conn.execute(
+                'SELECT id, name, is_dir FROM entries WHERE dir_id = ?', (dir_id,))}
+            for (name, is_dir), entry_id in old.items():
+                if (name, is_dir) in names:
+                    continue
+                conn.execute("INSERT INTO names (names, rowid, name) VALUES ('delete', ?, ?)", (entry_id, name))
+                conn.execute('DELETE FROM entries WHERE id = ?', (entry_id,))
+                if is_dir:
+                    self.forget(conn, os.path.join(path, name))
+            added = names.difference(old)
+        for name, is_dir in added:
+            entry_id = conn.execute('INSERT INTO entries (dir_id, name, is_dir) VALUES (?, ?, ?)',
+                                    (dir_id, name, is_dir)).lastrowid
+            conn.execute('INSERT INTO names (rowid, name) VALUES (?, ?)', (entry_id, name))
+        return [os.path.join(path, name) for name, is_dir in names if is_dir]
+    def forget(self, conn, path):
+        # Drop a folder and everything below it; paths under it sort between path + sep and path + next char
+        below = (path + os.sep, path + chr(ord(os.sep) + 1))
+        for (dir_id,) in conn.execute('SELECT id FROM dirs WHERE path = ? OR (path >= ? AND path < ?)',
+                                      (path,) + below).fetchall():
+            conn.execute("INSERT INTO names (names, rowid, name) SELECT 'delete', id, name FROM entries WHERE dir_id = ?", (dir_id,))
+            conn.execute('DELETE FROM entries WHERE dir_id = ?', (dir_id,))
+            conn.execute('DELETE FROM dirs WHERE id = ?', (dir_id,))
+    def reader(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = self.connect()
+            conn.execute('PRAGMA query_only=ON')
+            self.local.conn = conn
+        return conn
+    def search(self, token, progress, query, limit=200):
+        # Substring hits first; with room left, fill up with names sharing most of the query's trigrams
+        query = query.strip().casefold()
+        if not query or not self.available or not os.path.exists(self.db_path):
+            return []
+        try:
+            return self.query(self.reader(), token, query, limit)
+        except sqlite3.OperationalError:
+            # The first build hasn't created the tables yet
+            return []
+    def query(self, conn, token, query, limit):
+        select = 'SELECT entries.id, dirs.path, entries.name, entries.is_dir FROM {} JOIN dirs ON dirs.id = entries.dir_id WHERE {} LIMIT ?'
+        if len(query) >= 3:
+            rows = conn.execute(select.format('names JOIN entries ON entries.id = names.rowid', 'names MATCH ?'),
+                                ('"' + query.replace('"', '""') + '"', limit)).fetchall()
+        else:
+            pattern = '%' + query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            rows = conn.execute(select.format('entries', "entries.name LIKE ? ESCAPE '\\'"), (pattern, limit)).fetchall()
+        hits = [SearchHit(os.path.join(path, name), bool(is_dir)) for _, path, name, is_dir in rows]
+        token.check()
+        if len(hits) < limit and len(query) >= 4:
+            grams = {query[i:i + 3] for i in range(len(query) - 2)}
+            seen = {row[0] for row in rows}
+            scored = []
+            for entry_id, path, name, is_dir in conn.execute(
+                    select.format('names JOIN entries ON entries.id = names.rowid', 'names MATCH ? ORDER BY names.rank'),
+                    (' OR '.join('"' + gram.replace('"', '""') + '"' for gram in grams), limit * 5)):
+                if entry_id in seen:
+                    continue
+                folded = name.casefold()
+                shared = len(grams.intersection(folded[i:i + 3] for i in range(len(folded) - 2)))
+                score = shared / len(grams)
+                if score >= 0.5:
+                    scored.append((score, SearchHit(os.path.join(path, name), bool(is_dir))))
+            scored.sort(key=lambda item: -item[0])
+            hits.extend(hit for _, hit in scored[:limit - len(hits)])
+        return hits
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.xz', '.txz')
+ARCHIVE_ERRORS = (zipfile.BadZipFile, tarfile.TarError, EOFError, zlib.error) + ((lzma.LZMAError,) if lzma else ())
+def is_archive(name):
+    return name.lower().endswith(ARCHIVE_SUFFIXES)
+class ArchiveIndex:
+    # Folder tree of one archive, built from the zip central directory or the tar member
+    # headers alone. A plain tar is walked by seeking from header to header; a compressed one
+    # is stream-decompressed end to end, and every member opened from it is decompressed again
+    # from the start, since gzip and xz streams cannot seek
+    def __init__(self, path, stamp):
+        self.path = path
+        self.stamp = stamp
+        self.is_zip = path.lower().endswith('.zip')
+        self.folders = {'': {}}
+        self.members = {}
+    def load(self, check=None):
+        if self.is_zip:
+            with zipfile.ZipFile(self.path) as archive:
+                for info in archive.infolist():
+                    if check is not None:
+                        check()
+                    self.add(info.filename, info.is_dir(), info.file_size,
+                             time.mktime(info.date_time + (0, 0, -1)), info)
+        else:
+            with tarfile.open(self.path, 'r:*') as archive:
+                for info in archive:
+                    if check is not None:
+                        check()
+                    # Links and device entries have no data of their own to show or copy
+                    if info.isdir() or info.isfile():
+                        self.add(info.name, info.isdir(), info.size, info.mtime, info)
+        return self
+    def add(self, name, is_dir, size, mtime, info):
+        parts = [part for part in name.split('/') if part not in ('', '.')]
+        if not parts or '..' in parts:
+            return
+        inner = '/'.join(parts)
+        if is_dir:
+            self.add_folder(inner)
+        else:
+            parent = '/'.join(parts[:-1])
+            self.add_folder(parent)
+            self.folders[parent][parts[-1]] = DirRecord(parts[-1], False, size, mtime)
+            self.members[inner] = info
+    def add_folder(self, inner):
+        # Zips often omit entries for folders, so every member's parents are implied
+        if inner not in self.folders:
+            parent, _, name = inner.rpartition('/')
+            self.add_folder(parent)
+            self.folders[parent][name] = DirRecord(name, True, 0, None)
+            self.folders[inner] = {}
+    def listdir(self, inner):
+        records = self.folders.get(inner)
+        if records is None:
+            raise FileNotFoundError(f"No folder '{inner}' in {os.path.basename(self.path)}")
+        return tuple(records.values())
+    @contextmanager
+    def open(self, inner):
+        info = self.members.get(inner)
+        if info is None:
+            raise FileNotFoundError(f"No file '{inner}' in {os.path.basename(self.path)}")
+        if self.is_zip:
+            with zipfile.ZipFile(self.path) as archive, archive.open(info) as stream:
+                yield stream
+        else:
+            with tarfile.open(self.path, 'r:*') as archive:
+                try:
+                    stream = archive.extractfile(info)
+                except KeyError as e:
+                    raise OSError(f"Cannot open '{inner}': {e}") from e
+                if stream is None:
+                    raise OSError(f"'{inner}' is not a regular file")
+                with stream:
+                    yield stream
+class ArchiveCache:
+    # Indexes of recently browsed archives, reused while the archive's stat is unchanged.
+    # Paths inside an archive look like /home/me/backup.zip/photos/a.jpg; members opened for
+    # preview are copied, up to PREVIEW_LIMIT bytes, into a private temp folder
+    PREVIEW_LIMIT = 64 * 2**20
+    CHUNK = 2**20
+    def __init__(self, max_archives=8):
+        self.max_archives = max_archives
+        self.indexes = OrderedDict()
+        self.extracted = {}
+        self.tempdir = None
+        self.lock = threading.Lock()
+    def split(self, path):
+        # Returns (archive path, inner path) for a path inside an archive, else None
+        path = os.path.abspath(path)
+        inner = []
+        while not os.path.lexists(path):
+            parent, name = os.path.split(path)
+            if parent == path:
+                return None
+            inner.append(name)
+            path = parent
+        if not is_archive(path) or not os.path.isfile(path):
+            return None
+        return path, '/'.join(reversed(inner))
+    def index(self, archive, check=None):
+        st = os.stat(archive)
+        stamp = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        with self.lock:
+            hit = self.indexes.get(archive)
+            if hit is not None and hit.stamp == stamp:
+                self.indexes.move_to_end(archive)
+                return hit
+        try:
+            index = ArchiveIndex(archive, stamp).load(check)
+        except ARCHIVE_ERRORS as e:
+            raise OSError(f"Cannot read {os.path.basename(archive)}: {e}") from e
+        with self.lock:
+            self.indexes[archive] = index
+            while len(self.indexes) > self.max_archives:
+                self.indexes.popitem(last=False)
+        return index
+    def listdir(self, archive, inner, check=None):
+        return self.index(archive, check).listdir(inner)
+    def extract(self, token, progress, path):
+        # Runs on a task-pool worker; returns a real file the preview can map
+        archive, inner = self.split(path)
+        index = self.index(archive, token.check)
+        key = (index.stamp, archive, inner)
+        with self.lock:
+            hit = self.extracted.get(key)
+            if self.tempdir is None:
+                self.tempdir = tempfile.mkdtemp(prefix='quantum-archive-')
+        if hit is not None and os.path.exists(hit):
+            return hit
+        target = os.path.join(tempfile.mkdtemp(dir=self.tempdir), os.path.basename(inner))
+        remaining = self.PREVIEW_LIMIT
+        try:
+            with index.open(inner) as src, open(target, 'wb') as dst:
+                while remaining > 0:
+                    token.check()
+                    chunk = src.read(min(self.CHUNK, remaining))
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    remaining -= len(chunk)
+        except ARCHIVE_ERRORS as e:
+            raise OSError(f"Cannot extract {os.path.basename(inner)}: {e}") from e
+        with self.lock:
+            self.extracted[key] = target
+        return target
+    def close(self):
+        if self.tempdir is not None:
+            shutil.rmtree(self.tempdir, ignore_errors=True)
+            self.tempdir = None
+class FilePreview:
+    # Text and hex views page through an mmap of the file, so a 10 GB log costs the same
+    # as a small note: only the window on screen is ever sliced out and decoded
+    PAGE = 32 * 1024
+    HEX_PAGE = 4 * 1024
+    THUMB_SIZE = 480
+    IMAGE_TYPES = ('.png', '.gif', '.ppm', '.pgm')
+    PIL_TYPES = ('.jpg', '.jpeg', '.bmp', '.webp', '.tif', '.tiff')
+    def __init__(self, os, parent):
+        self.os = os
+        self.file = None
+        self.map = None
+        self.size = 0
+        self.offset = 0
+        self.end = 0
+        self.encoding = None
+        self.hex = False
+        self.photo = None
+        self.image_task = None
+        self.window = tk.Toplevel(parent)
+        self.window.title("Preview")
+        self.window.geometry("560x520")
+        top = tk.Frame(self.window)
+        top.pack(fill='x', padx=10, pady=5)
+        self.mode_btn = tk.Button(top, text="HEX", font=('Arial', 9), width=6, command=self.toggle_mode)
+        self.mode_btn.pack(side='right')
+        self.name_label = tk.Label(top, text="", font=('Arial', 12, 'bold'), anchor='w')
+        self.name_label.pack(fill='x')
+        self.info_label = tk.Label(self.window, text="", font=('Arial', 9), anchor='w')
+        self.info_label.pack(fill='x', padx=10)
+        self.body = tk.Frame(self.window)
+        self.body.pack(fill='both', expand=True, padx=10, pady=10)
+        self.scrollbar = tk.Scrollbar(self.body, orient='vertical', command=self.yview)
+        self.scrollbar.pack(side='right', fill='y')
+        self.text = tk.Text(self.body, wrap='none', font=('Courier', 10), bg='#0a0a0a', fg='#cccccc',
+                            yscrollcommand=self.sync_scrollbar)
+        self.text.pack(side='left', fill='both', expand=True)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.text.bind(sequence, self.wheel)
+        self.image_label = tk.Label(self.window, bg='#0a0a0a')
+        self.window.bind('<Destroy>', lambda e: e.widget is self.window and self.close())
+    def open(self, path):
+        self.close()
+        self.name_label.config(text=os.path.basename(path))
+        ext = os.path.splitext(path)[1].lower()
+        if ext in self.IMAGE_TYPES or (Image is not None and ext in self.PIL_TYPES):
+            self.load_image(path)
+            return
+        self.image_label.pack_forget()
+        self.body.pack(fill='both', expand=True, padx=10, pady=10)
+        try:
+            self.file = open(path, 'rb')
+            self.size = os.fstat(self.file.fileno()).st_size
+            if self.size:
+                self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            self.close()
+            self.show_text(f"Cannot preview: {e}")
+            return
+        self.encoding = self.detect_encoding(self.map[:64 * 1024] if self.map else b'')
+        self.hex = self.encoding is None
+        self.show_at(0)
+    def close(self):
+        if self.image_task is not None:
+            self.os.task_pool.cancel(self.image_task)
+            self.image_task = None
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.size = self.offset = self.end = 0
+    @staticmethod
+    def detect_encoding(sample):
+        # BOMs first; NUL bytes early on mean binary; otherwise UTF-8 unless it fails before the cut-off
+        for bom, encoding in ((codecs.BOM_UTF8, 'utf-8-sig'), (codecs.BOM_UTF16_LE, 'utf-16-le'), (codecs.BOM_UTF16_BE, 'utf-16-be')):
+            if sample.startswith(bom):
+                return encoding
+        if b'\x00' in sample[:8192]:
+            return None
+        try:
+            sample.decode('utf-8')
+        except UnicodeDecodeError as e:
+            if e.start < len(sample) - 3:
+                return 'latin-1'
+        return 'utf-8'
+    def show_text(self, text, at_end=False):
+        self.text.config(state='normal')
+        self.text.delete('1.0', tk.END)
+        self.text.insert('1.0', text)
+        self.text.config(state='disabled')
+        self.text.yview_moveto(1.0 if at_end else 0.0)
+    def show_at(self, offset, at_end=False):
+        if self.map is None:
+            self.show_text("(empty file)")
+            self.info_label.config(text="0 B")
+            return
+        if self.hex:
+            start = offset - offset % 16
+            end = min(self.size, start + self.HEX_PAGE)
+            lines = []
+            for row in range(start, end, 16):
+                chunk = self.map[row:min(row + 16, end)]
+                ascii_text = ''.join(chr(b) if 32 <= b < 127 else '.' for b in chunk)
+                lines.append(f"{row:010x}  {chunk.hex(' '):<47}  {ascii_text}")
+            text = '\n'.join(lines)
+        else:
+            start = offset
+            step = 2 if self.encoding.startswith('utf-16') else 1
+            start -= start % step
+            if start > 0 and step == 1:
+                # Begin on a line boundary unless the line is absurdly long
+                newline = self.map.find(b'\n', start - 1, start + 4096)
+                if newline != -1:
+                    start = newline + 1
+            end = min(self.size, start + self.PAGE)
+            if end < self.size and step == 1:
+                newline = self.map.rfind(b'\n', start, end)
+                if newline > start:
+                    end = newline + 1
+            text = self.map[start:end].decode(self.encoding, errors='replace')
+            if start == 0:
+                text = text.lstrip('\ufeff')
+        self.offset, self.end = start, end
+        self.show_text(text, at_end)
+        self.info_label.config(text=f"{format_size(self.size)}  |  {self.encoding or 'binary'}  |  "
+                                    f"bytes {start:,}-{end:,}")
+    def previous_start(self):
+        return max(0, self.offset - (self.HEX_PAGE if self.hex else self.PAGE))
+    def yview(self, *args):
+        if self.map is None:
+            return
+        if args[0] == 'moveto':
+            self.show_at(max(0, min(self.size - 1, int(float(args[1]) * self.size))))
+            return
+        amount = int(args[1])
+        first, last = self.text.yview()
+        if amount > 0 and last >= 1.0 and self.end < self.size:
+            self.show_at(self.end)
+        elif amount < 0 and first <= 0.0 and self.offset > 0:
+            self.show_at(self.previous_start(), at_end=True)
+        else:
+            self.text.yview_scroll(amount, args[2])
+    def sync_scrollbar(self, first, last):
+        # The scrollbar spans the whole file, not just the window held in the Text widget
+        if not self.size:
+            self.scrollbar.set(0, 1)
+            return
+        span = self.end - self.offset
+        self.scrollbar.set((self.offset + float(first) * span) / self.size,
+                           (self.offset + float(last) * span) / self.size)
+    def wheel(self, event):
+        self.yview('scroll', -3 if event.num == 4 or getattr(event, 'delta', 0) > 0 else 3, 'units')
+        return 'break'
+    def toggle_mode(self):
+        if self.map is None:
+            return
+        self.hex = not self.hex
+        if not self.hex and self.encoding is None:
+            self.encoding = 'latin-1'
+        self.mode_btn.config(text="TEXT" if self.hex else "HEX")
+        self.show_at(self.offset)
+    def load_image(self, path):
+        self.body.pack_forget()
+        self.image_label.config(image='', text="Decoding...", fg='#cccccc')
+        self.image_label.pack(fill='both', expand=True, padx=10, pady=10)
+        self.info_label.config(text="")
+        self.image_task = self.os.task_pool.submit_io(
+            self.decode_image, path, owner=self.window, on_done=self.show_image,
+            on_error=lambda error: self.image_label.config(text=f"Cannot decode image: {error}"))
+    def decode_image(self, token, progress, path):
+        # Pillow decodes and shrinks here; without it, Tk decodes PNG/GIF/PPM on the UI thread
+        if Image is not None:
+            image = Image.open(path)
+            size = image.size
+            image.draft('RGB', (self.THUMB_SIZE, self.THUMB_SIZE))
+            image.thumbnail((self.THUMB_SIZE, self.THUMB_SIZE))
+            image.load()
+            return image, size
+        with open(path, 'rb') as f:
+            return base64.b64encode(f.read()), None
+    def show_image(self, result):
+        self.image_task = None
+        data, size = result
+        if size is not None:
+            self.photo = ImageTk.PhotoImage(data)
+        else:
+            self.photo = tk.PhotoImage(data=data)
+            size = (self.photo.width(), self.photo.height())
+            factor = -(-max(size) // self.THUMB_SIZE)
+            if factor > 1:
+                self.photo = self.photo.subsample(factor)
+        self.image_label.config(image=self.photo, text='')
+        self.info_label.config(text=f"{size[0]} x {size[1]} pixels")
 class QuantumWidget:
     def __init__(self, parent, title):
         self.parent = parent
@@ -358,7 +1956,7 @@ class AdvancedBootAnimation:
                 self.quantum_particles.append(new_particle)
             else:
                 alpha = particle['life'] / 200
-                color = self.adjust_alpha(particle['color'], alpha)                
+                color = self.os.theme_manager.fade(particle['color'], alpha)                
                 self.boot_canvas.create_oval(
                     particle['x'] - particle['size'], particle['y'] - particle['size'],
                     particle['x'] + particle['size'], particle['y'] + particle['size'],
@@ -408,7 +2006,7 @@ class AdvancedBootAnimation:
         if progress_width > 0:
             for i in range(progress_width):
                 progress_ratio = i / bar_width
-                color = self.interpolate_color('#00ffff', '#00ff88', progress_ratio)
+                color = self.os.theme_manager.gradient(progress_ratio)
                 self.boot_canvas.create_rectangle(
                     bar_x + i, bar_y, bar_x + i + 1, bar_y + bar_height,
                     fill=color, outline='', tags="boot"
@@ -449,18 +2047,6 @@ class AdvancedBootAnimation:
                 self.current_stage = 'interface_boot'
             elif self.boot_progress >= self.boot_stages['system_ready'] and self.current_stage == 'interface_boot':
                 self.current_stage = 'system_ready'
-    def adjust_alpha(self, color, alpha):
-        r = int(int(color[1:3], 16) * alpha)
-        g = int(int(color[3:5], 16) * alpha)
-        b = int(int(color[5:7], 16) * alpha)
-        return f'#{r:02x}{g:02x}{b:02x}'
-    def interpolate_color(self, color1, color2, ratio):
-        r1, g1, b1 = int(color1[1:3], 16), int(color1[3:5], 16), int(color1[5:7], 16)
-        r2, g2, b2 = int(color2[1:3], 16), int(color2[3:5], 16), int(color2[5:7], 16)        
-        r = int(r1 + (r2 - r1) * ratio)
-        g = int(g1 + (g2 - g1) * ratio)
-        b = int(b1 + (b2 - b1) * ratio)        
-        return f'#{r:02x}{g:02x}{b:02x}'
     def finish_advanced_boot(self):
         for i in range(20):
             alpha = 1.0 - (i / 20)
@@ -469,6 +2055,47 @@ class AdvancedBootAnimation:
             time.sleep(0.02)
         self.boot_window.destroy()
         self.os.root.deiconify()
+QUANTUM_APP_MANIFEST = (
+       # ('Quantum Phone', 'QCOM001', 0.95, 3, '4.2'),
+       # ('Neural Messenger', 'NMSG002', 0.92, 2, '3.8'),
+        ('AI Camera', 'AVIS003', 0.98, 4, '5.1'),
+        #('Quantum Browser', 'QBRO004', 0.89, 2, '3.5'),
+        ('Quantum Calculator', 'QCAL005', 0.94, 3, '4.0'),
+        ('Temporal Calendar', 'TCAL006', 0.97, 4, '4.8'),
+        #('Quantum AI', 'QAI007', 0.96, 3, '4.1'),
+        #('Neural Files', 'NFIL008', 0.91, 2, '3.3'),
+        #('Quantum Music', 'QMUS009', 0.93, 3, '4.2'),
+        ('Neural Health', 'NHLT010', 0.90, 2, '3.0'),
+        ('Quantum Finance', 'QFIN011', 0.88, 2, '2.8'),
+        ('System Control', 'SCTL012', 0.99, 5, '6.0'),
+        #('Shutdown', 'SHTD013', 0.99, 1, '1.0'),
+        ('Number Game', 'GAME014', 0.85, 1, '2.0'),
+        ('Tic Tac Toe', 'GAME015', 0.88, 1, '2.1'),
+        ('BY SALEH AMOO', 'Saleh Amoo', 0.89, 1, '2.2'),
+        ('Quantum Voice Assistant', 'QVA016', 0.96, 4, '2.0'),
+        ('Quantum AR Viewer', 'QAR017', 0.94, 5, '3.1'),
+       ('Quantum Game Hub', 'QGH018', 0.92, 3, '2.5')
+)
+AppEntry = namedtuple('AppEntry', 'name signature compatibility tier version')
+class QuantumAppRegistry:
+    # Loaded once at start; lookups by signature or name are plain dict hits
+    def __init__(self, manifest, launchers):
+        self._entries = tuple(AppEntry(*row) for row in manifest)
+        self._by_signature = MappingProxyType({entry.signature: entry for entry in self._entries})
+        self._by_name = MappingProxyType({entry.name: entry for entry in self._entries})
+        self._launchers = MappingProxyType(dict(launchers))
+    @property
+    def entries(self):
+        return self._entries
+    def by_signature(self, signature):
+        return self._by_signature.get(signature)
+    def by_name(self, name):
+        return self._by_name.get(name)
+    def name_of(self, signature, default=None):
+        entry = self._by_signature.get(signature)
+        return entry.name if entry else default
+    def launcher(self, signature):
+        return self._launchers.get(signature)
 class QuantumMobileOS:
     def __init__(self):
         self.screen_width = 360
@@ -479,9 +2106,22 @@ class QuantumMobileOS:
         self.root.configure(bg='#0a0a0a')
         self.root.resizable(False, False)        
         self.root.withdraw()        
-        self.theme_manager = AdvancedThemeManager()     
+        self.system_config = SystemConfiguration()
+        self.theme_manager = AdvancedThemeManager(self.system_config)     
+        self.theme_manager.publish(self.root)
+        self.last_theme_time = None
+        self.task_pool = QuantumTaskPool(self.root)
+        self.directory_cache = DirectoryCache()
+        self.archives = ArchiveCache()
+        self.disk_usage = DiskUsageScanner()
+        self.duplicates = DuplicateFinder(self.directory_cache)
+        self.launching_app = None
+        self.open_apps = []
+        self.watchdog = MainLoopWatchdog(self.root, app_name=self.active_app)
         self.animation_running = False
         self.current_directory = os.path.expanduser("~")     
+        self.file_index = FilenameIndex(self.system_config.config['search_index'],
+                                        self.system_config.config['search_roots'] or [self.current_directory])
         self.quantum_state = "superposition"
         self.neural_activity = 0.85
         self.quantum_entanglement = 0.92        
@@ -496,7 +2136,9 @@ class QuantumMobileOS:
             'temporal_sync': True,
             'quantum_encryption': True
         } 
-        self.setup_quantum_database()
+        self.app_registry = QuantumAppRegistry(QUANTUM_APP_MANIFEST, self.app_launchers())
+        if self.system_config.config.get('app_database'):
+            self.setup_quantum_database(self.system_config.config['app_database'])
         self.neural_cache = AdvancedQuantumAI()
         self.quantum_security = QuantumSecurity()  
         self.system_metrics = {
@@ -508,61 +2150,63 @@ class QuantumMobileOS:
             'security_level': 99.9,
             'holographic_quality': 87.3
         }
-    def setup_quantum_database(self):
-        self.quantum_db = sqlite3.connect(':memory:', check_same_thread=False)
-        self.q_cursor = self.quantum_db.cursor()   
-        self.q_cursor.execute('''
-            CREATE TABLE IF NOT EXISTS quantum_apps (
-                id INTEGER PRIMARY KEY,
-                name TEXT,
-                quantum_signature TEXT,
-                neural_compatibility REAL,
-                processing_tier INTEGER,
-                version TEXT
-            )
-        ''')  
-        self.initialize_quantum_data()
-    def initialize_quantum_data(self):
-        quantum_apps = [
-           # ('Quantum Phone', 'QCOM001', 0.95, 3, '4.2'),
-           # ('Neural Messenger', 'NMSG002', 0.92, 2, '3.8'),
-            ('AI Camera', 'AVIS003', 0.98, 4, '5.1'),
-            #('Quantum Browser', 'QBRO004', 0.89, 2, '3.5'),
-            ('Quantum Calculator', 'QCAL005', 0.94, 3, '4.0'),
-            ('Temporal Calendar', 'TCAL006', 0.97, 4, '4.8'),
-            #('Quantum AI', 'QAI007', 0.96, 3, '4.1'),
-            #('Neural Files', 'NFIL008', 0.91, 2, '3.3'),
-            #('Quantum Music', 'QMUS009', 0.93, 3, '4.2'),
-            ('Neural Health', 'NHLT010', 0.90, 2, '3.0'),
-            ('Quantum Finance', 'QFIN011', 0.88, 2, '2.8'),
-            ('System Control', 'SCTL012', 0.99, 5, '6.0'),
-            #('Shutdown', 'SHTD013', 0.99, 1, '1.0'),
-            ('Number Game', 'GAME014', 0.85, 1, '2.0'),
-            ('Tic Tac Toe', 'GAME015', 0.88, 1, '2.1'),
-            ('BY SALEH AMOO', 'Saleh Amoo', 0.89, 1, '2.2'),
-            ('Quantum Voice Assistant', 'QVA016', 0.96, 4, '2.0'),
-            ('Quantum AR Viewer', 'QAR017', 0.94, 5, '3.1'),
-           ('Quantum Game Hub', 'QGH018', 0.92, 3, '2.5')
-        ]
-        
-        for app in quantum_apps:
-            self.q_cursor.execute('''
-                INSERT INTO quantum_apps (name, quantum_signature, neural_compatibility, processing_tier, version)
+    def app_launchers(self):
+        return {
+            'QCOM001': self.QuantumPhone,
+            'NMSG002': self.NeuralMessenger,
+            'AVIS003': self.AICamera,
+            'QBRO004': self.QuantumBrowser,
+            'QCAL005': self.QuantumCalculator,
+            'TCAL006': self.TemporalCalendar,
+            'QAI007': self.QuantumAIAssistant,
+            'NFIL008': self.NeuralFileSystem,
+            'QMUS009': self.QuantumMusic,
+            'NHLT010': self.NeuralHealth,
+            'QFIN011': self.QuantumFinance,
+            'SCTL012': self.SystemControl,
+            'SHTD013': self.ShutdownScreen,
+            'GAME014': self.NumberGuessingGame,
+            'GAME015': self.TicTacToeGame,
+            'QVA016': self.QuantumVoiceAssistant,
+            'QAR017': self.QuantumARViewer,
+            'QGH018': self.QuantumGameHub
+        }
+    def setup_quantum_database(self, path):
+        # Optional persistence of the app registry; nothing reads it back at runtime
+        self.quantum_db = sqlite3.connect(path)
+        with self.quantum_db:
+            self.quantum_db.execute('''
+                CREATE TABLE IF NOT EXISTS quantum_apps (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT,
+                    quantum_signature TEXT UNIQUE,
+                    neural_compatibility REAL,
+                    processing_tier INTEGER,
+                    version TEXT
+                )
+            ''')
+            self.quantum_db.executemany('''
+                INSERT OR REPLACE INTO quantum_apps (name, quantum_signature, neural_compatibility, processing_tier, version)
                 VALUES (?, ?, ?, ?, ?)
-           ''', app)
-        self.quantum_db.commit()
+            ''', self.app_registry.entries)
     def setup_neural_interface(self):
         self.setup_quantum_status()
         self.setup_quantum_interface()
         self.setup_neural_navigation()
+        self.theme_manager.register_tree(self.root)
+        if self.theme_manager.current_theme != 'quantum':
+            self.theme_manager.apply_roles(self.root)
     def setup_quantum_status(self):
-        self.status_frame = tk.Frame(self.root, bg='#0f0f0f', height=35)
+        self.status_frame = self.theme_manager.register(tk.Frame(self.root, bg='#0f0f0f', height=35), 'header')
         self.status_frame.pack(fill='x')
         self.status_frame.pack_propagate(False)    
         self.quantum_time = tk.Label(self.status_frame, text="", 
                                    font=('Arial', 10, 'bold'),
                                    bg='#0f0f0f', fg='#00ffff')
         self.quantum_time.pack(side='left', padx=12)
+        self.theme_time = tk.Label(self.status_frame, text="", font=('Arial', 8),
+                        bg='#0f0f0f', fg='#ff44ff')
+        self.theme_time.pack(side='left', padx=4)
         self.coherence_label = tk.Label(self.status_frame, text="QC: 98.7%", font=('Arial', 8),
                         bg='#0f0f0f', fg='#00ff88')
         self.coherence_label.pack(side='right', padx=4)    
@@ -575,9 +2219,11 @@ class QuantumMobileOS:
         self.theme_btn = tk.Button(self.status_frame, text="THEME", font=('Arial', 7),
                                  bg='#252525', fg='#ff44ff', command=self.change_theme)
         self.theme_btn.pack(side='right', padx=4)  
+        self.theme_manager.register(self.theme_btn, 'accent')
         self.shutdown_btn = tk.Button(self.status_frame, text="OFF", font=('Arial', 7),
                                     bg='#252525', fg='#ff4444', command=self.show_shutdown)
         self.shutdown_btn.pack(side='right', padx=4)  
+        self.theme_manager.register(self.shutdown_btn, 'danger')
         self.credit_btn = tk.Button(self.status_frame, text="By Saleh Amoo", font=('Arial', 9),
                                   bg='#252525', fg='#00ff88', command=self.show_credits)
         self.credit_btn.pack(side='right', padx=4)
@@ -680,8 +2326,7 @@ class QuantumMobileOS:
     def setup_quantum_apps(self):
         apps_frame = tk.Frame(self.main_frame, bg='#0a0a0a')
         apps_frame.pack(fill='both', expand=True, padx=10, pady=10)
-        quantum_apps = self.get_quantum_apps()
-        for i, (name, signature, compatibility) in enumerate(quantum_apps):
+        for i, (name, signature, compatibility, _, _) in enumerate(self.app_registry.entries):
             row = i // 4
             col = i % 4
             app_btn = tk.Button(apps_frame, text=f"{name}\nQ:{compatibility}", 
@@ -692,9 +2337,6 @@ class QuantumMobileOS:
             app_btn.grid(row=row, column=col, padx=2, pady=2, sticky='nsew')          
             apps_frame.grid_columnconfigure(col, weight=1)
             apps_frame.grid_rowconfigure(row, weight=1)
-    def get_quantum_apps(self):
-        self.q_cursor.execute('SELECT name, quantum_signature, neural_compatibility FROM quantum_apps')
-        return self.q_cursor.fetchall()
     def setup_neural_navigation(self):
         nav_frame = tk.Frame(self.root, bg='#151515', height=65)
         nav_frame.pack(fill='x', side='bottom')
@@ -721,54 +2363,13 @@ class QuantumMobileOS:
                           "Holographic Display Technology\n"
                           "© 2025 All rights reserved")
     def change_theme(self):
-        new_theme = self.theme_manager.change_theme()
-        theme = self.theme_manager.get_theme()
-        self.apply_theme_to_all_widgets(self.root, theme)
-        for window in self.root.winfo_children():
-            if isinstance(window, tk.Toplevel):
-                self.apply_theme_to_all_widgets(window, theme)        
-        messagebox.showinfo("Theme Changed", f"Theme changed to {self.theme_manager.current_theme.upper()}")
-    def apply_theme_to_all_widgets(self, parent, theme):
-        try:
-            if isinstance(parent, (tk.Tk, tk.Toplevel)):
-                parent.configure(bg=theme['bg'])
-            for child in parent.winfo_children():
-                self.apply_theme_recursive(child, theme)
-        except:
-            pass
-    def apply_theme_recursive(self, widget, theme):
-        try:
-            widget_type = widget.winfo_class()
-            if widget_type in ['Frame', 'Labelframe', 'LabelFrame']:
-                widget.configure(bg=theme['bg'])
-            elif widget_type == 'Label':
-                current_text = widget.cget('text')
-                if any(keyword in current_text.upper() for keyword in ['QUANTUM', 'NEURAL', 'AI', 'SYSTEM']):
-                    widget.configure(bg=theme['header_bg'], fg=theme['fg'])
-                else:
-                    widget.configure(bg=theme['bg'], fg=theme['text'])
-            elif widget_type == 'Button':
-                current_text = widget.cget('text')
-                if 'OFF' in current_text:
-                    widget.configure(bg=theme['button_bg'], fg=theme['error'])
-                elif 'THEME' in current_text:
-                    widget.configure(bg=theme['button_bg'], fg=theme['accent'])
-                else:
-                    widget.configure(bg=theme['button_bg'], fg=theme['text'])
-            elif widget_type == 'Entry':
-                widget.configure(bg=theme['widget_bg'], fg=theme['text'], insertbackground=theme['text'])
-            elif widget_type == 'Text':
-                widget.configure(bg=theme['widget_bg'], fg=theme['text'])
-            elif widget_type == 'Canvas':
-                widget.configure(bg=theme['bg'])
-            elif widget_type == 'Scrollbar':
-                widget.configure(bg=theme['button_bg'])
-            elif widget_type == 'Scale':
-                widget.configure(bg=theme['bg'], fg=theme['text'])
-            for child in widget.winfo_children():
-                self.apply_theme_recursive(child, theme)
-        except:
-            pass
+        self.theme_manager.change_theme()
+        self.theme_manager.publish(self.root)
+        self.theme_manager.apply_roles(self.root, on_progress=self.theme_progress)
+    def theme_progress(self, done, total, elapsed):
+        if done == total:
+            self.last_theme_time = elapsed
+            self.theme_time.config(text=f"THEME: {self.theme_manager.current_theme.upper()} ({elapsed * 1000:.0f} ms)")
     def show_boot_screen(self):
         boot_animation = AdvancedBootAnimation(self)
         boot_animation.show_advanced_boot()
@@ -776,9 +2377,7 @@ class QuantumMobileOS:
         if self.animation_running:
             return        
         self.animation_running = True  
-        self.q_cursor.execute('SELECT name FROM quantum_apps WHERE quantum_signature = ?', (signature,))
-        result = self.q_cursor.fetchone()
-        app_name = result[0] if result else "Quantum App"    
+        app_name = self.app_registry.name_of(signature, "Quantum App")
         self.animation_overlay = tk.Frame(self.root, bg='#0a0a0a')
         self.animation_overlay.place(x=0, y=0, relwidth=1, relheight=1)        
         self.anim_canvas = tk.Canvas(self.animation_overlay, bg='#0a0a0a', 
@@ -850,34 +2449,46 @@ class QuantumMobileOS:
             self.animation_running = False
             self.launch_quantum_app(signature)
     def launch_quantum_app(self, signature):
-        app_launchers = {
-            'QCOM001': self.QuantumPhone,
-            'NMSG002': self.NeuralMessenger,
-            'AVIS003': self.AICamera,
-            'QBRO004': self.QuantumBrowser,
-            'QCAL005': self.QuantumCalculator,
-            'TCAL006': self.TemporalCalendar,
-            'QAI007': self.QuantumAIAssistant,
-            'NFIL008': self.NeuralFileSystem,
-            'QMUS009': self.QuantumMusic,
-            'NHLT010': self.NeuralHealth,
-            'QFIN011': self.QuantumFinance,
-            'SCTL012': self.SystemControl,
-            'SHTD013': self.ShutdownScreen,
-            'GAME014': self.NumberGuessingGame,
-            'GAME015': self.TicTacToeGame,
-            'QVA016': self.QuantumVoiceAssistant,
-            'QAR017': self.QuantumARViewer,
-            'QGH018': self.QuantumGameHub
-        } 
-        if signature in app_launchers:
+        launcher = self.app_registry.launcher(signature)
+        if launcher is not None:
             try:
-                app_instance = app_launchers[signature](self)
+                self.launching_app = launcher.__name__
+                app_instance = launcher(self)
                 app_instance.show()
+                window = getattr(app_instance, 'window', None)
+                if window is not None:
+                    self.theme_manager.track(window)
+                    self.open_apps.append((window, launcher.__name__))
+                    window.bind('<FocusIn>', lambda e, w=window: self.focus_app(w), add='+')
+                    window.bind('<Destroy>', lambda e, w=window: e.widget is w and self.close_app(w), add='+')
             except Exception as e:
                 messagebox.showerror("Error", f"Could not launch app: {str(e)}")
+            finally:
+                self.launching_app = None
         else:
             messagebox.showinfo("Quantum Os", f"Created by {signature}")
+    def active_app(self):
+        # Stalls are charged to the app being built, else the most recently launched
+        # or focused app window that is still open
+        if self.launching_app is not None:
+            return self.launching_app
+        while self.open_apps:
+            window, name = self.open_apps[-1]
+            try:
+                if window.winfo_exists():
+                    return name
+            except tk.TclError:
+                pass
+            self.open_apps.pop()
+        return 'Home'
+    def focus_app(self, window):
+        for index, (open_window, name) in enumerate(self.open_apps):
+            if open_window is window:
+                if index != len(self.open_apps) - 1:
+                    self.open_apps.append(self.open_apps.pop(index))
+                return
+    def close_app(self, window):
+        self.open_apps = [(open_window, name) for open_window, name in self.open_apps if open_window is not window]
     def show_shutdown(self):
         shutdown_window = self.ShutdownScreen(self)
         shutdown_window.show()
@@ -896,6 +2507,7 @@ class QuantumMobileOS:
         threading.Thread(target=self.quantum_processing, daemon=True).start()
         threading.Thread(target=self.neural_learning, daemon=True).start()
         threading.Thread(target=self.widget_quantum_updates, daemon=True).start()
+        self.file_index.start()
     def quantum_processing(self):
         while True:
             time.sleep(2)
@@ -915,10 +2527,15 @@ class QuantumMobileOS:
             time.sleep(3)
     def run(self):
         self.root.withdraw()
+        self.watchdog.start()
         self.show_boot_screen()     
         try:
             self.root.mainloop()
         finally:
+            self.watchdog.stop()
+            self.file_index.stop()
+            self.task_pool.shutdown()
+            self.archives.close()
             if hasattr(self, 'quantum_db'):
                 self.quantum_db.close()
 
@@ -929,46 +2546,8 @@ class QuantumMobileOS:
             self.os = os
             self.window = None
             
-        def apply_theme(self, widget=None):
-            theme = self.os.theme_manager.get_theme()
-            if widget is None:
-                widget = self.window
-                
-            try:
-                if isinstance(widget, tk.Tk) or isinstance(widget, tk.Toplevel):
-                    widget.configure(bg=theme['bg'])
-                
-                for child in widget.winfo_children():
-                    self.apply_theme_to_child(child, theme)
-            except:
-                pass
-                
-        def apply_theme_to_child(self, widget, theme):
-            try:
-                widget_type = widget.winfo_class()
-                
-                if widget_type in ['Frame', 'Labelframe', 'LabelFrame']:
-                    widget.configure(bg=theme['bg'])
-                elif widget_type == 'Label':
-                    if 'title' in str(widget).lower() or 'header' in str(widget).lower():
-                        widget.configure(bg=theme['header_bg'], fg=theme['fg'])
-                    else:
-                        widget.configure(bg=theme['bg'], fg=theme['text'])
-                elif widget_type == 'Button':
-                    widget.configure(bg=theme['button_bg'], fg=theme['text'])
-                elif widget_type == 'Entry':
-                    widget.configure(bg=theme['widget_bg'], fg=theme['text'])
-                elif widget_type == 'Text':
-                    widget.configure(bg=theme['widget_bg'], fg=theme['text'])
-                elif widget_type == 'Canvas':
-                    widget.configure(bg=theme['bg'])
-                elif widget_type == 'Scrollbar':
-                    widget.configure(bg=theme['button_bg'])
-                    
-                for child in widget.winfo_children():
-                    self.apply_theme_to_child(child, theme)
-            except:
-                pass
+        def tag(self, widget, role):
+            return self.os.theme_manager.register(widget, role)
 
     class QuantumPhone(QuantumApp):
         def __init__(self, os):
@@ -978,18 +2557,16 @@ class QuantumMobileOS:
             self.window = tk.Toplevel(self.os.root)
             self.window.title("Quantum Phone")
             self.window.geometry("500x600")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="QUANTUM PHONE", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="QUANTUM PHONE", font=('Arial', 16, 'bold')).pack(expand=True)
             
             self.number_display = tk.Label(self.window, text="", font=('Arial', 20),
                                          bg='#1a1a1a', fg='white', width=15, height=2)
             self.number_display.pack(pady=10)
             
-            keypad_frame = tk.Frame(self.window, bg='#0a0a0a')
+            keypad_frame = tk.Frame(self.window)
             keypad_frame.pack(expand=True)
             
             keys = [
@@ -1004,21 +2581,21 @@ class QuantumMobileOS:
                 col = i % 3
                 
                 btn = tk.Button(keypad_frame, text=key, font=('Arial', 16),
-                              bg='#2a2a2a', fg='white', width=4, height=2,
+                              width=4, height=2,
                               command=lambda k=key: self.add_digit(k))
                 btn.grid(row=row, column=col, padx=5, pady=5)
             
-            action_frame = tk.Frame(self.window, bg='#0a0a0a')
+            action_frame = tk.Frame(self.window)
             action_frame.pack(pady=10)
             
-            call_btn = tk.Button(action_frame, text="CALL", font=('Arial', 12),
+            call_btn = self.tag(tk.Button(action_frame, text="CALL", font=('Arial', 12),
                                bg='#00aa00', fg='white', width=8,
-                               command=self.make_call)
+                               command=self.make_call), 'accent')
             call_btn.pack(side='left', padx=5)
             
-            clear_btn = tk.Button(action_frame, text="CLEAR", font=('Arial', 12),
+            clear_btn = self.tag(tk.Button(action_frame, text="CLEAR", font=('Arial', 12),
                                 bg='#aa0000', fg='white', width=8,
-                                command=self.clear_number)
+                                command=self.clear_number), 'danger')
             clear_btn.pack(side='left', padx=5)
             
         def add_digit(self, digit):
@@ -1047,14 +2624,12 @@ class QuantumMobileOS:
             self.window = tk.Toplevel(self.os.root)
             self.window.title("Neural Messenger")
             self.window.geometry("400x500")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="NEURAL MESSENGER", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="NEURAL MESSENGER", font=('Arial', 16, 'bold')).pack(expand=True)
             
-            contacts_frame = tk.Frame(self.window, bg='#0a0a0a')
+            contacts_frame = tk.Frame(self.window)
             contacts_frame.pack(fill='both', expand=True)
             
             contacts = ["John Quantum", "Sarah Neural", "Mike Photon", "Lisa AI"]
@@ -1069,10 +2644,9 @@ class QuantumMobileOS:
             chat_window.title(f"Chat with {contact}")
             chat_window.geometry("300x400")
             
-            header = tk.Frame(chat_window, bg='#1a1a1a', height=50)
+            header = tk.Frame(chat_window, class_='Header', height=50)
             header.pack(fill='x')
-            tk.Label(header, text=contact, font=('Arial', 14, 'bold'),
-                    bg='#1a1a1a', fg='white').pack(expand=True)
+            tk.Label(header, text=contact, font=('Arial', 14, 'bold')).pack(expand=True)
             
             chat_display = scrolledtext.ScrolledText(chat_window, 
                                                    bg='#0a0a0a', fg='white',
@@ -1080,7 +2654,7 @@ class QuantumMobileOS:
             chat_display.pack(fill='both', expand=True, padx=10, pady=10)
             chat_display.config(state=tk.DISABLED)
             
-            input_frame = tk.Frame(chat_window, bg='#0a0a0a')
+            input_frame = tk.Frame(chat_window)
             input_frame.pack(fill='x', padx=10, pady=5)
             
             message_entry = tk.Entry(input_frame, font=('Arial', 11),
@@ -1110,9 +2684,10 @@ class QuantumMobileOS:
             
             message_entry.bind('<Return>', lambda e: send_message())
             
-            send_btn = tk.Button(input_frame, text="SEND", font=('Arial', 9),
-                               bg='#00aa00', fg='white', command=send_message)
+            send_btn = self.tag(tk.Button(input_frame, text="SEND", font=('Arial', 9),
+                               bg='#00aa00', fg='white', command=send_message), 'accent')
             send_btn.pack(side='right', padx=(5, 0))
+            self.os.theme_manager.track(chat_window)
 
     class AICamera(QuantumApp):
         def __init__(self, os):
@@ -1125,26 +2700,24 @@ class QuantumMobileOS:
             self.window = tk.Toplevel(self.os.root)
             self.window.title("AI Camera")
             self.window.geometry("400x600")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="QUANTUM AI CAMERA", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="QUANTUM AI CAMERA", font=('Arial', 16, 'bold')).pack(expand=True)
             
             # Camera preview with animation
-            self.preview_frame = tk.Frame(self.window, bg='#0a0a0a', height=300)
+            self.preview_frame = tk.Frame(self.window, height=300)
             self.preview_frame.pack(fill='x', pady=20)
             self.preview_frame.pack_propagate(False)
             
-            self.canvas = tk.Canvas(self.preview_frame, bg='#0a0a0a', highlightthickness=0)
+            self.canvas = tk.Canvas(self.preview_frame, highlightthickness=0)
             self.canvas.pack(fill='both', expand=True, padx=20, pady=20)
             
             # Initialize camera animation
             self.init_camera_animation()
             
             # Camera info
-            info_frame = tk.Frame(self.window, bg='#0a0a0a')
+            info_frame = tk.Frame(self.window)
             info_frame.pack(fill='x', padx=20, pady=10)
             
             self.info_label = tk.Label(info_frame, 
@@ -1154,53 +2727,53 @@ class QuantumMobileOS:
             self.info_label.pack(fill='x', padx=10, pady=10)
             
             # Camera controls
-            controls_frame = tk.Frame(self.window, bg='#0a0a0a')
+            controls_frame = tk.Frame(self.window)
             controls_frame.pack(fill='x', padx=20, pady=10)
             
             # Top row
-            top_row = tk.Frame(controls_frame, bg='#0a0a0a')
+            top_row = tk.Frame(controls_frame)
             top_row.pack(fill='x', pady=5)
             
             flash_btn = tk.Button(top_row, text="FLASH", font=('Arial', 10),
-                                bg='#2a2a2a', fg='white', width=8,
+                                width=8,
                                 command=self.toggle_flash)
             flash_btn.pack(side='left', padx=5)
             
             timer_btn = tk.Button(top_row, text="TIMER", font=('Arial', 10),
-                                bg='#2a2a2a', fg='white', width=8,
+                                width=8,
                                 command=self.set_timer)
             timer_btn.pack(side='left', padx=5)
             
             mode_btn = tk.Button(top_row, text="AI MODE", font=('Arial', 10),
-                               bg='#2a2a2a', fg='white', width=8,
+                               width=8,
                                command=self.toggle_ai_mode)
             mode_btn.pack(side='left', padx=5)
             
             # Capture button (large and centered)
-            capture_frame = tk.Frame(controls_frame, bg='#0a0a0a')
+            capture_frame = tk.Frame(controls_frame)
             capture_frame.pack(fill='x', pady=15)
             
-            self.capture_btn = tk.Button(capture_frame, text="CAPTURE", font=('Arial', 14, 'bold'),
+            self.capture_btn = self.tag(tk.Button(capture_frame, text="CAPTURE", font=('Arial', 14, 'bold'),
                                        bg='#00aa00', fg='white', width=15, height=2,
-                                       command=self.capture_image)
+                                       command=self.capture_image), 'accent')
             self.capture_btn.pack()
             
             # Bottom row
-            bottom_row = tk.Frame(controls_frame, bg='#0a0a0a')
+            bottom_row = tk.Frame(controls_frame)
             bottom_row.pack(fill='x', pady=5)
             
             gallery_btn = tk.Button(bottom_row, text="GALLERY", font=('Arial', 10),
-                                  bg='#2a2a2a', fg='white', width=8,
+                                  width=8,
                                   command=self.open_gallery)
             gallery_btn.pack(side='left', padx=5)
             
             settings_btn = tk.Button(bottom_row, text="SETTINGS", font=('Arial', 10),
-                                   bg='#2a2a2a', fg='white', width=8,
+                                   width=8,
                                    command=self.show_settings)
             settings_btn.pack(side='left', padx=5)
             
             filter_btn = tk.Button(bottom_row, text="FILTERS", font=('Arial', 10),
-                                 bg='#2a2a2a', fg='white', width=8,
+                                 width=8,
                                  command=self.show_filters)
             filter_btn.pack(side='left', padx=5)
             
@@ -1341,15 +2914,13 @@ class QuantumMobileOS:
             self.window = tk.Toplevel(self.os.root)
             self.window.title("Quantum Browser")
             self.window.geometry("500x600")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="QUANTUM BROWSER", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="QUANTUM BROWSER", font=('Arial', 16, 'bold')).pack(expand=True)
             
             # Address bar
-            address_frame = tk.Frame(self.window, bg='#0a0a0a')
+            address_frame = tk.Frame(self.window)
             address_frame.pack(fill='x', padx=10, pady=5)
             
             self.address_entry = tk.Entry(address_frame, font=('Arial', 11),
@@ -1357,12 +2928,12 @@ class QuantumMobileOS:
             self.address_entry.pack(side='left', fill='x', expand=True, ipady=4)
             self.address_entry.insert(0, "quantum://browser/home")
             
-            go_btn = tk.Button(address_frame, text="GO", font=('Arial', 9),
-                             bg='#00aa00', fg='white', command=self.navigate)
+            go_btn = self.tag(tk.Button(address_frame, text="GO", font=('Arial', 9),
+                             bg='#00aa00', fg='white', command=self.navigate), 'accent')
             go_btn.pack(side='right', padx=(5, 0))
             
             # Browser content
-            content_frame = tk.Frame(self.window, bg='#0a0a0a')
+            content_frame = tk.Frame(self.window)
             content_frame.pack(fill='both', expand=True, padx=10, pady=10)
             
             content_text = scrolledtext.ScrolledText(content_frame, 
@@ -1394,24 +2965,24 @@ class QuantumMobileOS:
             content_text.config(state=tk.DISABLED)
             
             # Navigation buttons
-            nav_frame = tk.Frame(self.window, bg='#0a0a0a')
+            nav_frame = tk.Frame(self.window)
             nav_frame.pack(fill='x', padx=10, pady=5)
             
             back_btn = tk.Button(nav_frame, text="BACK", font=('Arial', 9),
-                               bg='#2a2a2a', fg='white', width=8)
+                               width=8)
             back_btn.pack(side='left', padx=2)
             
             forward_btn = tk.Button(nav_frame, text="FORWARD", font=('Arial', 9),
-                                  bg='#2a2a2a', fg='white', width=8)
+                                  width=8)
             forward_btn.pack(side='left', padx=2)
             
             refresh_btn = tk.Button(nav_frame, text="REFRESH", font=('Arial', 9),
-                                  bg='#2a2a2a', fg='white', width=8,
+                                  width=8,
                                   command=self.refresh_page)
             refresh_btn.pack(side='left', padx=2)
             
             home_btn = tk.Button(nav_frame, text="HOME", font=('Arial', 9),
-                               bg='#2a2a2a', fg='white', width=8,
+                               width=8,
                                command=self.go_home)
             home_btn.pack(side='left', padx=2)
         
@@ -1433,20 +3004,19 @@ class QuantumMobileOS:
             super().__init__(os)
             self.current_input = ""
             self.result = ""
+            self.pending_eval = None
             
         def show(self):
             self.window = tk.Toplevel(self.os.root)
             self.window.title("Quantum Calculator")
             self.window.geometry("400x500")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="QUANTUM CALCULATOR", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="QUANTUM CALCULATOR", font=('Arial', 16, 'bold')).pack(expand=True)
             
             # Display
-            display_frame = tk.Frame(self.window, bg='#0a0a0a')
+            display_frame = tk.Frame(self.window)
             display_frame.pack(fill='x', padx=20, pady=10)
             
             self.display_var = tk.StringVar()
@@ -1456,7 +3026,7 @@ class QuantumMobileOS:
             display_entry.pack(fill='x', ipady=10)
             
             # Keypad
-            keypad_frame = tk.Frame(self.window, bg='#0a0a0a')
+            keypad_frame = tk.Frame(self.window)
             keypad_frame.pack(fill='both', expand=True, padx=20, pady=10)
             
             buttons = [
@@ -1469,41 +3039,53 @@ class QuantumMobileOS:
             for i, row in enumerate(buttons):
                 for j, text in enumerate(row):
                     btn = tk.Button(keypad_frame, text=text, font=('Arial', 14),
-                                  bg='#2a2a2a', fg='white', width=5, height=2,
+                                  width=5, height=2,
                                   command=lambda t=text: self.button_click(t))
                     btn.grid(row=i, column=j, padx=2, pady=2, sticky='nsew')
                     keypad_frame.grid_columnconfigure(j, weight=1)
                 keypad_frame.grid_rowconfigure(i, weight=1)
         
         def button_click(self, text):
+            if self.pending_eval is not None:
+                # A new key press supersedes a calculation still running
+                self.os.task_pool.cancel(self.pending_eval)
+                self.pending_eval = None
             if text == 'C':
                 self.current_input = ""
                 self.result = ""
             elif text == '⌫':
                 self.current_input = self.current_input[:-1]
-            elif text == '=':
-                try:
-                    self.result = str(eval(self.current_input))
-                    self.current_input = self.result
-                except:
-                    self.result = "Error"
-                    self.current_input = ""
-            elif text == 'Q':
-                # Quantum calculation
-                try:
-                    num = float(eval(self.current_input))
-                    quantum_result = num * random.uniform(0.99, 1.01)
-                    self.result = f"{quantum_result:.6f}"
-                    self.current_input = self.result
-                except:
-                    self.result = "Q-Error"
-                    self.current_input = ""
+            elif text in ('=', 'Q'):
+                # Evaluated in a worker process so huge exponents can't freeze the UI
+                self.pending_eval = self.os.task_pool.submit_cpu(
+                    evaluate_expression, self.current_input, owner=self.window,
+                    on_done=lambda result, t=text: self.show_result(t, result),
+                    on_error=lambda error, t=text: self.show_result(t, None))
+                self.display_var.set("...")
+                return
             elif text == 'π':
                 self.current_input += str(math.pi)
             else:
                 self.current_input += text
             
             self.display_var.set(self.current_input if self.current_input else "0")
+        
+        def show_result(self, key, result):
+            self.pending_eval = None
+            try:
+                if result is None:
+                    raise ValueError(key)
+                if key == 'Q':
+                    # Quantum calculation
+                    quantum_result = float(result) * random.uniform(0.99, 1.01)
+                    self.result = f"{quantum_result:.6f}"
+                else:
+                    self.result = result
+                self.current_input = self.result
+            except:
+                self.result = "Q-Error" if key == 'Q' else "Error"
+                self.current_input = ""
+            self.display_var.set(self.current_input if self.current_input else "0")
 
     class TemporalCalendar(QuantumApp):
         def __init__(self, os):
@@ -1514,19 +3096,17 @@ class QuantumMobileOS:
             self.window = tk.Toplevel(self.os.root)
             self.window.title("Temporal Calendar")
             self.window.geometry("500x600")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="TEMPORAL CALENDAR", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="TEMPORAL CALENDAR", font=('Arial', 16, 'bold')).pack(expand=True)
             
             # Date navigation
-            nav_frame = tk.Frame(self.window, bg='#0a0a0a')
+            nav_frame = tk.Frame(self.window)
             nav_frame.pack(fill='x', padx=20, pady=10)
             
             prev_btn = tk.Button(nav_frame, text="◀", font=('Arial', 14),
-                               bg='#2a2a2a', fg='white', width=4,
+                               width=4,
                                command=self.previous_month)
             prev_btn.pack(side='left')
             
@@ -1535,19 +3115,19 @@ class QuantumMobileOS:
             self.month_label.pack(side='left', expand=True)
             
             next_btn = tk.Button(nav_frame, text="▶", font=('Arial', 14),
-                               bg='#2a2a2a', fg='white', width=4,
+                               width=4,
                                command=self.next_month)
             next_btn.pack(side='right')
             
             # Calendar grid
-            self.calendar_frame = tk.Frame(self.window, bg='#0a0a0a')
+            self.calendar_frame = tk.Frame(self.window)
             self.calendar_frame.pack(fill='both', expand=True, padx=20, pady=10)
             
             self.update_calendar()
             
             # Today button
-            today_btn = tk.Button(self.window, text="TODAY", font=('Arial', 12),
-                                bg='#00aa00', fg='white', command=self.go_today)
+            today_btn = self.tag(tk.Button(self.window, text="TODAY", font=('Arial', 12),
+                                bg='#00aa00', fg='white', command=self.go_today), 'accent')
             today_btn.pack(pady=10)
         
         def update_calendar(self):
@@ -1596,6 +3176,7 @@ class QuantumMobileOS:
                 self.calendar_frame.grid_columnconfigure(i, weight=1)
             for i in range(6):
                 self.calendar_frame.grid_rowconfigure(i + 1, weight=1)
+            self.os.theme_manager.track(self.calendar_frame)
         
         def previous_month(self):
             self.current_date = self.current_date.replace(day=1) - timedelta(days=1)
@@ -1629,12 +3210,10 @@ class QuantumMobileOS:
             self.window = tk.Toplevel(self.os.root)
             self.window.title("Quantum AI Assistant")
             self.window.geometry("500x600")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="QUANTUM AI ASSISTANT", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="QUANTUM AI ASSISTANT", font=('Arial', 16, 'bold')).pack(expand=True)
             
             # Conversation display
             self.chat_display = scrolledtext.ScrolledText(self.window, 
@@ -1648,7 +3227,7 @@ class QuantumMobileOS:
             self.add_message(welcome_msg)
             
             # Input area
-            input_frame = tk.Frame(self.window, bg='#0a0a0a')
+            input_frame = tk.Frame(self.window)
             input_frame.pack(fill='x', padx=20, pady=10)
             
             self.input_entry = tk.Entry(input_frame, font=('Arial', 11),
@@ -1656,18 +3235,18 @@ class QuantumMobileOS:
             self.input_entry.pack(side='left', fill='x', expand=True, ipady=4)
             self.input_entry.bind('<Return>', lambda e: self.send_message())
             
-            send_btn = tk.Button(input_frame, text="SEND", font=('Arial', 9),
-                               bg='#00aa00', fg='white', command=self.send_message)
+            send_btn = self.tag(tk.Button(input_frame, text="SEND", font=('Arial', 9),
+                               bg='#00aa00', fg='white', command=self.send_message), 'accent')
             send_btn.pack(side='right', padx=(5, 0))
             
             # Quick actions
-            actions_frame = tk.Frame(self.window, bg='#0a0a0a')
+            actions_frame = tk.Frame(self.window)
             actions_frame.pack(fill='x', padx=20, pady=5)
             
             quick_actions = ["Time", "Weather", "Calculate", "Joke", "Quantum"]
             for action in quick_actions:
                 btn = tk.Button(actions_frame, text=action, font=('Arial', 8),
-                              bg='#2a2a2a', fg='white', width=8,
+                              width=8,
                               command=lambda a=action: self.quick_action(a))
                 btn.pack(side='left', padx=2)
         
@@ -1719,119 +3298,259 @@ class QuantumMobileOS:
             return f"{random.choice(responses)}\n{random.choice(ai_responses)}"
 
     class NeuralFileSystem(QuantumApp):
+        LISTING_BATCH = 500
+        PARENT = DirRecord('..', True, 0, None)
+        
         def __init__(self, os):
             super().__init__(os)
-            self.current_path = os.path.expanduser("~")
+            self.current_path = self.os.current_directory
+            self.listing_task = None
+            self.pending_rows = deque()
+            self.drain_job = None
+            self.search_task = None
+            self.search_job = None
+            self.preview = None
             
         def show(self):
             self.window = tk.Toplevel(self.os.root)
             self.window.title("Neural File System")
             self.window.geometry("600x500")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="NEURAL FILE SYSTEM", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="NEURAL FILE SYSTEM", font=('Arial', 16, 'bold')).pack(expand=True)
             
             # Path display
-            path_frame = tk.Frame(self.window, bg='#0a0a0a')
+            path_frame = tk.Frame(self.window)
             path_frame.pack(fill='x', padx=20, pady=5)
             
+            self.count_label = tk.Label(path_frame, text="", font=('Arial', 10),
+                                      bg='#0a0a0a', fg='#00ff88')
+            self.count_label.pack(side='right')
+            
             self.path_label = tk.Label(path_frame, text=self.current_path, 
                                      font=('Arial', 10), bg='#0a0a0a', fg='#cccccc',
                                      anchor='w')
             self.path_label.pack(fill='x')
             
-            # File list
-            list_frame = tk.Frame(self.window, bg='#0a0a0a')
-            list_frame.pack(fill='both', expand=True, padx=20, pady=10)
-            
-            # Create listbox with scrollbar
-            self.file_listbox = tk.Listbox(list_frame, bg='#1a1a1a', fg='white',
-                                         font=('Arial', 11), selectbackground='#00ff88')
-            self.file_listbox.pack(side='left', fill='both', expand=True)
+            # Search box; matches replace the listing until the query is cleared
+            search_frame = tk.Frame(self.window)
+            search_frame.pack(fill='x', padx=20)
             
-            scrollbar = tk.Scrollbar(list_frame, orient='vertical')
-            scrollbar.pack(side='right', fill='y')
+            self.search_var = tk.StringVar()
+            tk.Entry(search_frame, textvariable=self.search_var, font=('Arial', 11)).pack(fill='x')
+            self.search_var.trace_add('write', lambda *args: self.schedule_search())
             
-            self.file_listbox.config(yscrollcommand=scrollbar.set)
-            scrollbar.config(command=self.file_listbox.yview)
+            # File list
+            list_frame = tk.Frame(self.window)
+            list_frame.pack(fill='both', expand=True, padx=20, pady=10)
             
-            # Bind double-click event
-            self.file_listbox.bind('<Double-Button-1>', self.on_item_double_click)
+            # Rows are DirRecords drawn on demand, so huge directories cost no widgets
+            self.file_list = VirtualList(list_frame, on_activate=self.on_item_activate)
+            self.file_list.pack(fill='both', expand=True)
             
             # Buttons
-            button_frame = tk.Frame(self.window, bg='#0a0a0a')
+            button_frame = tk.Frame(self.window)
             button_frame.pack(fill='x', padx=20, pady=10)
             
             back_btn = tk.Button(button_frame, text="BACK", font=('Arial', 10),
-                               bg='#2a2a2a', fg='white', width=10,
+                               width=10,
                                command=self.go_back)
             back_btn.pack(side='left', padx=5)
             
             home_btn = tk.Button(button_frame, text="HOME", font=('Arial', 10),
-                               bg='#2a2a2a', fg='white', width=10,
+                               width=10,
                                command=self.go_home)
             home_btn.pack(side='left', padx=5)
             
             refresh_btn = tk.Button(button_frame, text="REFRESH", font=('Arial', 10),
-                                  bg='#2a2a2a', fg='white', width=10,
+                                  width=10,
                                   command=self.refresh_list)
             refresh_btn.pack(side='left', padx=5)
             
             info_btn = tk.Button(button_frame, text="INFO", font=('Arial', 10),
-                               bg='#2a2a2a', fg='white', width=10,
+                               width=10,
                                command=self.show_info)
             info_btn.pack(side='left', padx=5)
             
+            size_btn = tk.Button(button_frame, text="SIZE", font=('Arial', 10),
+                               width=10,
+                               command=lambda: DiskUsageWindow(self.os, self.window, self.current_path))
+            size_btn.pack(side='left', padx=5)
+            
+            dupes_btn = tk.Button(button_frame, text="DUPES", font=('Arial', 10),
+                                width=10,
+                                command=lambda: DuplicatesWindow(self.os, self.window, self.current_path))
+            dupes_btn.pack(side='left', padx=5)
+            
             # Load initial directory
             self.refresh_list()
         
         def refresh_list(self):
-            self.file_listbox.delete(0, tk.END)
-            
+            # Navigating away abandons a listing that is still running
+            if self.listing_task is not None:
+                self.os.task_pool.cancel(self.listing_task)
+            self.pending_rows.clear()
+            self.file_list.set_rows([], render=self.describe)
+            self.path_label.config(text=self.current_path)
+            self.count_label.config(text="Scanning...")
+            self.listing_task = self.os.task_pool.submit_io(
+                self.list_directory, self.current_path,
+                owner=self.window, on_done=self.finish_listing, on_error=self.fail_listing,
+                on_progress=self.pending_rows.append)
+            if self.drain_job is None:
+                self.drain_job = self.window.after(16, self.drain_rows)
+        
+        def list_directory(self, token, progress, path):
+            # Rows are streamed to the UI in batches; an unchanged directory is
+            # replayed from the listing cache instead of being scanned again
+            cache = self.os.directory_cache
+            batch = []
+            if path != os.path.dirname(path):
+                batch.append(self.PARENT)
             try:
-                # Add parent directory
-                if self.current_path != os.path.dirname(self.current_path):
-                    self.file_listbox.insert(tk.END, "../ (Parent Directory)")
-                
-                # List files and directories
-                for item in os.listdir(self.current_path):
-                    full_path = os.path.join(self.current_path, item)
-                    if os.path.isdir(full_path):
-                        self.file_listbox.insert(tk.END, f"{item}/ (Directory)")
-                    else:
-                        size = os.path.getsize(full_path)
-                        self.file_listbox.insert(tk.END, f"{item} ({size} bytes)")
-                        
+                archived = self.os.archives.split(path)
+                if archived is None:
+                    stamp, cached = cache.lookup(path)
+                else:
+                    cached = self.os.archives.listdir(*archived, check=token.check)
+                records = []
+                for record in (scan_directory(path) if cached is None else cached):
+                    token.check()
+                    if cached is None:
+                        records.append(record)
+                    batch.append(record)
+                    if len(batch) >= self.LISTING_BATCH:
+                        progress(batch)
+                        batch = []
+                if cached is None:
+                    cache.store(path, stamp, records)
             except PermissionError:
-                self.file_listbox.insert(tk.END, "Permission denied")
-            
-            self.path_label.config(text=self.current_path)
+                batch.append("Permission denied")
+            except OSError as e:
+                # Folder removed or unmounted, bad archive path, unreadable archive
+                batch.append(f"Cannot read folder: {e.strerror or e}")
+            if batch:
+                progress(batch)
         
-        def on_item_double_click(self, event):
-            selection = self.file_listbox.curselection()
-            if selection:
-                item = self.file_listbox.get(selection[0])
-                
-                if item.startswith("../"):
-                    # Go to parent directory
-                    self.current_path = os.path.dirname(self.current_path)
-                    self.refresh_list()
-                elif item.endswith("/ (Directory)"):
-                    # Enter directory
-                    dir_name = item[:-13]  # Remove " (Directory)" suffix
-                    self.current_path = os.path.join(self.current_path, dir_name)
+        def describe(self, record):
+            if isinstance(record, str):
+                return (record,)
+            if isinstance(record, SearchHit):
+                return (record.path + os.sep if record.is_dir else record.path,)
+            if record is self.PARENT:
+                return ("../ (Parent Directory)",)
+            if record.is_dir:
+                return (f"{record.name}/ (Directory)",)
+            return (f"{record.name} ({record.size} bytes)",)
+        
+        def finish_listing(self, result):
+            self.listing_task = None
+        
+        def fail_listing(self, error):
+            self.listing_task = None
+            self.pending_rows.append([f"Listing failed: {error}"])
+        
+        def drain_rows(self):
+            # Hand whatever batches arrived since the last frame to the list in one go
+            self.drain_job = None
+            if not self.window.winfo_exists():
+                return
+            while self.pending_rows:
+                self.file_list.extend(self.pending_rows.popleft())
+            listed = len(self.file_list.rows)
+            if self.listing_task is not None:
+                self.count_label.config(text=f"Scanning... {listed} items")
+                self.drain_job = self.window.after(16, self.drain_rows)
+            else:
+                self.count_label.config(text=f"{listed} items")
+        
+        def on_item_activate(self, index):
+            record = self.file_list.get(index)
+            if isinstance(record, str):
+                return
+            if isinstance(record, SearchHit):
+                # Open the match's folder; clearing the query brings the listing back
+                self.current_path = record.path if record.is_dir else os.path.dirname(record.path)
+                self.search_var.set('')
+                return
+            if record is self.PARENT:
+                # Go to parent directory
+                self.current_path = os.path.dirname(self.current_path)
+                self.refresh_list()
+            elif record.is_dir:
+                # Enter directory
+                self.current_path = os.path.join(self.current_path, record.name)
+                self.refresh_list()
+            else:
+                path = os.path.join(self.current_path, record.name)
+                inside = self.os.archives.split(self.current_path) is not None
+                if is_archive(record.name) and not inside:
+                    # Archives open as folders, listed from their headers without unpacking
+                    self.current_path = path
                     self.refresh_list()
+                elif inside:
+                    self.count_label.config(text="Extracting...")
+                    self.os.task_pool.submit_io(
+                        self.os.archives.extract, path, owner=self.window,
+                        on_done=lambda extracted: self.show_preview(
+                            extracted, record.size > self.os.archives.PREVIEW_LIMIT),
+                        on_error=self.fail_preview)
                 else:
-                    # File selected
-                    file_name = item.split(' (')[0]  # Get filename before size
-                    messagebox.showinfo("File Selected", 
-                                      f"File: {file_name}\n\n"
-                                      f"Neural analysis complete\n"
-                                      f"Quantum encryption: ACTIVE\n"
-                                      f"File integrity: 100%")
+                    self.show_preview(path)
+        
+        def fail_preview(self, error):
+            self.count_label.config(text=f"{len(self.file_list.rows)} items")
+            messagebox.showerror("Neural File System", f"Cannot preview: {error}")
+        
+        def show_preview(self, path, truncated=False):
+            # Reuse one preview window per file browser
+            if self.preview is None or not self.preview.window.winfo_exists():
+                self.preview = FilePreview(self.os, self.window)
+            self.preview.open(path)
+            self.preview.window.lift()
+            text = f"{len(self.file_list.rows)} items"
+            if truncated:
+                text += f" (preview shows the first {format_size(self.os.archives.PREVIEW_LIMIT)})"
+            self.count_label.config(text=text)
+        
+        def schedule_search(self):
+            # Wait for a pause in typing before querying
+            if self.search_job is not None:
+                self.window.after_cancel(self.search_job)
+            self.search_job = self.window.after(150, self.run_search)
+        
+        def run_search(self):
+            self.search_job = None
+            if self.search_task is not None:
+                self.os.task_pool.cancel(self.search_task)
+                self.search_task = None
+            query = self.search_var.get()
+            if not query.strip():
+                self.refresh_list()
+                return
+            if self.listing_task is not None:
+                self.os.task_pool.cancel(self.listing_task)
+                self.listing_task = None
+            self.pending_rows.clear()
+            self.count_label.config(text="Searching...")
+            started = time.perf_counter()
+            self.search_task = self.os.task_pool.submit_io(
+                self.os.file_index.search, query, owner=self.window,
+                on_done=lambda hits: self.show_hits(hits, started),
+                on_error=self.fail_search)
+        
+        def fail_search(self, error):
+            # A locked or damaged index; keep the box usable for the next query
+            self.search_task = None
+            self.file_list.set_rows([f"Search failed: {error}"], render=self.describe)
+            self.count_label.config(text="Search unavailable")
+        
+        def show_hits(self, hits, started):
+            self.search_task = None
+            self.file_list.set_rows(hits, render=self.describe)
+            elapsed = (time.perf_counter() - started) * 1000
+            self.count_label.config(text=f"{len(hits)} matches ({elapsed:.0f} ms)")
         
         def go_back(self):
             if self.current_path != os.path.dirname(self.current_path):
@@ -1843,18 +3562,22 @@ class QuantumMobileOS:
             self.refresh_list()
         
         def show_info(self):
-            try:
-                total, used, free = shutil.disk_usage(self.current_path)
-                info = (f"Neural File System Info:\n\n"
-                       f"Current Path: {self.current_path}\n"
-                       f"Total Space: {total // (2**30)} GB\n"
-                       f"Used Space: {used // (2**30)} GB\n"
-                       f"Free Space: {free // (2**30)} GB\n\n"
-                       f"Quantum Indexing: ACTIVE\n"
-                       f"Neural Search: ENABLED")
-                messagebox.showinfo("System Info", info)
-            except:
-                messagebox.showinfo("System Info", "Neural File System v3.3\nQuantum storage optimization active")
+            # disk_usage can block for seconds on network mounts
+            self.os.task_pool.submit_io(
+                lambda token, progress, path: shutil.disk_usage(path), self.current_path,
+                owner=self.window, on_done=self.show_disk_usage,
+                on_error=lambda error: messagebox.showinfo("System Info", "Neural File System v3.3\nQuantum storage optimization active"))
+        
+        def show_disk_usage(self, usage):
+            total, used, free = usage
+            info = (f"Neural File System Info:\n\n"
+                   f"Current Path: {self.current_path}\n"
+                   f"Total Space: {total // (2**30)} GB\n"
+                   f"Used Space: {used // (2**30)} GB\n"
+                   f"Free Space: {free // (2**30)} GB\n\n"
+                   f"Quantum Indexing: {self.os.file_index.status()}\n"
+                   f"Neural Search: {'ENABLED' if self.os.file_index.available else 'DISABLED'}")
+            messagebox.showinfo("System Info", info)
 
     class QuantumMusic(QuantumApp):
         def __init__(self, os):
@@ -1873,15 +3596,13 @@ class QuantumMobileOS:
             self.window = tk.Toplevel(self.os.root)
             self.window.title("Quantum Music")
             self.window.geometry("400x500")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="QUANTUM MUSIC", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="QUANTUM MUSIC", font=('Arial', 16, 'bold')).pack(expand=True)
             
             # Album art
-            art_frame = tk.Frame(self.window, bg='#0a0a0a', height=200)
+            art_frame = tk.Frame(self.window, height=200)
             art_frame.pack(fill='x', pady=20)
             art_frame.pack_propagate(False)
             
@@ -1891,8 +3612,7 @@ class QuantumMobileOS:
             art_label.pack(expand=True, fill='both', padx=40, pady=20)
             
             # Track info
-            self.track_label = tk.Label(self.window, text="", font=('Arial', 14, 'bold'),
-                                      bg='#0a0a0a', fg='white')
+            self.track_label = tk.Label(self.window, text="", font=('Arial', 14, 'bold'))
             self.track_label.pack(pady=10)
             
             self.artist_label = tk.Label(self.window, text="Quantum AI Composer", 
@@ -1900,7 +3620,7 @@ class QuantumMobileOS:
             self.artist_label.pack()
             
             # Progress
-            progress_frame = tk.Frame(self.window, bg='#0a0a0a')
+            progress_frame = tk.Frame(self.window)
             progress_frame.pack(fill='x', padx=40, pady=10)
             
             self.progress = tk.Scale(progress_frame, from_=0, to=100, 
@@ -1909,7 +3629,7 @@ class QuantumMobileOS:
                                    troughcolor='#2a2a2a', sliderrelief='flat')
             self.progress.pack(fill='x')
             
-            time_frame = tk.Frame(self.window, bg='#0a0a0a')
+            time_frame = tk.Frame(self.window)
             time_frame.pack(fill='x', padx=40)
             
             tk.Label(time_frame, text="0:00", font=('Arial', 9), 
@@ -1918,26 +3638,26 @@ class QuantumMobileOS:
                     bg='#0a0a0a', fg='#cccccc').pack(side='right')
             
             # Controls
-            controls_frame = tk.Frame(self.window, bg='#0a0a0a')
+            controls_frame = tk.Frame(self.window)
             controls_frame.pack(fill='x', padx=40, pady=20)
             
             prev_btn = tk.Button(controls_frame, text="⏮", font=('Arial', 16),
-                               bg='#2a2a2a', fg='white', width=4,
+                               width=4,
                                command=self.previous_track)
             prev_btn.pack(side='left', padx=5)
             
-            self.play_btn = tk.Button(controls_frame, text="▶", font=('Arial', 16),
+            self.play_btn = self.tag(tk.Button(controls_frame, text="▶", font=('Arial', 16),
                                     bg='#00aa00', fg='white', width=4,
-                                    command=self.toggle_play)
+                                    command=self.toggle_play), 'accent')
             self.play_btn.pack(side='left', padx=5)
             
             next_btn = tk.Button(controls_frame, text="⏭", font=('Arial', 16),
-                               bg='#2a2a2a', fg='white', width=4,
+                               width=4,
                                command=self.next_track)
             next_btn.pack(side='left', padx=5)
             
             # Playlist
-            playlist_frame = tk.Frame(self.window, bg='#0a0a0a')
+            playlist_frame = tk.Frame(self.window)
             playlist_frame.pack(fill='both', expand=True, padx=40, pady=10)
             
             tk.Label(playlist_frame, text="QUANTUM PLAYLIST", font=('Arial', 12, 'bold'),
@@ -1996,15 +3716,13 @@ class QuantumMobileOS:
             self.window = tk.Toplevel(self.os.root)
             self.window.title("Neural Health")
             self.window.geometry("400x500")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="NEURAL HEALTH", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="NEURAL HEALTH", font=('Arial', 16, 'bold')).pack(expand=True)
             
             # Health metrics
-            metrics_frame = tk.Frame(self.window, bg='#0a0a0a')
+            metrics_frame = tk.Frame(self.window)
             metrics_frame.pack(fill='x', padx=20, pady=20)
             
             # Heart Rate
@@ -2044,7 +3762,7 @@ class QuantumMobileOS:
             self.calories_label.pack(anchor='w')
             
             # Health status
-            status_frame = tk.Frame(self.window, bg='#0a0a0a')
+            status_frame = tk.Frame(self.window)
             status_frame.pack(fill='x', padx=20, pady=10)
             
             self.status_label = tk.Label(status_frame, text="HEALTH STATUS: OPTIMAL", 
@@ -2075,8 +3793,8 @@ class QuantumMobileOS:
             recommend_text.config(state=tk.DISABLED)
             
             # Update button
-            update_btn = tk.Button(self.window, text="UPDATE METRICS", font=('Arial', 12),
-                                 bg='#00aa00', fg='white', command=self.update_metrics)
+            update_btn = self.tag(tk.Button(self.window, text="UPDATE METRICS", font=('Arial', 12),
+                                 bg='#00aa00', fg='white', command=self.update_metrics), 'accent')
             update_btn.pack(pady=10)
         
         def update_metrics(self):
@@ -2107,15 +3825,13 @@ class QuantumMobileOS:
             self.window = tk.Toplevel(self.os.root)
             self.window.title("Quantum Finance")
             self.window.geometry("500x500")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="QUANTUM FINANCE", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="QUANTUM FINANCE", font=('Arial', 16, 'bold')).pack(expand=True)
             
             # Portfolio summary
-            summary_frame = tk.Frame(self.window, bg='#0a0a0a')
+            summary_frame = tk.Frame(self.window)
             summary_frame.pack(fill='x', padx=20, pady=10)
             
             total = sum(self.portfolio.values())
@@ -2126,7 +3842,7 @@ class QuantumMobileOS:
             self.total_label.pack(anchor='w')
             
             # Portfolio items
-            portfolio_frame = tk.Frame(self.window, bg='#0a0a0a')
+            portfolio_frame = tk.Frame(self.window)
             portfolio_frame.pack(fill='both', expand=True, padx=20, pady=10)
             
             for asset, value in self.portfolio.items():
@@ -2140,7 +3856,7 @@ class QuantumMobileOS:
                        bg='#1a1a1a', fg='#00ff88').pack(side='right', padx=10)
             
             # Market data
-            market_frame = tk.Frame(self.window, bg='#0a0a0a')
+            market_frame = tk.Frame(self.window)
             market_frame.pack(fill='x', padx=20, pady=10)
             
             market_data = [
@@ -2165,16 +3881,16 @@ class QuantumMobileOS:
                        bg='#1a1a1a', fg=color).pack(side='right', padx=5)
             
             # Actions
-            action_frame = tk.Frame(self.window, bg='#0a0a0a')
+            action_frame = tk.Frame(self.window)
             action_frame.pack(fill='x', padx=20, pady=10)
             
-            trade_btn = tk.Button(action_frame, text="QUANTUM TRADE", font=('Arial', 11),
+            trade_btn = self.tag(tk.Button(action_frame, text="QUANTUM TRADE", font=('Arial', 11),
                                 bg='#00aa00', fg='white', width=15,
-                                command=self.quantum_trade)
+                                command=self.quantum_trade), 'accent')
             trade_btn.pack(side='left', padx=5)
             
             analyze_btn = tk.Button(action_frame, text="AI ANALYSIS", font=('Arial', 11),
-                                  bg='#2a2a2a', fg='white', width=15,
+                                  width=15,
                                   command=self.ai_analysis)
             analyze_btn.pack(side='left', padx=5)
         
@@ -2203,15 +3919,13 @@ class QuantumMobileOS:
             self.window = tk.Toplevel(self.os.root)
             self.window.title("System Control")
             self.window.geometry("500x500")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="SYSTEM CONTROL", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="SYSTEM CONTROL", font=('Arial', 16, 'bold')).pack(expand=True)
             
             # System status
-            status_frame = tk.Frame(self.window, bg='#0a0a0a')
+            status_frame = tk.Frame(self.window)
             status_frame.pack(fill='x', padx=20, pady=10)
             
             status_items = [
@@ -2234,7 +3948,7 @@ class QuantumMobileOS:
                        bg='#1a1a1a', fg=color).pack(side='right', padx=10)
             
             # System controls
-            controls_frame = tk.Frame(self.window, bg='#0a0a0a')
+            controls_frame = tk.Frame(self.window)
             controls_frame.pack(fill='both', expand=True, padx=20, pady=10)
             
             control_buttons = [
@@ -2258,7 +3972,7 @@ class QuantumMobileOS:
                 controls_frame.grid_rowconfigure(row, weight=1)
             
             # System info
-            info_frame = tk.Frame(self.window, bg='#0a0a0a')
+            info_frame = tk.Frame(self.window)
             info_frame.pack(fill='x', padx=20, pady=10)
             
             info_text = """Quantum OS v4.5 - System Information
@@ -2331,22 +4045,20 @@ class QuantumMobileOS:
             self.window = tk.Toplevel(self.os.root)
             self.window.title("Number Guessing Game")
             self.window.geometry("600x500")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="QUANTUM NUMBER GAME", font=('Arial', 14, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="QUANTUM NUMBER GAME", font=('Arial', 14, 'bold')).pack(expand=True)
             
             # Game instructions
             instructions = tk.Label(self.window, 
                                   text="I'm thinking of a number\nbetween 1 and 100!\n\nUse quantum intuition to guess!",
-                                  font=('Arial', 12), bg='#0a0a0a', fg='white',
+                                  font=('Arial', 12),
                                   justify='center')
             instructions.pack(pady=20)
             
             # Guess entry
-            entry_frame = tk.Frame(self.window, bg='#0a0a0a')
+            entry_frame = tk.Frame(self.window)
             entry_frame.pack(pady=10)
             
             self.guess_entry = tk.Entry(entry_frame, font=('Arial', 14),
@@ -2365,16 +4077,16 @@ class QuantumMobileOS:
             self.attempts_label.pack()
             
             # Buttons
-            button_frame = tk.Frame(self.window, bg='#0a0a0a')
+            button_frame = tk.Frame(self.window)
             button_frame.pack(pady=20)
             
-            guess_btn = tk.Button(button_frame, text="QUANTUM GUESS", font=('Arial', 12),
+            guess_btn = self.tag(tk.Button(button_frame, text="QUANTUM GUESS", font=('Arial', 12),
                                 bg='#00aa00', fg='white', width=15,
-                                command=self.check_guess)
+                                command=self.check_guess), 'accent')
             guess_btn.pack(pady=5)
             
             new_game_btn = tk.Button(button_frame, text="NEW GAME", font=('Arial', 12),
-                                   bg='#2a2a2a', fg='white', width=15,
+                                   width=15,
                                    command=self.new_game)
             new_game_btn.pack(pady=5)
             
@@ -2441,12 +4153,10 @@ class QuantumMobileOS:
             self.window = tk.Toplevel(self.os.root)
             self.window.title("Tic Tac Toe")
             self.window.geometry("600x600")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="QUANTUM TIC TAC TOE", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="QUANTUM TIC TAC TOE", font=('Arial', 16, 'bold')).pack(expand=True)
             
             # Current player display
             self.player_label = tk.Label(self.window, text="Player X's Turn", 
@@ -2454,7 +4164,7 @@ class QuantumMobileOS:
             self.player_label.pack(pady=10)
             
             # Game board
-            board_frame = tk.Frame(self.window, bg='#0a0a0a')
+            board_frame = tk.Frame(self.window)
             board_frame.pack(pady=10)
             
             self.buttons = []
@@ -2463,7 +4173,7 @@ class QuantumMobileOS:
                 col = i % 3
                 
                 btn = tk.Button(board_frame, text='', font=('Arial', 20, 'bold'),
-                              bg='#2a2a2a', fg='white', width=4, height=2,
+                              width=4, height=2,
                               command=lambda idx=i: self.make_move(idx))
                 btn.grid(row=row, column=col, padx=2, pady=2)
                 self.buttons.append(btn)
@@ -2474,12 +4184,12 @@ class QuantumMobileOS:
             self.status_label.pack(pady=5)
             
             # Controls
-            control_frame = tk.Frame(self.window, bg='#0a0a0a')
+            control_frame = tk.Frame(self.window)
             control_frame.pack(pady=20)
             
-            new_game_btn = tk.Button(control_frame, text="NEW GAME", font=('Arial', 12),
+            new_game_btn = self.tag(tk.Button(control_frame, text="NEW GAME", font=('Arial', 12),
                                    bg='#00aa00', fg='white', width=12,
-                                   command=self.new_game)
+                                   command=self.new_game), 'accent')
             new_game_btn.pack(side='left', padx=5)
             
             ai_move_btn = tk.Button(control_frame, text="AI MOVE", font=('Arial', 12),
@@ -2752,15 +4462,13 @@ class QuantumMobileOS:
             self.window = tk.Toplevel(self.os.root)
             self.window.title("Quantum Voice Assistant")
             self.window.geometry("500x600")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="QUANTUM VOICE ASSISTANT", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="QUANTUM VOICE ASSISTANT", font=('Arial', 16, 'bold')).pack(expand=True)
             
             # Voice visualization
-            self.visualization_canvas = tk.Canvas(self.window, bg='#0a0a0a', height=150)
+            self.visualization_canvas = tk.Canvas(self.window, height=150)
             self.visualization_canvas.pack(fill='x', padx=20, pady=20)
             
             # Status display
@@ -2778,21 +4486,21 @@ class QuantumMobileOS:
             self.response_text.config(state=tk.DISABLED)
             
             # Control buttons
-            control_frame = tk.Frame(self.window, bg='#0a0a0a')
+            control_frame = tk.Frame(self.window)
             control_frame.pack(fill='x', padx=20, pady=10)
             
-            listen_btn = tk.Button(control_frame, text="START LISTENING", 
+            listen_btn = self.tag(tk.Button(control_frame, text="START LISTENING", 
                                  font=('Arial', 12), bg='#00aa00', fg='white',
-                                 command=self.start_listening)
+                                 command=self.start_listening), 'accent')
             listen_btn.pack(side='left', padx=5)
             
-            stop_btn = tk.Button(control_frame, text="STOP", 
+            stop_btn = self.tag(tk.Button(control_frame, text="STOP", 
                                font=('Arial', 12), bg='#aa0000', fg='white',
-                               command=self.stop_listening)
+                               command=self.stop_listening), 'danger')
             stop_btn.pack(side='left', padx=5)
             
             clear_btn = tk.Button(control_frame, text="CLEAR", 
-                                font=('Arial', 12), bg='#2a2a2a', fg='white',
+                                font=('Arial', 12),
                                 command=self.clear_responses)
             clear_btn.pack(side='left', padx=5)
             
@@ -2926,15 +4634,13 @@ class QuantumMobileOS:
             self.window = tk.Toplevel(self.os.root)
             self.window.title("Quantum AR Viewer")
             self.window.geometry("500x600")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="QUANTUM AR VIEWER", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="QUANTUM AR VIEWER", font=('Arial', 16, 'bold')).pack(expand=True)
             
             # AR Display
-            self.ar_canvas = tk.Canvas(self.window, bg='#0a0a0a', height=300)
+            self.ar_canvas = tk.Canvas(self.window, height=300)
             self.ar_canvas.pack(fill='x', padx=20, pady=20)
             
             # Object info
@@ -2943,29 +4649,29 @@ class QuantumMobileOS:
             self.object_info.pack(pady=10)
             
             # Controls
-            control_frame = tk.Frame(self.window, bg='#0a0a0a')
+            control_frame = tk.Frame(self.window)
             control_frame.pack(fill='x', padx=20, pady=10)
             
             prev_btn = tk.Button(control_frame, text="PREVIOUS", font=('Arial', 10),
-                               bg='#2a2a2a', fg='white', command=self.previous_object)
+                               command=self.previous_object)
             prev_btn.pack(side='left', padx=5)
             
             next_btn = tk.Button(control_frame, text="NEXT", font=('Arial', 10),
-                               bg='#2a2a2a', fg='white', command=self.next_object)
+                               command=self.next_object)
             next_btn.pack(side='left', padx=5)
             
-            rotate_btn = tk.Button(control_frame, text="ROTATE", font=('Arial', 10),
-                                 bg='#00aa00', fg='white', command=self.toggle_rotation)
+            rotate_btn = self.tag(tk.Button(control_frame, text="ROTATE", font=('Arial', 10),
+                                 bg='#00aa00', fg='white', command=self.toggle_rotation), 'accent')
             rotate_btn.pack(side='left', padx=5)
             
             # AR effects
-            effects_frame = tk.Frame(self.window, bg='#0a0a0a')
+            effects_frame = tk.Frame(self.window)
             effects_frame.pack(fill='x', padx=20, pady=10)
             
             effects = ["Holographic", "Quantum", "Neural", "Temporal"]
             for effect in effects:
                 btn = tk.Button(effects_frame, text=effect, font=('Arial', 8),
-                              bg='#2a2a2a', fg='white', width=10,
+                              width=10,
                               command=lambda e=effect: self.apply_effect(e))
                 btn.pack(side='left', padx=2)
             
@@ -3112,15 +4818,13 @@ class QuantumMobileOS:
             self.window = tk.Toplevel(self.os.root)
             self.window.title("Quantum Game Hub")
             self.window.geometry("600x500")
-            self.apply_theme()
             
-            header = tk.Frame(self.window, bg='#1a1a1a', height=60)
+            header = tk.Frame(self.window, class_='Header', height=60)
             header.pack(fill='x')
-            tk.Label(header, text="QUANTUM GAME HUB", font=('Arial', 16, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="QUANTUM GAME HUB", font=('Arial', 16, 'bold')).pack(expand=True)
             
             # Games list
-            games_frame = tk.Frame(self.window, bg='#0a0a0a')
+            games_frame = tk.Frame(self.window)
             games_frame.pack(fill='both', expand=True, padx=20, pady=20)
             
             tk.Label(games_frame, text="AVAILABLE GAMES:", font=('Arial', 12, 'bold'),
@@ -3165,9 +4869,9 @@ class QuantumMobileOS:
                     font=('Arial', 9), bg='#1a1a1a', 
                     fg=difficulty_color[game['difficulty']]).pack(side='left')
             
-            play_btn = tk.Button(action_frame, text="PLAY", font=('Arial', 10),
+            play_btn = self.tag(tk.Button(action_frame, text="PLAY", font=('Arial', 10),
                                bg='#00aa00', fg='white', width=10,
-                               command=lambda g=game: self.launch_game(g))
+                               command=lambda g=game: self.launch_game(g)), 'accent')
             play_btn.pack(side='right')
             
             return card
@@ -3185,10 +4889,9 @@ class QuantumMobileOS:
             scores_window.title("Quantum High Scores")
             scores_window.geometry("400x300")
             
-            header = tk.Frame(scores_window, bg='#1a1a1a', height=40)
+            header = tk.Frame(scores_window, class_='Header', height=40)
             header.pack(fill='x')
-            tk.Label(header, text="QUANTUM HIGH SCORES", font=('Arial', 14, 'bold'),
-                    bg='#1a1a1a', fg='#00ffff').pack(expand=True)
+            tk.Label(header, text="QUANTUM HIGH SCORES", font=('Arial', 14, 'bold')).pack(expand=True)
             
             scores_text = scrolledtext.ScrolledText(scores_window, 
                                                   bg='#1a1a1a', fg='white',
@@ -3202,6 +4905,7 @@ class QuantumMobileOS:
                     scores_text.insert(tk.END, f"{game}: {score}\n")
             
             scores_text.config(state=tk.DISABLED)
+            self.os.theme_manager.track(scores_window)
 
 # ==================== MAIN EXECUTION ====================
 '''┄┄┄┅┅❅✾❅┅┅┄┄┄┄┄┄┅┅❅✾❅┅┅┄┄┄┄┄┄┅┅❅✾❅┅┅┄┄┄'''
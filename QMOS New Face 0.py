@@ -8,6 +8,8 @@ import random
 import json
 from datetime import datetime
 import sys
+from array import array
+from collections import namedtuple, OrderedDict
 
 # Mobile configuration
 MOBILE_WIDTH = 800
@@ -103,6 +105,140 @@ class WindowManager:
 
 window_manager = WindowManager()
 
+class TemporalRingBuffer:
+    """Fixed-capacity circular buffer of (timestamp, value) samples"""
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.values = array('d', bytes(8 * capacity))
+        self.times = array('d', bytes(8 * capacity))
+        self.start = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, value, timestamp=None):
+        """O(1) append, overwriting the oldest sample when full"""
+        index = (self.start + self.count) % self.capacity
+        self.values[index] = value
+        self.times[index] = time.time() if timestamp is None else timestamp
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+    def last(self, default=None):
+        if self.count == 0:
+            return default
+        return self.values[(self.start + self.count - 1) % self.capacity]
+
+    def window(self, count=None, since=None):
+        """Return the newest samples (oldest first), limited by count and/or timestamp"""
+        size = self.count if count is None else max(0, min(count, self.count))
+        first = self.count - size
+        if since is not None:
+            # Samples are time-ordered, so skip forward to the first one inside the window
+            while first < self.count and self.times[(self.start + first) % self.capacity] < since:
+                first += 1
+        values = []
+        for offset in range(first, self.count):
+            values.append(self.values[(self.start + offset) % self.capacity])
+        return values
+
+    def aggregate(self, count=None, since=None):
+        """Min/max/mean over a window"""
+        values = self.window(count, since)
+        if not values:
+            return {'min': 0.0, 'max': 0.0, 'mean': 0.0, 'count': 0}
+        return {
+            'min': min(values),
+            'max': max(values),
+            'mean': sum(values) / len(values),
+            'count': len(values)
+        }
+
+class TemporalSeriesStore:
+    """Bounded in-memory history for every charted metric"""
+    def __init__(self, capacity=720):
+        self.capacity = capacity
+        self.series = {}
+
+    def get_series(self, metric, capacity=None):
+        if metric not in self.series:
+            self.series[metric] = TemporalRingBuffer(capacity or self.capacity)
+        return self.series[metric]
+
+    def append(self, metric, value, timestamp=None):
+        self.get_series(metric).append(value, timestamp)
+
+    def last(self, metric, default=None):
+        if metric not in self.series:
+            return default
+        return self.series[metric].last(default)
+
+    def window(self, metric, count=None, since=None):
+        if metric not in self.series:
+            return []
+        return self.series[metric].window(count, since)
+
+    def aggregate(self, metric, count=None, since=None):
+        return self.get_series(metric).aggregate(count, since)
+
+metrics_history = TemporalSeriesStore()
+
+DirRecord = namedtuple('DirRecord', 'name is_dir size mtime')
+
+def scan_directory(path):
+    """Yield a DirRecord per entry; directories need no stat call, files need one"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    yield DirRecord(entry.name, True, 0, None)
+                else:
+                    st = entry.stat()
+                    yield DirRecord(entry.name, False, st.st_size, st.st_mtime)
+            except OSError:
+                continue
+
+class DirectoryCache:
+    """LRU of parsed directory listings, valid while the directory's inode and mtime match"""
+    def __init__(self, max_bytes=32 * 2**20):
+        self.max_bytes = max_bytes
+        self.used = 0
+        self.entries = OrderedDict()
+
+    def lookup(self, path):
+        """Return (stamp, records), with records None when the path must be rescanned"""
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        stamp = (st.st_dev, st.st_ino, st.st_mtime_ns)
+        hit = self.entries.get(key)
+        if hit is not None and hit[0] == stamp:
+            self.entries.move_to_end(key)
+            return stamp, hit[1]
+        return stamp, None
+
+    def store(self, path, stamp, records):
+        """Keep a listing under the stamp taken before it was scanned"""
+        key = os.path.abspath(path)
+        records = tuple(records)
+        size = sum(sys.getsizeof(record.name) for record in records) + 160 * len(records)
+        self.invalidate(key)
+        if size <= self.max_bytes:
+            self.entries[key] = (stamp, records, size)
+            self.used += size
+        while self.used > self.max_bytes:
+            self.used -= self.entries.popitem(last=False)[1][2]
+        return records
+
+    def invalidate(self, path):
+        old = self.entries.pop(os.path.abspath(path), None)
+        if old is not None:
+            self.used -= old[2]
+
+directory_cache = DirectoryCache()
+
 class BootScreen:
     """Boot screen with system diagnostics"""
     def __init__(self, master):
@@ -955,10 +1091,13 @@ class FileManager(WindowBase):
     
     def refresh_files(self):
         self.file_list.delete(0, tk.END)
+        path = self.path_var.get()
         try:
-            files = os.listdir(self.path_var.get())
-            for file in files:
-                self.file_list.insert(tk.END, file)
+            stamp, records = directory_cache.lookup(path)
+            if records is None:
+                records = directory_cache.store(path, stamp, scan_directory(path))
+            if records:
+                self.file_list.insert(tk.END, *(record.name for record in records))
         except Exception as e:
             messagebox.showerror("Error", f"Cannot access: {str(e)}")
 
@@ -997,12 +1136,19 @@ class SystemInfo(WindowBase):
         
         # Simulate system usage
         usage = random.randint(10, 80)
+        metrics_history.append('system.usage', usage)
         
         # Draw graph
         self.usage_canvas.create_rectangle(50, 50, 50 + usage * 2, 80, fill='#00ffaa')
         self.usage_canvas.create_text(150, 30, text=f"System Usage: {usage}%", 
                                      font=('Arial', 12), fill='white')
         
+        # History over the last minute
+        stats = metrics_history.aggregate('system.usage', since=time.time() - 60)
+        self.usage_canvas.create_text(150, 92,
+                                     text=f"1m  avg {stats['mean']:.0f}%  min {stats['min']:.0f}%  max {stats['max']:.0f}%",
+                                     font=('Arial', 8), fill='#888888')
+        
         self.window.after(2000, self.update_usage)
 
 class Settings(WindowBase):
@@ -1,41 +1,225 @@
 # main.py - Quantum OS Ultimate Edition
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog, simpledialog, colorchooser
+import tkinter.font as tkfont
 import time
 import os
 import math
 import random
 import json
+import re
 from datetime import datetime
 import sys
 import webbrowser
-from threading import Thread
+from threading import Thread, Condition, Event, Lock, local
+import queue
+import shutil
+import errno
+from collections import namedtuple, OrderedDict
 import sqlite3
 import base64
+import zipfile
+import tarfile
+import zlib
+from contextlib import contextmanager
+try:
+    import lzma
+except ImportError:
+    lzma = None
 
 # Mobile configuration
 MOBILE_WIDTH = 800
 MOBILE_HEIGHT = 600
 
+class GroupCommitWriter:
+    """Background SQLite writer that batches queued statements into one transaction"""
+    def __init__(self, db_path, batch_size=128, flush_interval=0.05):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.requests = queue.Queue()
+        self.acks = queue.Queue()
+        self.root = None
+        self.outstanding = 0
+        self.thread = Thread(target=self.run, daemon=True, name='quantum-db-writer')
+        self.thread.start()
+    
+    def attach(self, root):
+        """Deliver durable-ack callbacks on the Tk thread of this root"""
+        self.root = root
+    
+    def submit(self, sql, params=(), on_durable=None, many=False, wait=False):
+        """Queue a write; on_durable(error) runs on the Tk thread once the batch has committed.
+
+        With wait=True the caller blocks until the commit and errors are raised in place.
+        """
+        done = {'event': Event(), 'error': None} if wait else None
+        self.requests.put((sql, params, on_durable, many, done))
+        if on_durable is not None and self.root is not None:
+            self.outstanding += 1
+            if self.outstanding == 1:
+                self.root.after(25, self.deliver_acks)
+        if done is not None:
+            done['event'].wait()
+            if done['error'] is not None:
+                raise done['error']
+    
+    def run(self):
+        connection = sqlite3.connect(self.db_path)
+        connection.execute('PRAGMA journal_mode=WAL')
+        # FULL fsyncs the WAL on every commit; batching pays that cost once per group
+        connection.execute('PRAGMA synchronous=FULL')
+        while True:
+            request = self.requests.get()
+            if request is None:
+                break
+            batch = [request]
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size and request[4] is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self.requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                batch.append(request)
+            error = None
+            try:
+                with connection:
+                    for sql, params, _, many, _ in batch:
+                        if many:
+                            connection.executemany(sql, params)
+                        else:
+                            connection.execute(sql, params)
+            except sqlite3.Error as e:
+                error = e
+            for _, _, on_durable, _, done in batch:
+                if on_durable is not None:
+                    self.acks.put((on_durable, error))
+                if done is not None:
+                    done['error'] = error
+                    done['event'].set()
+            if stop:
+                break
+        connection.close()
+    
+    def deliver_acks(self):
+        while True:
+            try:
+                on_durable, error = self.acks.get_nowait()
+            except queue.Empty:
+                break
+            self.outstanding -= 1
+            on_durable(error)
+        if self.outstanding > 0:
+            self.root.after(25, self.deliver_acks)
+    
+    def close(self, timeout=2):
+        """Flush what is queued and stop the writer thread"""
+        self.requests.put(None)
+        self.thread.join(timeout)
+
+class QuantumDatabase:
+    """Per-thread read connections, one serialized writer and per-statement timing"""
+    def __init__(self, db_path, cached_statements=256):
+        self.db_path = db_path
+        self.cached_statements = cached_statements
+        self.local = local()
+        self.connections = []
+        self.lock = Lock()
+        self.stats = {}
+        # The writer creates the file and switches it to WAL before any reader opens it
+        self.writer = GroupCommitWriter(db_path)
+        self.writer.submit('PRAGMA user_version', wait=True)
+    
+    def attach(self, root):
+        self.writer.attach(root)
+    
+    def reader(self):
+        """This thread's read-only connection; sqlite3 caches its prepared statements"""
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, check_same_thread=False,
+                                         cached_statements=self.cached_statements)
+            connection.execute('PRAGMA query_only=ON')
+            self.local.connection = connection
+            with self.lock:
+                self.connections.append(connection)
+        return connection
+    
+    def query(self, sql, params=()):
+        """Run a read on this thread's connection and return all rows"""
+        started = time.perf_counter()
+        rows = self.reader().execute(sql, params).fetchall()
+        self.record(sql, time.perf_counter() - started)
+        return rows
+    
+    def query_one(self, sql, params=()):
+        rows = self.query(sql, params)
+        return rows[0] if rows else None
+    
+    def execute(self, sql, params=(), on_durable=None, wait=False):
+        """Queue a write on the serialized writer"""
+        started = time.perf_counter()
+        self.writer.submit(sql, params, on_durable=on_durable, wait=wait)
+        if wait:
+            self.record(sql, time.perf_counter() - started)
+    
+    def executemany(self, sql, rows, on_durable=None, wait=False):
+        started = time.perf_counter()
+        self.writer.submit(sql, list(rows), on_durable=on_durable, many=True, wait=wait)
+        if wait:
+            self.record(sql, time.perf_counter() - started)
+    
+    def record(self, sql, elapsed):
+        with self.lock:
+            entry = self.stats.get(sql)
+            if entry is None:
+                self.stats[sql] = [1, elapsed, elapsed]
+            else:
+                entry[0] += 1
+                entry[1] += elapsed
+                entry[2] = max(entry[2], elapsed)
+    
+    def statement_stats(self):
+        """(sql, calls, total seconds, worst seconds), slowest total first"""
+        with self.lock:
+            rows = [(' '.join(sql.split()), count, total, worst)
+                    for sql, (count, total, worst) in self.stats.items()]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+    
+    def close(self):
+        self.writer.close()
+        with self.lock:
+            for connection in self.connections:
+                connection.close()
+            self.connections.clear()
+
 class SecurityManager:
     """Enhanced security and encryption system"""
-    def __init__(self):
-        self.db_file = "quantum_data.db"
-        self.setup_database()
-    
-    def setup_database(self):
-        """Setup user database"""
-        conn = sqlite3.connect(self.db_file)
-        cursor = conn.cursor()
-        cursor.execute('''
+    # (version, statements); append new entries, never edit applied ones
+    MIGRATIONS = [
+        (1, [
+            '''
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                applied_date TEXT
+            )
+            ''',
+            '''
             CREATE TABLE IF NOT EXISTS users (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 username TEXT UNIQUE,
                 password TEXT,
                 created_date TEXT
             )
-        ''')
-        cursor.execute('''
+            ''',
+            '''
             CREATE TABLE IF NOT EXISTS notes (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 title TEXT,
@@ -43,9 +227,48 @@ class SecurityManager:
                 created_date TEXT,
                 user_id INTEGER
             )
-        ''')
-        conn.commit()
-        conn.close()
+            '''
+        ])
+    ]
+    
+    def __init__(self):
+        self.db_file = "quantum_data.db"
+        self.database = None
+        self.lock = Lock()
+    
+    @property
+    def db(self):
+        """Open the database and migrate it on first use"""
+        with self.lock:
+            if self.database is None:
+                database = QuantumDatabase(self.db_file)
+                self.migrate(database)
+                self.database = database
+            return self.database
+    
+    def warm_up(self):
+        """Initialize in the background so the first real query does not wait"""
+        Thread(target=lambda: self.db, daemon=True).start()
+    
+    def migrate(self, database):
+        """Apply the migrations this database has not seen yet"""
+        if database.query_one("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'schema_migrations'"):
+            applied = {version for (version,) in database.query('SELECT version FROM schema_migrations')}
+        else:
+            applied = set()
+        for version, statements in self.MIGRATIONS:
+            if version in applied:
+                continue
+            for statement in statements:
+                database.execute(statement)
+            database.execute('INSERT INTO schema_migrations (version, applied_date) VALUES (?, ?)',
+                             (version, datetime.now().isoformat()), wait=True)
+    
+    def close(self):
+        with self.lock:
+            if self.database is not None:
+                self.database.close()
+                self.database = None
 
 security_manager = SecurityManager()
 
@@ -150,7 +373,7 @@ ai_assistant = AIAssistant()
 
 class SystemConfiguration:
     """Enhanced system configuration manager"""
-    def __init__(self):
+    def __init__(self, flush_delay=0.5):
         self.config_file = "quantum_config.json"
         self.default_config = {
             "theme": "quantum_dark",
@@ -168,34 +391,102 @@ class SystemConfiguration:
             "weather_updates": True,
             "battery_saver": False
         }
-        self.load_config()
+        self.loaded = None
+        self.flush_delay = flush_delay
+        self.dirty = set()
+        self.deadline = None
+        self.lock = Lock()
+        self.wakeup = Condition(self.lock)
+        self.write_lock = Lock()
+        self.writer = None
+    
+    @property
+    def config(self):
+        """Settings dict, read from disk on first use"""
+        if self.loaded is None:
+            self.load_config()
+        return self.loaded
     
     def load_config(self):
         try:
             if os.path.exists(self.config_file):
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     loaded_config = json.load(f)
-                    self.config = {**self.default_config, **loaded_config}
+                    self.loaded = {**self.default_config, **loaded_config}
             else:
-                self.config = self.default_config.copy()
+                self.loaded = self.default_config.copy()
                 self.save_config()
         except Exception as e:
             print(f"Config load error: {e}")
-            self.config = self.default_config.copy()
+            self.loaded = self.default_config.copy()
+    
+    def get(self, key, default=None):
+        return self.config.get(key, default)
+    
+    def set(self, key, value):
+        self.update({key: value})
+    
+    def update(self, values):
+        """Change settings in memory and schedule one coalesced write"""
+        config = self.config
+        with self.lock:
+            changed = [key for key, value in values.items() if config.get(key) != value]
+            for key in changed:
+                config[key] = values[key]
+            self.dirty.update(changed)
+            if changed:
+                self.schedule()
     
     def save_config(self):
-        try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Config save error: {e}")
+        with self.lock:
+            self.dirty.update(self.config)
+            self.schedule()
+    
+    def schedule(self):
+        # Caller holds self.lock; later changes ride along with the pending write
+        if self.deadline is None:
+            self.deadline = time.monotonic() + self.flush_delay
+        if self.writer is None:
+            self.writer = Thread(target=self.write_loop, daemon=True)
+            self.writer.start()
+        self.wakeup.notify()
+    
+    def write_loop(self):
+        while True:
+            with self.lock:
+                while self.deadline is None or self.deadline > time.monotonic():
+                    if self.deadline is None:
+                        self.wakeup.wait()
+                    else:
+                        self.wakeup.wait(self.deadline - time.monotonic())
+            self.flush()
+    
+    def flush(self):
+        """Write pending changes now; called by the writer and on shutdown"""
+        with self.write_lock:
+            with self.lock:
+                self.deadline = None
+                if not self.dirty:
+                    return
+                snapshot = dict(self.loaded)
+                self.dirty.clear()
+            temp_file = self.config_file + ".tmp"
+            try:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, indent=2, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_file, self.config_file)
+            except Exception as e:
+                print(f"Config save error: {e}")
 
 system_config = SystemConfiguration()
 
 class SoundManager:
     """Advanced sound management system"""
-    def __init__(self):
-        self.enabled = system_config.config.get("sound", True)
+    @property
+    def enabled(self):
+        return system_config.config.get("sound", True)
     
     def play_sound(self, sound_type):
         if not self.enabled:
@@ -329,6 +620,869 @@ class WindowManager:
 
 window_manager = WindowManager()
 
+class ActivityTracker:
+    """Scales registered refresh intervals by user activity"""
+    def __init__(self, idle_after=60, background_factor=3):
+        self.idle_after = idle_after
+        self.background_factor = background_factor
+        self.root = None
+        self.last_input = time.monotonic()
+        self.focused = True
+        self.screensaver = False
+        self.tier = 'active'
+        self.cadences = {}
+        self.pending = {}
+        self.wakeup = Condition()
+
+    def attach(self, root):
+        """Start listening for input, focus and map events on the root window"""
+        self.root = root
+        for sequence in ('<Any-KeyPress>', '<Any-ButtonPress>', '<Motion>', '<MouseWheel>'):
+            root.bind_all(sequence, self.on_input, add='+')
+        root.bind('<FocusIn>', self.on_focus_change, add='+')
+        root.bind('<FocusOut>', self.on_focus_change, add='+')
+        root.bind('<Unmap>', lambda e: e.widget is root and self.set_screensaver(True), add='+')
+        root.bind('<Map>', lambda e: e.widget is root and self.set_screensaver(False), add='+')
+
+    def register(self, name, active_ms, minimal_ms):
+        """Register a refresh loop with its normal and minimal cadence"""
+        self.cadences[name] = (active_ms, minimal_ms)
+
+    def current_tier(self):
+        if self.screensaver or time.monotonic() - self.last_input >= self.idle_after:
+            self.tier = 'idle'
+        elif not self.focused:
+            self.tier = 'background'
+        else:
+            self.tier = 'active'
+        return self.tier
+
+    def interval(self, name):
+        active_ms, minimal_ms = self.cadences[name]
+        tier = self.current_tier()
+        if tier == 'idle':
+            return minimal_ms
+        if tier == 'background':
+            return min(minimal_ms, active_ms * self.background_factor)
+        return active_ms
+
+    def schedule(self, name, widget, callback):
+        """widget.after() with the tier-scaled interval; remembered so input can pull it forward"""
+        job = widget.after(self.interval(name), lambda: self.run_scheduled(name, callback))
+        self.pending[name] = (widget, job, callback)
+        return job
+
+    def run_scheduled(self, name, callback):
+        self.pending.pop(name, None)
+        callback()
+
+    def sleep(self, name):
+        """Tier-scaled sleep for background threads; returns early on wake-up"""
+        with self.wakeup:
+            self.wakeup.wait(self.interval(name) / 1000)
+
+    def on_input(self, event=None):
+        self.last_input = time.monotonic()
+        if self.screensaver:
+            self.set_screensaver(False)
+        elif self.tier != 'active':
+            self.wake()
+
+    def on_focus_change(self, event=None):
+        try:
+            self.focused = self.root.focus_displayof() is not None
+        except (KeyError, tk.TclError):
+            self.focused = True
+        if self.focused and self.tier == 'background':
+            self.wake()
+
+    def set_screensaver(self, active):
+        self.screensaver = active
+        if not active:
+            self.last_input = time.monotonic()
+            self.wake()
+
+    def wake(self):
+        """Snap every pending refresh back to the active cadence"""
+        if self.current_tier() == 'idle':
+            return
+        for name, (widget, job, callback) in list(self.pending.items()):
+            try:
+                widget.after_cancel(job)
+                if widget.winfo_exists():
+                    self.schedule(name, widget, callback)
+            except tk.TclError:
+                self.pending.pop(name, None)
+        with self.wakeup:
+            self.wakeup.notify_all()
+
+activity_tracker = ActivityTracker()
+
+DirRecord = namedtuple('DirRecord', 'name is_dir size mtime')
+
+def scan_directory(path):
+    """Yield a DirRecord per entry; directories need no stat call, files need one"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    yield DirRecord(entry.name, True, 0, None)
+                else:
+                    st = entry.stat()
+                    yield DirRecord(entry.name, False, st.st_size, st.st_mtime)
+            except OSError:
+                continue
+
+class DirectoryCache:
+    """LRU of parsed directory listings, valid while the directory's inode and mtime match"""
+    def __init__(self, max_bytes=32 * 2**20):
+        self.max_bytes = max_bytes
+        self.used = 0
+        self.entries = OrderedDict()
+        self.lock = Lock()
+    
+    def lookup(self, path):
+        """Return (stamp, records), with records None when the path must be rescanned"""
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        stamp = (st.st_dev, st.st_ino, st.st_mtime_ns)
+        with self.lock:
+            hit = self.entries.get(key)
+            if hit is not None and hit[0] == stamp:
+                self.entries.move_to_end(key)
+                return stamp, hit[1]
+        return stamp, None
+    
+    def store(self, path, stamp, records):
+        """Keep a listing under the stamp taken before it was scanned"""
+        key = os.path.abspath(path)
+        records = tuple(records)
+        size = sum(sys.getsizeof(record.name) for record in records) + 160 * len(records)
+        with self.lock:
+            self.discard(key)
+            if size <= self.max_bytes:
+                self.entries[key] = (stamp, records, size)
+                self.used += size
+            while self.used > self.max_bytes:
+                self.used -= self.entries.popitem(last=False)[1][2]
+        return records
+    
+    def invalidate(self, path):
+        with self.lock:
+            self.discard(os.path.abspath(path))
+    
+    def discard(self, key):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.used -= old[2]
+
+directory_cache = DirectoryCache()
+
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.xz', '.txz')
+ARCHIVE_ERRORS = (zipfile.BadZipFile, tarfile.TarError, EOFError, zlib.error) + ((lzma.LZMAError,) if lzma else ())
+
+def is_archive(name):
+    return name.lower().endswith(ARCHIVE_SUFFIXES)
+
+class ArchiveIndex:
+    """Folder tree of one archive, read from the zip central directory or the tar headers only"""
+    def __init__(self, path, stamp):
+        self.path = path
+        self.stamp = stamp
+        self.is_zip = path.lower().endswith('.zip')
+        self.folders = {'': {}}
+        self.members = {}
+    
+    def load(self):
+        """A plain tar is walked header to header; a compressed one is stream-decompressed end to end"""
+        if self.is_zip:
+            with zipfile.ZipFile(self.path) as archive:
+                for info in archive.infolist():
+                    self.add(info.filename, info.is_dir(), info.file_size,
+                             time.mktime(info.date_time + (0, 0, -1)), info)
+        else:
+            with tarfile.open(self.path, 'r:*') as archive:
+                for info in archive:
+                    # Links and device entries have no data of their own to show or copy
+                    if info.isdir() or info.isfile():
+                        self.add(info.name, info.isdir(), info.size, info.mtime, info)
+        return self
+    
+    def add(self, name, is_dir, size, mtime, info):
+        parts = [part for part in name.split('/') if part not in ('', '.')]
+        if not parts or '..' in parts:
+            return
+        inner = '/'.join(parts)
+        if is_dir:
+            self.add_folder(inner)
+        else:
+            parent = '/'.join(parts[:-1])
+            self.add_folder(parent)
+            self.folders[parent][parts[-1]] = DirRecord(parts[-1], False, size, mtime)
+            self.members[inner] = info
+    
+    def add_folder(self, inner):
+        """Zips often omit folder entries, so every member's parents are implied"""
+        if inner not in self.folders:
+            parent, _, name = inner.rpartition('/')
+            self.add_folder(parent)
+            self.folders[parent][name] = DirRecord(name, True, 0, None)
+            self.folders[inner] = {}
+    
+    def listdir(self, inner):
+        records = self.folders.get(inner)
+        if records is None:
+            raise FileNotFoundError(f"No folder '{inner}' in {os.path.basename(self.path)}")
+        return tuple(records.values())
+    
+    def stat(self, inner):
+        parent, _, name = inner.rpartition('/')
+        return self.folders[parent][name]
+    
+    def size(self, inner):
+        if inner in self.members:
+            return self.stat(inner).size
+        prefix = inner + '/' if inner else ''
+        return sum(self.stat(member).size for member in self.members if member.startswith(prefix))
+    
+    @contextmanager
+    def open(self, inner):
+        """Stream one member; in a .tar.gz or .tar.xz this re-decompresses everything before it"""
+        info = self.members.get(inner)
+        if info is None:
+            raise FileNotFoundError(f"No file '{inner}' in {os.path.basename(self.path)}")
+        if self.is_zip:
+            with zipfile.ZipFile(self.path) as archive, archive.open(info) as stream:
+                yield stream
+        else:
+            with tarfile.open(self.path, 'r:*') as archive:
+                try:
+                    stream = archive.extractfile(info)
+                except KeyError as e:
+                    raise OSError(f"Cannot open '{inner}': {e}") from e
+                if stream is None:
+                    raise OSError(f"'{inner}' is not a regular file")
+                with stream:
+                    yield stream
+    
+    def iter_open(self, prefix):
+        """Yield (inner, stream) for every file under prefix, opening the archive only once.
+        A tar is read front to back in stream order, so a folder copied out of a .tar.gz
+        costs one decompression pass instead of one per member"""
+        wanted = {inner: info for inner, info in self.members.items() if inner.startswith(prefix)}
+        if self.is_zip:
+            with zipfile.ZipFile(self.path) as archive:
+                for inner, info in wanted.items():
+                    with archive.open(info) as stream:
+                        yield inner, stream
+            return
+        with tarfile.open(self.path, 'r|*') as archive:
+            for info in archive:
+                if not wanted:
+                    break
+                inner = '/'.join(part for part in info.name.split('/') if part not in ('', '.'))
+                # A name stored twice is indexed from its last copy, so match on position too
+                if info.isfile() and inner in wanted and wanted[inner].offset == info.offset:
+                    del wanted[inner]
+                    with archive.extractfile(info) as stream:
+                        yield inner, stream
+
+class ArchiveCache:
+    """Indexes of recently browsed archives; paths inside one look like /home/me/backup.zip/photos"""
+    def __init__(self, max_archives=8):
+        self.max_archives = max_archives
+        self.indexes = OrderedDict()
+        self.lock = Lock()
+    
+    def split(self, path):
+        """Return (archive path, inner path) for a path inside an archive, else None"""
+        path = os.path.abspath(path)
+        inner = []
+        while not os.path.lexists(path):
+            parent, name = os.path.split(path)
+            if parent == path:
+                return None
+            inner.append(name)
+            path = parent
+        if not is_archive(path) or not os.path.isfile(path):
+            return None
+        return path, '/'.join(reversed(inner))
+    
+    def member(self, path):
+        """Like split, but the archive file itself counts as a plain file to copy or move"""
+        archived = self.split(path)
+        return archived if archived is not None and archived[1] else None
+    
+    def stamp(self, archive):
+        st = os.stat(archive)
+        return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+    
+    def peek(self, archive):
+        """The cached index if it is still current, without reading the archive"""
+        stamp = self.stamp(archive)
+        with self.lock:
+            hit = self.indexes.get(archive)
+            if hit is not None and hit.stamp == stamp:
+                self.indexes.move_to_end(archive)
+                return hit
+        return None
+    
+    def index(self, archive):
+        hit = self.peek(archive)
+        if hit is not None:
+            return hit
+        try:
+            index = ArchiveIndex(archive, self.stamp(archive)).load()
+        except ARCHIVE_ERRORS as e:
+            raise OSError(f"Cannot read {os.path.basename(archive)}: {e}") from e
+        with self.lock:
+            self.indexes[archive] = index
+            while len(self.indexes) > self.max_archives:
+                self.indexes.popitem(last=False)
+        return index
+
+archives = ArchiveCache()
+
+class VirtualList(tk.Frame):
+    """Canvas list that keeps only the visible rows plus an overscan band as items"""
+    def __init__(self, master, columns=None, row_height=22, overscan=10, font=('Arial', 11),
+                 bg='#1a1a3a', fg='white', select_bg='#00ffff', select_fg='#000033', header_bg='#2a2a4a',
+                 on_activate=None, on_heading=None):
+        super().__init__(master, bg=bg)
+        self.row_height = row_height
+        self.overscan = overscan
+        self.font = font
+        self.fg = fg
+        self.select_fg = select_fg
+        self.on_activate = on_activate
+        self.on_heading = on_heading
+        self.rows = []
+        self.render = self.default_render
+        self.top = 0
+        self.first = 0
+        self.slots = []
+        self.selected = None
+        char_width = max(1, tkfont.Font(root=self, font=font).measure('0'))
+        widths = [width for _, width in columns] if columns else [0]
+        self.offsets = [6 + sum(widths[:index]) for index in range(len(widths))]
+        # Characters that fit in each column but the last, so long names don't overlap
+        self.limits = [max(4, width // char_width - 1) for width in widths[:-1]] + [None]
+        if columns:
+            self.header = tk.Canvas(self, height=row_height + 4, bg=header_bg, highlightthickness=0)
+            self.header.pack(fill='x')
+            self.titles = [self.header.create_text(offset, (row_height + 4) // 2, text=title, anchor='w',
+                                                   font=(font[0], font[1], 'bold'), fill=fg)
+                           for offset, (title, _) in zip(self.offsets, columns)]
+            self.header.bind('<Button-1>', self.heading_click)
+        self.scrollbar = tk.Scrollbar(self, orient='vertical', command=self.yview)
+        self.scrollbar.pack(side='right', fill='y')
+        self.canvas = tk.Canvas(self, bg=bg, highlightthickness=0, takefocus=1)
+        self.canvas.pack(side='left', fill='both', expand=True)
+        self.highlight = self.canvas.create_rectangle(0, -2 * row_height, 0, -row_height,
+                                                      fill=select_bg, width=0, tags='row')
+        self.canvas.bind('<Configure>', self.resize)
+        self.canvas.bind('<Button-1>', self.click)
+        self.canvas.bind('<Double-Button-1>', self.double_click)
+        self.canvas.bind('<MouseWheel>', self.wheel)
+        self.canvas.bind('<Button-4>', self.wheel)
+        self.canvas.bind('<Button-5>', self.wheel)
+        for key in ('<Up>', '<Down>', '<Prior>', '<Next>', '<Home>', '<End>', '<Return>'):
+            self.canvas.bind(key, self.key)
+    
+    @staticmethod
+    def default_render(row):
+        return row if isinstance(row, tuple) else (row,)
+    
+    def set_rows(self, rows, render=None):
+        """rows only needs len() and indexing; render(row) returns the column strings"""
+        self.rows = rows
+        self.render = render or self.default_render
+        self.top = 0
+        self.selected = None
+        self.redraw()
+    
+    def extend(self, rows):
+        start = len(self.rows)
+        self.rows.extend(rows)
+        if start < self.first + len(self.slots):
+            self.redraw()
+        else:
+            self.update_scrollbar()
+    
+    def refresh(self):
+        self.redraw()
+    
+    def get(self, index):
+        return self.rows[index]
+    
+    def view_height(self):
+        return max(self.row_height, self.canvas.winfo_height())
+    
+    def content_height(self):
+        return len(self.rows) * self.row_height
+    
+    def resize(self, event):
+        needed = event.height // self.row_height + 2 + 2 * self.overscan
+        while len(self.slots) < needed:
+            self.slots.append([self.canvas.create_text(offset, 0, anchor='w', font=self.font,
+                                                       fill=self.fg, tags='row')
+                               for offset in self.offsets])
+        while len(self.slots) > needed:
+            self.canvas.delete(*self.slots.pop())
+        self.redraw()
+    
+    def redraw(self):
+        rh = self.row_height
+        self.top = max(0, min(self.top, self.content_height() - self.view_height()))
+        self.first = max(0, self.top // rh - self.overscan)
+        for slot, items in enumerate(self.slots):
+            index = self.first + slot
+            values = self.render(self.rows[index]) if index < len(self.rows) else ()
+            colour = self.select_fg if index == self.selected else self.fg
+            y = index * rh - self.top + rh // 2
+            for column, item in enumerate(items):
+                text = str(values[column]) if column < len(values) else ''
+                limit = self.limits[column]
+                if limit is not None and len(text) > limit:
+                    text = text[:limit - 1] + '…'
+                self.canvas.itemconfigure(item, text=text, fill=colour)
+                self.canvas.coords(item, self.offsets[column], y)
+        if self.selected is None:
+            self.canvas.coords(self.highlight, 0, -2 * rh, 0, -rh)
+        else:
+            y = self.selected * rh - self.top
+            self.canvas.coords(self.highlight, 0, y, self.canvas.winfo_width(), y + rh)
+        self.update_scrollbar()
+    
+    def scroll_to(self, top):
+        """Inside the pooled band the items just move; past it they are re-labelled"""
+        rh = self.row_height
+        top = max(0, min(int(top), self.content_height() - self.view_height()))
+        if top == self.top:
+            return
+        if self.first * rh <= top and top + self.view_height() <= (self.first + len(self.slots)) * rh:
+            self.canvas.move('row', 0, self.top - top)
+            self.top = top
+            self.update_scrollbar()
+        else:
+            self.top = top
+            self.redraw()
+    
+    def update_scrollbar(self):
+        total = self.content_height()
+        if total <= self.view_height():
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.top / total, (self.top + self.view_height()) / total)
+    
+    def yview(self, *args):
+        if args[0] == 'moveto':
+            self.scroll_to(float(args[1]) * self.content_height())
+        elif args[0] == 'scroll':
+            step = self.row_height if args[2] == 'units' else self.view_height() - self.row_height
+            self.scroll_to(self.top + int(args[1]) * step)
+    
+    def wheel(self, event):
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self.yview('scroll', -3, 'units')
+        else:
+            self.yview('scroll', 3, 'units')
+    
+    def click(self, event):
+        self.canvas.focus_set()
+        index = (event.y + self.top) // self.row_height
+        if index < len(self.rows):
+            self.select(index)
+    
+    def double_click(self, event):
+        self.click(event)
+        if self.selected is not None and self.on_activate is not None:
+            self.on_activate(self.selected)
+    
+    def key(self, event):
+        if not self.rows:
+            return 'break'
+        page = max(1, self.view_height() // self.row_height - 1)
+        current = -1 if self.selected is None else self.selected
+        if event.keysym == 'Return':
+            if self.selected is not None and self.on_activate is not None:
+                self.on_activate(self.selected)
+            return 'break'
+        target = {'Up': current - 1, 'Down': current + 1, 'Prior': current - page,
+                  'Next': current + page, 'Home': 0, 'End': len(self.rows) - 1}[event.keysym]
+        self.select(max(0, min(target, len(self.rows) - 1)))
+        return 'break'
+    
+    def select(self, index):
+        self.selected = index
+        y = index * self.row_height
+        if y < self.top:
+            self.top = y
+        elif y + self.row_height > self.top + self.view_height():
+            self.top = y + self.row_height - self.view_height()
+        self.redraw()
+        self.event_generate('<<RowSelect>>')
+    
+    def set_heading(self, column, text):
+        self.header.itemconfigure(self.titles[column], text=text)
+    
+    def heading_click(self, event):
+        if self.on_heading is None:
+            return
+        for column in range(len(self.offsets) - 1, -1, -1):
+            if event.x >= self.offsets[column]:
+                self.on_heading(column)
+                return
+
+def natural_key(name):
+    """Case-folded sort key that orders 'file2' before 'file10'"""
+    parts = re.split(r'(\d+)', name.casefold())
+    parts[1::2] = map(int, parts[1::2])
+    return parts
+
+def format_size(size):
+    for unit in ('B', 'KB', 'MB', 'GB', 'TB'):
+        if size < 1024 or unit == 'TB':
+            break
+        size /= 1024
+    return f"{size} B" if unit == 'B' else f"{size:.1f} {unit}"
+
+class OperationCancelled(Exception):
+    """Raised inside the file worker when a job is cancelled"""
+    pass
+
+class FileJob:
+    """One queued copy, move or delete, with pause/cancel and throughput figures"""
+    def __init__(self, kind, sources, target, policy, on_progress, on_done):
+        self.kind = kind
+        self.sources = list(sources)
+        self.target = target
+        self.policy = policy
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.total = 0
+        self.done = 0
+        self.rate = 0.0
+        self.current = ''
+        self.resumed = Event()
+        self.resumed.set()
+        self.cancelled = Event()
+        self.last_sample = (time.monotonic(), 0)
+    
+    @property
+    def paused(self):
+        return not self.resumed.is_set()
+    
+    @property
+    def eta(self):
+        return (self.total - self.done) / self.rate if self.rate > 0 else None
+    
+    def pause(self):
+        self.resumed.clear()
+    
+    def resume(self):
+        self.resumed.set()
+    
+    def cancel(self):
+        self.cancelled.set()
+        self.resumed.set()
+    
+    def checkpoint(self):
+        self.resumed.wait()
+        if self.cancelled.is_set():
+            raise OperationCancelled()
+
+class FileOperationQueue:
+    """Runs file jobs in order on one worker; progress is delivered on the Tk thread"""
+    CHUNK = 8 * 1024 * 1024
+    REPORT_INTERVAL = 0.2
+    
+    def __init__(self):
+        self.jobs = queue.Queue()
+        self.events = queue.Queue()
+        self.thread = None
+        self.root = None
+        self.outstanding = 0
+        self.polling = False
+        self.clipboard = ([], 'copy')
+    
+    def submit(self, root, kind, sources, target=None, policy='rename', on_progress=None, on_done=None):
+        """kind is 'copy', 'move' or 'delete'; policy settles name clashes: 'rename', 'overwrite' or 'skip'"""
+        job = FileJob(kind, sources, target, policy, on_progress, on_done)
+        # Poll from the application root; an after() on the submitting window dies with it
+        self.root = root.nametowidget('.')
+        self.outstanding += 1
+        self.jobs.put(job)
+        if self.thread is None:
+            self.thread = Thread(target=self.run, name='quantum-files', daemon=True)
+            self.thread.start()
+        if not self.polling:
+            self.polling = True
+            self.root.after(100, self.poll)
+        return job
+    
+    def poll(self):
+        while True:
+            try:
+                event, job, error = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if event == 'progress':
+                if job.on_progress is not None:
+                    job.on_progress(job)
+            else:
+                self.outstanding -= 1
+                if job.on_done is not None:
+                    job.on_done(job, error)
+        if self.outstanding > 0:
+            self.root.after(100, self.poll)
+        else:
+            self.polling = False
+    
+    def run(self):
+        while True:
+            job = self.jobs.get()
+            error = None
+            try:
+                job.checkpoint()
+                if job.kind == 'delete':
+                    for path in job.sources:
+                        self.remove(job, path)
+                else:
+                    job.total = sum(self.measure(path) for path in job.sources)
+                    for path in job.sources:
+                        self.transfer(job, path)
+            except OperationCancelled:
+                pass
+            except Exception as e:
+                # Anything escaping here would kill the worker and strand every queued job
+                error = e
+            self.events.put(('done', job, error))
+    
+    def measure(self, path):
+        archived = archives.member(path)
+        if archived is not None:
+            return archives.index(archived[0]).size(archived[1])
+        if os.path.isdir(path) and not os.path.islink(path):
+            total = 0
+            for folder, _, files in os.walk(path):
+                for name in files:
+                    try:
+                        total += os.lstat(os.path.join(folder, name)).st_size
+                    except OSError:
+                        continue
+            return total
+        return os.lstat(path).st_size
+    
+    def advance(self, job, count):
+        job.done += count
+        now = time.monotonic()
+        then, done_then = job.last_sample
+        if now - then >= self.REPORT_INTERVAL:
+            # Smooth the rate so the ETA doesn't jump with every chunk
+            rate = (job.done - done_then) / (now - then)
+            job.rate = rate if job.rate == 0 else 0.7 * job.rate + 0.3 * rate
+            job.last_sample = (now, job.done)
+            self.events.put(('progress', job, None))
+    
+    def transfer(self, job, source):
+        source = os.path.abspath(source)
+        target = os.path.join(job.target, os.path.basename(source))
+        archived = archives.member(source)
+        if os.path.isdir(source) and (job.target + os.sep).startswith(source + os.sep):
+            raise OSError(f"Cannot {job.kind} '{os.path.basename(source)}' into itself")
+        aside = None
+        if os.path.lexists(target):
+            same = archived is None and os.path.samefile(source, target)
+            if job.policy == 'skip' or (job.kind == 'move' and same):
+                job.total -= self.measure(source)
+                return
+            if job.policy == 'rename' or same:
+                target = self.free_name(target)
+            else:
+                aside = self.set_aside(source, archived, target)
+        job.current = os.path.basename(source)
+        try:
+            moved = self.place(job, source, archived, target)
+        except BaseException:
+            if aside is not None:
+                # Put the old folder back rather than leave half of the new one
+                shutil.rmtree(target, ignore_errors=True)
+                os.rename(aside, target)
+            raise
+        if aside is not None:
+            shutil.rmtree(aside, ignore_errors=True)
+        if job.kind == 'move' and not moved:
+            self.remove(job, source)
+    
+    def set_aside(self, source, archived, target):
+        """Overwrite: a file replaces a file and a folder replaces a folder, never merging into it"""
+        if archived is not None:
+            source_is_dir = archived[1] not in archives.index(archived[0]).members
+        else:
+            source_is_dir = os.path.isdir(source) and not os.path.islink(source)
+        target_is_dir = os.path.isdir(target) and not os.path.islink(target)
+        if source_is_dir != target_is_dir:
+            kinds = ('file', 'folder')
+            raise OSError(f"Cannot replace the {kinds[target_is_dir]} '{os.path.basename(target)}' "
+                          f"with a {kinds[source_is_dir]} of the same name")
+        if not target_is_dir:
+            return None
+        aside = self.free_name(target + '.old')
+        os.rename(target, aside)
+        return aside
+    
+    def place(self, job, source, archived, target):
+        """Copy or rename source to target; True when a rename already moved it"""
+        if archived is not None:
+            # Archives are read-only, so a member is only ever streamed out
+            self.extract_any(job, archives.index(archived[0]), archived[1], target)
+            return False
+        if job.kind == 'move' and os.lstat(source).st_dev == os.stat(job.target).st_dev:
+            # Same filesystem: a rename moves the data without touching it
+            size = self.measure(source)
+            os.replace(source, target)
+            self.advance(job, size)
+            return True
+        self.copy_any(job, source, target)
+        return False
+    
+    def free_name(self, path):
+        base, ext = os.path.splitext(path)
+        counter = 2
+        while os.path.lexists(f"{base} ({counter}){ext}"):
+            counter += 1
+        return f"{base} ({counter}){ext}"
+    
+    def copy_any(self, job, source, target):
+        job.checkpoint()
+        if os.path.islink(source):
+            if os.path.lexists(target):
+                os.remove(target)
+            os.symlink(os.readlink(source), target)
+            self.advance(job, os.lstat(source).st_size)
+        elif os.path.isdir(source):
+            os.makedirs(target, exist_ok=True)
+            with os.scandir(source) as entries:
+                for entry in entries:
+                    self.copy_any(job, entry.path, os.path.join(target, entry.name))
+            shutil.copystat(source, target)
+        else:
+            self.copy_file(job, source, target)
+    
+    def copy_file(self, job, source, target):
+        # Write beside the target and swap it in, so a cancelled or failed copy never leaves half a file
+        partial = target + '.partial'
+        try:
+            with open(source, 'rb') as src, open(partial, 'wb') as dst:
+                self.copy_data(job, src, dst)
+            shutil.copystat(source, partial)
+            os.replace(partial, target)
+        except BaseException:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+    
+    def extract_any(self, job, index, inner, target):
+        job.checkpoint()
+        if inner in index.members:
+            self.extract_file(job, index, inner, target)
+            return
+        index.listdir(inner)
+        prefix = inner + '/' if inner else ''
+        # Create every folder up front so empty ones come out too
+        for folder in index.folders:
+            if folder == inner or folder.startswith(prefix):
+                relative = folder[len(prefix):] if folder != inner else ''
+                os.makedirs(os.path.join(target, *relative.split('/')) if relative else target, exist_ok=True)
+        members = index.iter_open(prefix)
+        try:
+            for member, src in members:
+                job.current = os.path.basename(member)
+                self.write_member(job, index, member, src, os.path.join(target, *member[len(prefix):].split('/')))
+        except ARCHIVE_ERRORS as e:
+            raise OSError(f"Cannot extract {os.path.basename(inner) or 'archive'}: {e}") from e
+        finally:
+            members.close()
+    
+    def extract_file(self, job, index, inner, target):
+        try:
+            with index.open(inner) as src:
+                self.write_member(job, index, inner, src, target)
+        except ARCHIVE_ERRORS as e:
+            raise OSError(f"Cannot extract {os.path.basename(inner)}: {e}") from e
+    
+    def write_member(self, job, index, inner, src, target):
+        partial = target + '.partial'
+        try:
+            with open(partial, 'wb') as dst:
+                while True:
+                    job.checkpoint()
+                    chunk = src.read(self.CHUNK)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    self.advance(job, len(chunk))
+            mtime = index.stat(inner).mtime
+            os.utime(partial, (mtime, mtime))
+            os.replace(partial, target)
+        except BaseException:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+    
+    def copy_data(self, job, src, dst):
+        # copy_file_range and sendfile keep the bytes in the kernel; fall back to a reused buffer
+        infd, outfd = src.fileno(), dst.fileno()
+        copied = 0
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while True:
+                    job.checkpoint()
+                    sent = os.copy_file_range(infd, outfd, self.CHUNK)
+                    if sent == 0:
+                        return
+                    copied += sent
+                    self.advance(job, sent)
+            except OSError as e:
+                if copied or e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM):
+                    raise
+        if sys.platform.startswith('linux') and hasattr(os, 'sendfile'):
+            try:
+                while True:
+                    job.checkpoint()
+                    sent = os.sendfile(outfd, infd, copied, self.CHUNK)
+                    if sent == 0:
+                        return
+                    copied += sent
+                    self.advance(job, sent)
+            except OSError as e:
+                if copied or e.errno not in (errno.ENOSYS, errno.EINVAL):
+                    raise
+        buffer = bytearray(self.CHUNK)
+        view = memoryview(buffer)
+        while True:
+            job.checkpoint()
+            count = src.readinto(buffer)
+            if not count:
+                return
+            dst.write(view[:count])
+            self.advance(job, count)
+    
+    def remove(self, job, path):
+        job.checkpoint()
+        job.current = os.path.basename(path)
+        if os.path.isdir(path) and not os.path.islink(path):
+            with os.scandir(path) as entries:
+                for entry in list(entries):
+                    self.remove(job, entry.path)
+            os.rmdir(path)
+        else:
+            os.remove(path)
+        self.advance(job, 0)
+
+file_operations = FileOperationQueue()
+
 class EnhancedWindow:
     """Enhanced window base class with better design"""
     def __init__(self, master, title, width=None, height=None):
@@ -409,6 +1563,9 @@ class ModernBootScreen:
         self.boot_frame = tk.Frame(master, bg='#000010')
         self.boot_frame.pack(fill='both', expand=True)
         
+        # Disk-backed subsystems start once the first frame is on screen
+        self.master.after_idle(security_manager.warm_up)
+        
         self.animate_boot_start()
         
     def animate_boot_start(self):
@@ -587,6 +1744,10 @@ class ModernDesktop:
         self.desktop_frame = tk.Frame(master, bg='#0a0a20')
         self.desktop_frame.pack(fill='both', expand=True)
         
+        activity_tracker.attach(master)
+        activity_tracker.register('wallpaper', 100, 5000)
+        activity_tracker.register('taskbar_info', 1000, 10000)
+        
         self.setup_enhanced_desktop()
         self.animate_desktop_appear()
         
@@ -698,7 +1859,7 @@ class ModernDesktop:
                                          font=('Arial', 12, 'bold'),
                                          fill='#00ffff', tags='wallpaper')
         
-        self.master.after(100, self.draw_enhanced_wallpaper)
+        activity_tracker.schedule('wallpaper', self.master, self.draw_enhanced_wallpaper)
     
     def create_enhanced_taskbar(self):
         self.taskbar = tk.Frame(self.master, bg='#1a1a3a', height=70)
@@ -757,7 +1918,7 @@ class ModernDesktop:
         statuses = ["OPTIMAL", "STABLE", "PERFORMANCE"]
         self.system_status.config(text=random.choice(statuses))
         
-        self.master.after(1000, self.update_enhanced_info)
+        activity_tracker.schedule('taskbar_info', self.master, self.update_enhanced_info)
     
     def create_enhanced_apps(self):
         app_container = tk.Frame(self.desktop_frame, bg='', bd=0)
@@ -1481,9 +2642,20 @@ Note: This is a demonstration interface. Actual web browsing functionality would
         messagebox.showinfo("Browser", f"Navigating to: {url}")
 
 class EnhancedFileManager(EnhancedWindow):
+    PARENT = DirRecord('..', True, 0, None)
+    COLUMNS = [('Name', 200), ('Size', 80), ('Type', 100), ('Modified', 120)]
+    
     def __init__(self, master):
         super().__init__(master, "File Manager", 550, 450)
+        self.current_path = os.path.expanduser("~")
+        self.records = ()
+        self.sort_keys = {}
+        self.order = []
+        self.sort_column = 0
+        self.sort_reverse = False
+        self.pending_archive = None
         self.setup_file_manager()
+        self.load_directory(self.current_path)
     
     def setup_file_manager(self):
         toolbar = tk.Frame(self.content, bg='#2a2a4a', height=40)
@@ -1504,65 +2676,297 @@ class EnhancedFileManager(EnhancedWindow):
                           font=('Arial', 10), bg='#00ffff', fg='#000033')
             btn.pack(side='left', padx=5, pady=5)
         
+        filter_frame = tk.Frame(self.content, bg='#2a2a4a')
+        filter_frame.pack(fill='x', padx=10)
+        tk.Label(filter_frame, text="Filter:", font=('Arial', 10),
+                bg='#2a2a4a', fg='#8888ff').pack(side='left', padx=5)
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add('write', lambda *args: self.apply_filter())
+        tk.Entry(filter_frame, textvariable=self.filter_var, font=('Arial', 10),
+                bg='#1a1a3a', fg='white', insertbackground='white').pack(side='left', fill='x', expand=True, padx=5, pady=5)
+        
         list_frame = tk.Frame(self.content, bg='#1a1a3a')
         list_frame.pack(fill='both', expand=True, padx=10, pady=10)
         
-        columns = ('name', 'size', 'type', 'modified')
-        self.tree = ttk.Treeview(list_frame, columns=columns, show='tree headings')
-        
-        self.tree.heading('name', text='Name')
-        self.tree.heading('size', text='Size')
-        self.tree.heading('type', text='Type')
-        self.tree.heading('modified', text='Modified')
-        
-        self.tree.column('name', width=200)
-        self.tree.column('size', width=80)
-        self.tree.column('type', width=100)
-        self.tree.column('modified', width=120)
-        
-        sample_files = [
-            ('document.txt', '1.2 KB', 'Text File', '2024-01-15 10:30'),
-            ('image.png', '2.3 MB', 'Image', '2024-01-14 15:45'),
-            ('music.mp3', '4.5 MB', 'Audio', '2024-01-13 09:20'),
-            ('data.xlsx', '356 KB', 'Spreadsheet', '2024-01-12 14:15'),
-            ('script.py', '15 KB', 'Python File', '2024-01-11 11:00')
-        ]
-        
-        for file in sample_files:
-            self.tree.insert('', 'end', values=file)
-        
-        scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.tree.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
-        
-        status = tk.Label(self.content, text="5 items", 
-                         font=('Arial', 10),
-                         bg='#2a2a4a', fg='#8888ff')
-        status.pack(fill='x', side='bottom')
+        self.file_list = VirtualList(list_frame, columns=self.COLUMNS, on_activate=self.open_item,
+                                     on_heading=self.sort_by)
+        self.file_list.pack(fill='both', expand=True)
+        self.file_list.set_heading(0, "Name \u25b2")
+        
+        self.status = tk.Label(self.content, text="", 
+                              font=('Arial', 10),
+                              bg='#2a2a4a', fg='#8888ff')
+        self.status.pack(fill='x', side='bottom')
+        
+        self.jobs = []
+        self.job_frame = tk.Frame(self.content, bg='#2a2a4a')
+        self.job_bar = ttk.Progressbar(self.job_frame, maximum=1000)
+        self.job_bar.pack(side='left', fill='x', expand=True, padx=5, pady=5)
+        self.pause_btn = tk.Button(self.job_frame, text="Pause", command=self.toggle_pause,
+                                   font=('Arial', 9), bg='#00ffff', fg='#000033')
+        self.pause_btn.pack(side='left', padx=2)
+        tk.Button(self.job_frame, text="Cancel", command=self.cancel_job,
+                 font=('Arial', 9), bg='#ff4444', fg='white').pack(side='left', padx=2)
+        self.window.bind('<Destroy>', self.release_job, add='+')
+    
+    def load_directory(self, path):
+        self.pending_archive = None
+        try:
+            archived = archives.split(path)
+            if archived is None:
+                stamp, records = directory_cache.lookup(path)
+                if records is None:
+                    records = directory_cache.store(path, stamp, scan_directory(path))
+            else:
+                index = archives.peek(archived[0])
+                if index is None:
+                    self.read_archive(path, archived[0])
+                    return
+                records = index.listdir(archived[1])
+        except OSError as e:
+            messagebox.showerror("File Manager", f"Cannot open {path}: {e}")
+            return
+        self.current_path = path
+        self.records = records
+        self.sort_keys = {}
+        self.apply_sort()
+    
+    def sort_key(self, column):
+        """Per-record keys for a column, built once per listing and reused on every header click"""
+        keys = self.sort_keys.get(column)
+        if keys is None:
+            records = self.records
+            if column == 'folded':
+                keys = [record.name.casefold() for record in records]
+            elif column == 0:
+                keys = [natural_key(record.name) for record in records]
+            elif column == 2:
+                names = self.sort_key(0)
+                keys = [(os.path.splitext(record.name)[1].casefold(), names[index])
+                        for index, record in enumerate(records)]
+            else:
+                # Folders carry no size or time and are sorted apart from files, so they keep name order
+                names = self.sort_key(0)
+                field = 2 if column == 1 else 3
+                keys = [names[index] if record.is_dir else record[field]
+                        for index, record in enumerate(records)]
+            self.sort_keys[column] = keys
+        return keys
+    
+    def apply_sort(self):
+        keys = self.sort_key(self.sort_column).__getitem__
+        folders = [index for index, record in enumerate(self.records) if record.is_dir]
+        files = [index for index, record in enumerate(self.records) if not record.is_dir]
+        self.order = (sorted(folders, key=keys, reverse=self.sort_reverse)
+                      + sorted(files, key=keys, reverse=self.sort_reverse))
+        self.apply_filter()
+    
+    def apply_filter(self):
+        needle = self.filter_var.get().casefold()
+        order = self.order
+        if needle:
+            names = self.sort_key('folded')
+            order = [index for index in order if needle in names[index]]
+        records = self.records
+        path = self.current_path
+        rows = [self.PARENT] if not needle and path != os.path.dirname(path) else []
+        rows.extend([records[index] for index in order])
+        self.file_list.set_rows(rows, render=self.describe)
+        shown = f"{len(order)} of {len(records)}" if needle else f"{len(records)}"
+        self.status.config(text=f"{shown} items  |  {path}")
+    
+    def sort_by(self, column):
+        if column == self.sort_column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.file_list.set_heading(self.sort_column, self.COLUMNS[self.sort_column][0])
+            self.sort_column = column
+            self.sort_reverse = False
+        arrow = "\u25bc" if self.sort_reverse else "\u25b2"
+        self.file_list.set_heading(column, f"{self.COLUMNS[column][0]} {arrow}")
+        self.apply_sort()
+    
+    def describe(self, record):
+        if record.is_dir:
+            return (record.name, '', 'Folder', '')
+        ext = os.path.splitext(record.name)[1][1:].upper()
+        modified = datetime.fromtimestamp(record.mtime).strftime('%Y-%m-%d %H:%M')
+        return (record.name, format_size(record.size), f"{ext} File" if ext else 'File', modified)
+    
+    def read_archive(self, path, archive):
+        """Index an archive off the Tk thread; a compressed tar has to be read end to end"""
+        self.pending_archive = path
+        self.status.config(text=f"Reading {os.path.basename(archive)}...")
+        result = []
+        
+        def index():
+            try:
+                archives.index(archive)
+                result.append(None)
+            except OSError as e:
+                result.append(e)
+        
+        worker = Thread(target=index, name='quantum-archive', daemon=True)
+        worker.start()
+        self.window.after(100, self.wait_for_archive, worker, result, path)
+    
+    def wait_for_archive(self, worker, result, path):
+        if not self.window.winfo_exists() or self.pending_archive != path:
+            return
+        if worker.is_alive():
+            self.window.after(100, self.wait_for_archive, worker, result, path)
+        elif result[0] is not None:
+            self.pending_archive = None
+            self.status.config(text=f"{len(self.records)} items  |  {self.current_path}")
+            messagebox.showerror("File Manager", str(result[0]))
+        else:
+            self.load_directory(path)
+    
+    def open_item(self, index):
+        record = self.file_list.get(index)
+        if record is self.PARENT:
+            self.load_directory(os.path.dirname(self.current_path))
+        elif record.is_dir or (is_archive(record.name) and archives.split(self.current_path) is None):
+            self.load_directory(os.path.join(self.current_path, record.name))
+    
+    def read_only(self):
+        """Archives are browsed in place and never rewritten"""
+        if archives.split(self.current_path) is None:
+            return False
+        messagebox.showinfo("File Manager", "Archives are read-only; copy items out of them instead")
+        return True
     
     def new_folder(self):
+        if self.read_only():
+            return
         name = simpledialog.askstring("New Folder", "Enter folder name:")
         if name:
             messagebox.showinfo("File Manager", f"Created folder: {name}")
     
     def new_file(self):
+        if self.read_only():
+            return
         name = simpledialog.askstring("New File", "Enter file name:")
         if name:
             messagebox.showinfo("File Manager", f"Created file: {name}")
     
-    def delete_file(self):
-        messagebox.showinfo("File Manager", "Delete file clicked")
+    def selected_records(self):
+        if self.file_list.selected is None:
+            return []
+        record = self.file_list.get(self.file_list.selected)
+        return [] if record is self.PARENT else [record]
+    
+    def selected_paths(self):
+        return [os.path.join(self.current_path, record.name) for record in self.selected_records()]
     
     def copy_file(self):
-        messagebox.showinfo("File Manager", "Copy file clicked")
+        self.set_clipboard('copy', "Copied")
     
     def cut_file(self):
-        messagebox.showinfo("File Manager", "Cut file clicked")
+        if not self.read_only():
+            self.set_clipboard('move', "Cut")
+    
+    def set_clipboard(self, kind, verb):
+        paths = self.selected_paths()
+        if not paths:
+            messagebox.showinfo("File Manager", "Select a file or folder first")
+            return
+        file_operations.clipboard = (paths, kind)
+        self.status.config(text=f"{verb} {len(paths)} item(s)")
     
     def paste_file(self):
-        messagebox.showinfo("File Manager", "Paste file clicked")
+        paths, kind = file_operations.clipboard
+        if self.read_only():
+            return
+        if not paths:
+            messagebox.showinfo("File Manager", "Nothing to paste")
+            return
+        policy = 'rename'
+        clashes = [path for path in paths
+                   if os.path.dirname(os.path.abspath(path)) != os.path.abspath(self.current_path)
+                   and os.path.lexists(os.path.join(self.current_path, os.path.basename(path)))]
+        if clashes:
+            answer = messagebox.askyesnocancel(
+                "Paste", f"{len(clashes)} item(s) already exist here.\n\n"
+                         "Yes: replace them\nNo: keep both\nCancel: skip them")
+            policy = {True: 'overwrite', False: 'rename', None: 'skip'}[answer]
+        if kind == 'move':
+            file_operations.clipboard = ([], 'copy')
+        self.start_job(kind, paths, policy)
+    
+    def delete_file(self):
+        if self.read_only():
+            return
+        paths = self.selected_paths()
+        if not paths:
+            messagebox.showinfo("File Manager", "Select a file or folder first")
+            return
+        names = ", ".join(os.path.basename(path) for path in paths[:3])
+        if len(paths) > 3:
+            names += f" and {len(paths) - 3} more"
+        if messagebox.askyesno("Delete", f"Permanently delete {names}?"):
+            self.start_job('delete', paths)
+    
+    def start_job(self, kind, paths, policy='rename'):
+        """Queue a job; the strip's Pause and Cancel act on all of this window's jobs"""
+        job = file_operations.submit(self.window, kind, paths, self.current_path, policy,
+                                     on_progress=self.show_job, on_done=self.finish_job)
+        if any(queued.paused for queued in self.jobs):
+            job.pause()
+        self.jobs.append(job)
+        if len(self.jobs) == 1:
+            self.job_bar['value'] = 0
+            self.pause_btn.config(text="Pause")
+            self.job_frame.pack(fill='x', side='bottom', padx=10)
+    
+    def show_job(self, job):
+        if job not in self.jobs or not self.window.winfo_exists():
+            return
+        verb = {'copy': "Copying", 'move': "Moving", 'delete': "Deleting"}[job.kind]
+        text = f"{verb} {job.current}"
+        if job.total:
+            self.job_bar['value'] = job.done * 1000 // job.total
+            text += f"  {format_size(job.done)} of {format_size(job.total)}  {format_size(job.rate)}/s"
+            if job.eta is not None:
+                text += f"  ETA {job.eta:.0f}s"
+        if len(self.jobs) > 1:
+            text += f"  (+{len(self.jobs) - 1} queued)"
+        self.status.config(text=text)
+    
+    def toggle_pause(self):
+        if not self.jobs:
+            return
+        if any(job.paused for job in self.jobs):
+            for job in self.jobs:
+                job.resume()
+            self.pause_btn.config(text="Pause")
+        else:
+            for job in self.jobs:
+                job.pause()
+            self.pause_btn.config(text="Resume")
+    
+    def cancel_job(self):
+        for job in self.jobs:
+            job.cancel()
+    
+    def release_job(self, event):
+        # A paused job would hold up every queued job once its window is gone
+        if event.widget is self.window:
+            for job in self.jobs:
+                job.resume()
+    
+    def finish_job(self, job, error):
+        if job in self.jobs:
+            self.jobs.remove(job)
+        if not self.window.winfo_exists():
+            return
+        if not self.jobs:
+            self.job_frame.pack_forget()
+        self.load_directory(self.current_path)
+        if error is not None:
+            messagebox.showerror("File Manager", str(error))
+        elif job.cancelled.is_set():
+            self.status.config(text="Operation cancelled")
 
 class EnhancedSystemInfo(EnhancedWindow):
     def __init__(self, master):
@@ -1676,6 +3080,7 @@ class EnhancedSettings(EnhancedWindow):
         tk.Label(panel, text=title, font=('Arial', 18, 'bold'),
                 bg='#1a1a3a', fg='#00ffff').pack(pady=20)
         
+        choices = {}
         for setting_name, options in settings:
             frame = tk.Frame(panel, bg='#1a1a3a')
             frame.pack(fill='x', padx=30, pady=10)
@@ -1683,14 +3088,22 @@ class EnhancedSettings(EnhancedWindow):
             tk.Label(frame, text=setting_name, font=('Arial', 11, 'bold'),
                     bg='#1a1a3a', fg='white').pack(anchor='w')
             
-            var = tk.StringVar(value=options[0])
+            key = f"{title} {setting_name}".lower().replace(' ', '_').replace('-', '_')
+            var = tk.StringVar(value=system_config.get(key, options[0]))
             dropdown = ttk.Combobox(frame, textvariable=var, values=options,
                                   state='readonly', font=('Arial', 10))
             dropdown.pack(fill='x', pady=5)
+            dropdown.bind('<<ComboboxSelected>>',
+                          lambda e, key=key, var=var: system_config.set(key, var.get()))
+            choices[key] = var
         
         tk.Button(panel, text="Apply Settings", 
-                 command=lambda: messagebox.showinfo("Settings", "Settings applied successfully!"),
+                 command=lambda: self.apply_settings(choices),
                  bg='#00ffff', fg='#000033', font=('Arial', 12)).pack(pady=20)
+    
+    def apply_settings(self, choices):
+        system_config.update({key: var.get() for key, var in choices.items()})
+        messagebox.showinfo("Settings", "Settings applied successfully!")
 
 class EnhancedAppMenu(EnhancedWindow):
     """Enhanced application menu with categories"""
@@ -1855,6 +3268,7 @@ class EnhancedPowerMenu(EnhancedWindow):
     def sleep_system(self):
         messagebox.showinfo("Sleep", "System going to sleep!")
         self.enhanced_animate_close()
+        activity_tracker.set_screensaver(True)
     
     def lock_system(self):
         messagebox.showinfo("Lock", "System locked!")
@@ -1926,4 +3340,8 @@ if __name__ == "__main__":
     root.resizable(False, False)
     
     ModernBootScreen(root)
-    root.mainloop()
\ No newline at end of file
+    try:
+        root.mainloop()
+    finally:
+        system_config.flush()
+        security_manager.close()
\ No newline at end of file
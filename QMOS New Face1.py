@@ -6,8 +6,15 @@ import os
 import math
 import random
 import json
+import re
 from datetime import datetime
 import sys
+import threading
+import queue
+import shutil
+import errno
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 # Mobile configuration
 MOBILE_WIDTH = 800
@@ -132,6 +139,439 @@ class WindowManager:
 
 window_manager = WindowManager()
 
+class TaskCancelled(Exception):
+    """Raised inside a worker when its task has been cancelled"""
+    pass
+
+class CancellationToken:
+    """Cooperative cancellation flag shared with a background task"""
+    def __init__(self):
+        self.event = threading.Event()
+        self.future = None
+        self.in_process = False
+    
+    @property
+    def cancelled(self):
+        return self.event.is_set()
+    
+    def cancel(self):
+        self.event.set()
+        if self.future is not None:
+            self.future.cancel()
+    
+    def check(self):
+        if self.event.is_set():
+            raise TaskCancelled()
+
+class TaskPool:
+    """Shared executor: threads for I/O, processes for CPU, callbacks on the Tk thread"""
+    def __init__(self, io_workers=4, cpu_workers=2):
+        self.root = None
+        self.io_workers = io_workers
+        self.cpu_workers = cpu_workers
+        self.io_pool = None
+        self.cpu_pool = None
+        self.events = queue.Queue()
+        self.active = set()
+        self.owners = {}
+        self.polling = False
+    
+    def attach(self, root):
+        self.root = root
+    
+    def submit_io(self, func, *args, owner=None, on_done=None, on_error=None, on_progress=None):
+        """Run func(token, progress, *args) on a worker thread"""
+        if self.io_pool is None:
+            self.io_pool = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix='quantum-io')
+        token = CancellationToken()
+        
+        def progress(value):
+            if on_progress is not None and not token.cancelled:
+                self.events.put(('progress', token, on_progress, value))
+        
+        def run():
+            token.check()
+            return func(token, progress, *args)
+        
+        token.future = self.io_pool.submit(run)
+        self.track(token, owner, on_done, on_error)
+        return token
+    
+    def submit_cpu(self, func, *args, owner=None, on_done=None, on_error=None):
+        """Run func(*args) in a worker process (func and args must be picklable)"""
+        if self.cpu_pool is None:
+            self.cpu_pool = ProcessPoolExecutor(max_workers=self.cpu_workers)
+        token = CancellationToken()
+        token.in_process = True
+        token.future = self.cpu_pool.submit(func, *args)
+        self.track(token, owner, on_done, on_error)
+        return token
+    
+    def track(self, token, owner, on_done, on_error):
+        self.active.add(token)
+        if owner is not None:
+            if owner not in self.owners:
+                self.owners[owner] = set()
+                owner.bind('<Destroy>', lambda e, o=owner: e.widget is o and self.cancel_owner(o), add='+')
+            self.owners[owner].add(token)
+        token.future.add_done_callback(lambda f: self.events.put(('done', token, on_done, on_error, f)))
+        if not self.polling:
+            self.polling = True
+            (self.root or tk._default_root).after(15, self.poll)
+    
+    def poll(self):
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] == 'progress':
+                _, token, on_progress, value = event
+                if not token.cancelled:
+                    on_progress(value)
+            else:
+                self.finish(*event[1:])
+        if self.active:
+            (self.root or tk._default_root).after(15, self.poll)
+        else:
+            self.polling = False
+    
+    def finish(self, token, on_done, on_error, future):
+        self.active.discard(token)
+        for tokens in self.owners.values():
+            tokens.discard(token)
+        if token.cancelled or future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            if on_done is not None:
+                on_done(future.result())
+        elif isinstance(error, TaskCancelled):
+            return
+        elif on_error is not None:
+            on_error(error)
+        else:
+            messagebox.showerror("Background Task", f"Task failed: {error}")
+    
+    def cancel(self, token):
+        running = token.future is not None and token.future.running()
+        token.cancel()
+        if token.in_process and running:
+            self.recycle_cpu_pool()
+    
+    def cancel_owner(self, owner):
+        for token in list(self.owners.pop(owner, ())):
+            self.cancel(token)
+    
+    def recycle_cpu_pool(self):
+        """A running process can't be interrupted, so replace the pool and stop its workers"""
+        pool, self.cpu_pool = self.cpu_pool, None
+        if pool is None:
+            return
+        processes = list((getattr(pool, '_processes', None) or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+    
+    def shutdown(self):
+        for token in list(self.active):
+            token.cancel()
+        if self.io_pool is not None:
+            self.io_pool.shutdown(wait=False, cancel_futures=True)
+        self.recycle_cpu_pool()
+
+task_pool = TaskPool()
+
+def natural_key(name):
+    """Case-folded sort key that orders 'file2' before 'file10'"""
+    parts = re.split(r'(\d+)', name.casefold())
+    parts[1::2] = map(int, parts[1::2])
+    return parts
+
+def format_size(size):
+    for unit in ('B', 'KB', 'MB', 'GB', 'TB'):
+        if size < 1024 or unit == 'TB':
+            break
+        size /= 1024
+    return f"{size} B" if unit == 'B' else f"{size:.1f} {unit}"
+
+class OperationCancelled(Exception):
+    """Raised inside the file worker when a job is cancelled"""
+    pass
+
+class FileJob:
+    """One queued copy, move or delete, with pause/cancel and throughput figures"""
+    def __init__(self, kind, sources, target, policy, on_progress, on_done):
+        self.kind = kind
+        self.sources = list(sources)
+        self.target = target
+        self.policy = policy
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.total = 0
+        self.done = 0
+        self.rate = 0.0
+        self.current = ''
+        self.resumed = threading.Event()
+        self.resumed.set()
+        self.cancelled = threading.Event()
+        self.last_sample = (time.monotonic(), 0)
+    
+    @property
+    def paused(self):
+        return not self.resumed.is_set()
+    
+    @property
+    def eta(self):
+        return (self.total - self.done) / self.rate if self.rate > 0 else None
+    
+    def pause(self):
+        self.resumed.clear()
+    
+    def resume(self):
+        self.resumed.set()
+    
+    def cancel(self):
+        self.cancelled.set()
+        self.resumed.set()
+    
+    def checkpoint(self):
+        self.resumed.wait()
+        if self.cancelled.is_set():
+            raise OperationCancelled()
+
+class FileOperationQueue:
+    """Runs file jobs in order on one worker; progress is delivered on the Tk thread"""
+    CHUNK = 8 * 1024 * 1024
+    REPORT_INTERVAL = 0.2
+    
+    def __init__(self):
+        self.jobs = queue.Queue()
+        self.events = queue.Queue()
+        self.thread = None
+        self.root = None
+        self.outstanding = 0
+        self.polling = False
+        self.clipboard = ([], 'copy')
+    
+    def submit(self, root, kind, sources, target=None, policy='rename', on_progress=None, on_done=None):
+        """kind is 'copy', 'move' or 'delete'; policy settles name clashes: 'rename', 'overwrite' or 'skip'"""
+        job = FileJob(kind, sources, target, policy, on_progress, on_done)
+        # Poll from the application root; an after() on the submitting window dies with it
+        self.root = root.nametowidget('.')
+        self.outstanding += 1
+        self.jobs.put(job)
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name='quantum-files', daemon=True)
+            self.thread.start()
+        if not self.polling:
+            self.polling = True
+            self.root.after(100, self.poll)
+        return job
+    
+    def poll(self):
+        while True:
+            try:
+                event, job, error = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if event == 'progress':
+                if job.on_progress is not None:
+                    job.on_progress(job)
+            else:
+                self.outstanding -= 1
+                if job.on_done is not None:
+                    job.on_done(job, error)
+        if self.outstanding > 0:
+            self.root.after(100, self.poll)
+        else:
+            self.polling = False
+    
+    def run(self):
+        while True:
+            job = self.jobs.get()
+            error = None
+            try:
+                job.checkpoint()
+                if job.kind == 'delete':
+                    for path in job.sources:
+                        self.remove(job, path)
+                else:
+                    job.total = sum(self.measure(path) for path in job.sources)
+                    for path in job.sources:
+                        self.transfer(job, path)
+            except OperationCancelled:
+                pass
+            except Exception as e:
+                # Anything escaping here would kill the worker and strand every queued job
+                error = e
+            self.events.put(('done', job, error))
+    
+    def measure(self, path):
+        if os.path.isdir(path) and not os.path.islink(path):
+            total = 0
+            for folder, _, files in os.walk(path):
+                for name in files:
+                    try:
+                        total += os.lstat(os.path.join(folder, name)).st_size
+                    except OSError:
+                        continue
+            return total
+        return os.lstat(path).st_size
+    
+    def advance(self, job, count):
+        job.done += count
+        now = time.monotonic()
+        then, done_then = job.last_sample
+        if now - then >= self.REPORT_INTERVAL:
+            # Smooth the rate so the ETA doesn't jump with every chunk
+            rate = (job.done - done_then) / (now - then)
+            job.rate = rate if job.rate == 0 else 0.7 * job.rate + 0.3 * rate
+            job.last_sample = (now, job.done)
+            self.events.put(('progress', job, None))
+    
+    def transfer(self, job, source):
+        source = os.path.abspath(source)
+        target = os.path.join(job.target, os.path.basename(source))
+        if os.path.isdir(source) and (job.target + os.sep).startswith(source + os.sep):
+            raise OSError(f"Cannot {job.kind} '{os.path.basename(source)}' into itself")
+        aside = None
+        if os.path.lexists(target):
+            same = os.path.samefile(source, target)
+            if job.policy == 'skip' or (job.kind == 'move' and same):
+                job.total -= self.measure(source)
+                return
+            if job.policy == 'rename' or same:
+                target = self.free_name(target)
+            else:
+                aside = self.set_aside(source, target)
+        job.current = os.path.basename(source)
+        try:
+            moved = self.place(job, source, target)
+        except BaseException:
+            if aside is not None:
+                # Put the old folder back rather than leave half of the new one
+                shutil.rmtree(target, ignore_errors=True)
+                os.rename(aside, target)
+            raise
+        if aside is not None:
+            shutil.rmtree(aside, ignore_errors=True)
+        if job.kind == 'move' and not moved:
+            self.remove(job, source)
+    
+    def set_aside(self, source, target):
+        """Overwrite: a file replaces a file and a folder replaces a folder, never merging into it"""
+        source_is_dir = os.path.isdir(source) and not os.path.islink(source)
+        target_is_dir = os.path.isdir(target) and not os.path.islink(target)
+        if source_is_dir != target_is_dir:
+            kinds = ('file', 'folder')
+            raise OSError(f"Cannot replace the {kinds[target_is_dir]} '{os.path.basename(target)}' "
+                          f"with a {kinds[source_is_dir]} of the same name")
+        if not target_is_dir:
+            return None
+        aside = self.free_name(target + '.old')
+        os.rename(target, aside)
+        return aside
+    
+    def place(self, job, source, target):
+        """Copy or rename source to target; True when a rename already moved it"""
+        if job.kind == 'move' and os.lstat(source).st_dev == os.stat(job.target).st_dev:
+            # Same filesystem: a rename moves the data without touching it
+            size = self.measure(source)
+            os.replace(source, target)
+            self.advance(job, size)
+            return True
+        self.copy_any(job, source, target)
+        return False
+    
+    def free_name(self, path):
+        base, ext = os.path.splitext(path)
+        counter = 2
+        while os.path.lexists(f"{base} ({counter}){ext}"):
+            counter += 1
+        return f"{base} ({counter}){ext}"
+    
+    def copy_any(self, job, source, target):
+        job.checkpoint()
+        if os.path.islink(source):
+            if os.path.lexists(target):
+                os.remove(target)
+            os.symlink(os.readlink(source), target)
+            self.advance(job, os.lstat(source).st_size)
+        elif os.path.isdir(source):
+            os.makedirs(target, exist_ok=True)
+            with os.scandir(source) as entries:
+                for entry in entries:
+                    self.copy_any(job, entry.path, os.path.join(target, entry.name))
+            shutil.copystat(source, target)
+        else:
+            self.copy_file(job, source, target)
+    
+    def copy_file(self, job, source, target):
+        # Write beside the target and swap it in, so a cancelled or failed copy never leaves half a file
+        partial = target + '.partial'
+        try:
+            with open(source, 'rb') as src, open(partial, 'wb') as dst:
+                self.copy_data(job, src, dst)
+            shutil.copystat(source, partial)
+            os.replace(partial, target)
+        except BaseException:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+    
+    def copy_data(self, job, src, dst):
+        # copy_file_range and sendfile keep the bytes in the kernel; fall back to a reused buffer
+        infd, outfd = src.fileno(), dst.fileno()
+        copied = 0
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while True:
+                    job.checkpoint()
+                    sent = os.copy_file_range(infd, outfd, self.CHUNK)
+                    if sent == 0:
+                        return
+                    copied += sent
+                    self.advance(job, sent)
+            except OSError as e:
+                if copied or e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM):
+                    raise
+        if sys.platform.startswith('linux') and hasattr(os, 'sendfile'):
+            try:
+                while True:
+                    job.checkpoint()
+                    sent = os.sendfile(outfd, infd, copied, self.CHUNK)
+                    if sent == 0:
+                        return
+                    copied += sent
+                    self.advance(job, sent)
+            except OSError as e:
+                if copied or e.errno not in (errno.ENOSYS, errno.EINVAL):
+                    raise
+        buffer = bytearray(self.CHUNK)
+        view = memoryview(buffer)
+        while True:
+            job.checkpoint()
+            count = src.readinto(buffer)
+            if not count:
+                return
+            dst.write(view[:count])
+            self.advance(job, count)
+    
+    def remove(self, job, path):
+        job.checkpoint()
+        job.current = os.path.basename(path)
+        if os.path.isdir(path) and not os.path.islink(path):
+            with os.scandir(path) as entries:
+                for entry in list(entries):
+                    self.remove(job, entry.path)
+            os.rmdir(path)
+        else:
+            os.remove(path)
+        self.advance(job, 0)
+
+file_operations = FileOperationQueue()
+
 class ModernBootScreen:
     """Modern boot screen with enhanced design"""
     def __init__(self, master):
@@ -293,6 +733,8 @@ class ModernDesktop:
         self.desktop_frame = tk.Frame(master, bg='#0a0a20')
         self.desktop_frame.pack(fill='both', expand=True)
         
+        task_pool.attach(master)
+        
         self.setup_enhanced_desktop()
         self.animate_desktop_appear()
     
@@ -931,6 +1373,7 @@ class EnhancedTextEditor(EnhancedWindow):
         self.status.pack(fill='x', side='bottom')
         
         self.current_file = None
+        self.loading_task = None
         self.text_area.focus()
         self.update_line_numbers()
     
@@ -966,20 +1409,48 @@ class EnhancedTextEditor(EnhancedWindow):
             messagebox.showerror("Error", f"Save failed: {str(e)}")
     
     def open_file(self):
-        try:
-            filename = filedialog.askopenfilename(
-                filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
-            )
-            if filename:
-                with open(filename, "r", encoding="utf-8") as f:
-                    content = f.read()
-                self.text_area.delete(1.0, tk.END)
-                self.text_area.insert(1.0, content)
-                self.current_file = filename
-                self.status.config(text=f"Document loaded: {os.path.basename(filename)}")
-                self.update_line_numbers()
-        except Exception as e:
-            messagebox.showerror("Error", f"Open failed: {str(e)}")
+        filename = filedialog.askopenfilename(
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+        )
+        if filename:
+            if self.loading_task is not None:
+                task_pool.cancel(self.loading_task)
+            self.status.config(text=f"Loading {os.path.basename(filename)}...")
+            self.loading_task = task_pool.submit_io(
+                self.read_document, filename, owner=self.window,
+                on_done=lambda content: self.show_document(filename, content),
+                on_progress=lambda percent: self.status.config(
+                    text=f"Loading {os.path.basename(filename)}... {percent}%"),
+                on_error=self.open_failed)
+    
+    def read_document(self, token, progress, filename):
+        """Read the file in chunks on a worker thread"""
+        size = os.path.getsize(filename) or 1
+        chunks = []
+        read = 0
+        with open(filename, "rb") as f:
+            while True:
+                token.check()
+                chunk = f.read(1024 * 1024)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                read += len(chunk)
+                progress(min(100, read * 100 // size))
+        return b"".join(chunks).decode("utf-8")
+    
+    def show_document(self, filename, content):
+        self.loading_task = None
+        self.text_area.delete(1.0, tk.END)
+        self.text_area.insert(1.0, content)
+        self.current_file = filename
+        self.status.config(text=f"Document loaded: {os.path.basename(filename)}")
+        self.update_line_numbers()
+    
+    def open_failed(self, error):
+        self.loading_task = None
+        self.status.config(text="Ready")
+        messagebox.showerror("Error", f"Open failed: {str(error)}")
     
     def format_text(self):
         messagebox.showinfo("Format", "Text formatting applied!")
@@ -1266,10 +1737,20 @@ Note: This is a demonstration interface. Actual web browsing functionality would
         url = self.url_var.get()
         messagebox.showinfo("Browser", f"Navigating to: {url}\n\n(In real implementation, this would load the webpage)")
 
+DirRecord = namedtuple('DirRecord', 'name is_dir size mtime')
+
 class EnhancedFileManager(EnhancedWindow):
+    COLUMNS = [('name', 'Name'), ('size', 'Size'), ('type', 'Type'), ('modified', 'Modified')]
+    
     def __init__(self, master):
         super().__init__(master, "File Manager", 550, 450)
+        self.current_path = os.path.expanduser("~")
+        self.records = []
+        self.sort_keys = {}
+        self.sort_column = 0
+        self.sort_reverse = False
         self.setup_file_manager()
+        self.load_directory(self.current_path)
     
     def setup_file_manager(self):
         # Toolbar
@@ -1299,27 +1780,16 @@ class EnhancedFileManager(EnhancedWindow):
         columns = ('name', 'size', 'type', 'modified')
         self.tree = ttk.Treeview(list_frame, columns=columns, show='tree headings')
         
-        self.tree.heading('name', text='Name')
-        self.tree.heading('size', text='Size')
-        self.tree.heading('type', text='Type')
-        self.tree.heading('modified', text='Modified')
+        for index, (column, title) in enumerate(self.COLUMNS):
+            self.tree.heading(column, text=title, command=lambda index=index: self.sort_by(index))
+        self.tree.heading('name', text='Name \u25b2')
         
         self.tree.column('name', width=200)
         self.tree.column('size', width=80)
         self.tree.column('type', width=100)
         self.tree.column('modified', width=120)
         
-        # Sample files
-        sample_files = [
-            ('document.txt', '1.2 KB', 'Text File', '2024-01-15 10:30'),
-            ('image.png', '2.3 MB', 'Image', '2024-01-14 15:45'),
-            ('music.mp3', '4.5 MB', 'Audio', '2024-01-13 09:20'),
-            ('data.xlsx', '356 KB', 'Spreadsheet', '2024-01-12 14:15'),
-            ('script.py', '15 KB', 'Python File', '2024-01-11 11:00')
-        ]
-        
-        for file in sample_files:
-            self.tree.insert('', 'end', values=file)
+        self.tree.bind('<Double-Button-1>', self.open_item)
         
         scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=self.tree.yview)
         self.tree.configure(yscrollcommand=scrollbar.set)
@@ -1328,10 +1798,109 @@ class EnhancedFileManager(EnhancedWindow):
         scrollbar.pack(side='right', fill='y')
         
         # Status bar
-        status = tk.Label(self.content, text="5 items", 
-                         font=('Arial', 10),
-                         bg='#2a2a4a', fg='#8888ff')
-        status.pack(fill='x', side='bottom')
+        self.status = tk.Label(self.content, text="", 
+                              font=('Arial', 10),
+                              bg='#2a2a4a', fg='#8888ff')
+        self.status.pack(fill='x', side='bottom')
+        
+        # Progress strip, shown while a copy, move or delete runs
+        self.jobs = []
+        self.job_frame = tk.Frame(self.content, bg='#2a2a4a')
+        self.job_bar = ttk.Progressbar(self.job_frame, maximum=1000)
+        self.job_bar.pack(side='left', fill='x', expand=True, padx=5, pady=5)
+        self.pause_btn = tk.Button(self.job_frame, text="Pause", command=self.toggle_pause,
+                                   font=('Arial', 9), bg='#00ffff', fg='#000033')
+        self.pause_btn.pack(side='left', padx=2)
+        tk.Button(self.job_frame, text="Cancel", command=self.cancel_job,
+                 font=('Arial', 9), bg='#ff4444', fg='white').pack(side='left', padx=2)
+        self.window.bind('<Destroy>', self.release_job, add='+')
+    
+    def load_directory(self, path):
+        records = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            records.append(DirRecord(entry.name, True, 0, None))
+                        else:
+                            st = entry.stat()
+                            records.append(DirRecord(entry.name, False, st.st_size, st.st_mtime))
+                    except OSError:
+                        continue
+        except OSError as e:
+            messagebox.showerror("File Manager", f"Cannot open {path}: {e}")
+            return
+        self.current_path = path
+        self.records = records
+        self.sort_keys = {}
+        self.tree.delete(*self.tree.get_children())
+        if path != os.path.dirname(path):
+            self.tree.insert('', 'end', iid='..', values=('..', '', 'Folder', ''))
+        # Row ids are indexes into self.records; sorting only permutes them
+        for index in self.sorted_order():
+            self.tree.insert('', 'end', iid=str(index), values=self.describe(records[index]))
+        self.status.config(text=f"{len(records)} items  |  {path}")
+    
+    def sort_key(self, column):
+        """Per-record keys for a column, built once per listing and reused on every header click"""
+        keys = self.sort_keys.get(column)
+        if keys is None:
+            records = self.records
+            if column == 0:
+                keys = [natural_key(record.name) for record in records]
+            elif column == 2:
+                names = self.sort_key(0)
+                keys = [(os.path.splitext(record.name)[1].casefold(), names[index])
+                        for index, record in enumerate(records)]
+            else:
+                # Folders carry no size or time and are sorted apart from files, so they keep name order
+                names = self.sort_key(0)
+                field = 2 if column == 1 else 3
+                keys = [names[index] if record.is_dir else record[field]
+                        for index, record in enumerate(records)]
+            self.sort_keys[column] = keys
+        return keys
+    
+    def sorted_order(self):
+        keys = self.sort_key(self.sort_column).__getitem__
+        folders = [index for index, record in enumerate(self.records) if record.is_dir]
+        files = [index for index, record in enumerate(self.records) if not record.is_dir]
+        return (sorted(folders, key=keys, reverse=self.sort_reverse)
+                + sorted(files, key=keys, reverse=self.sort_reverse))
+    
+    def sort_by(self, column):
+        if column == self.sort_column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            name, title = self.COLUMNS[self.sort_column]
+            self.tree.heading(name, text=title)
+            self.sort_column = column
+            self.sort_reverse = False
+        name, title = self.COLUMNS[column]
+        arrow = "\u25bc" if self.sort_reverse else "\u25b2"
+        self.tree.heading(name, text=f"{title} {arrow}")
+        # Reorder the existing rows in one call instead of deleting and re-inserting them
+        rows = [str(index) for index in self.sorted_order()]
+        if self.tree.exists('..'):
+            rows.insert(0, '..')
+        self.tree.set_children('', *rows)
+    
+    def describe(self, record):
+        if record.is_dir:
+            return (record.name, '', 'Folder', '')
+        ext = os.path.splitext(record.name)[1][1:].upper()
+        modified = datetime.fromtimestamp(record.mtime).strftime('%Y-%m-%d %H:%M')
+        return (record.name, format_size(record.size), f"{ext} File" if ext else 'File', modified)
+    
+    def open_item(self, event):
+        item = self.tree.focus()
+        if item == '..':
+            self.load_directory(os.path.dirname(self.current_path))
+        elif item:
+            record = self.records[int(item)]
+            if record.is_dir:
+                self.load_directory(os.path.join(self.current_path, record.name))
     
     def new_folder(self):
         name = simpledialog.askstring("New Folder", "Enter folder name:")
@@ -1343,17 +1912,115 @@ class EnhancedFileManager(EnhancedWindow):
         if name:
             messagebox.showinfo("File Manager", f"Created file: {name}")
     
-    def delete_file(self):
-        messagebox.showinfo("File Manager", "Delete file clicked")
+    def selected_records(self):
+        return [self.records[int(item)] for item in self.tree.selection() if item != '..']
+    
+    def selected_paths(self):
+        return [os.path.join(self.current_path, record.name) for record in self.selected_records()]
     
     def copy_file(self):
-        messagebox.showinfo("File Manager", "Copy file clicked")
+        self.set_clipboard('copy', "Copied")
     
     def cut_file(self):
-        messagebox.showinfo("File Manager", "Cut file clicked")
+        self.set_clipboard('move', "Cut")
+    
+    def set_clipboard(self, kind, verb):
+        paths = self.selected_paths()
+        if not paths:
+            messagebox.showinfo("File Manager", "Select a file or folder first")
+            return
+        file_operations.clipboard = (paths, kind)
+        self.status.config(text=f"{verb} {len(paths)} item(s)")
     
     def paste_file(self):
-        messagebox.showinfo("File Manager", "Paste file clicked")
+        paths, kind = file_operations.clipboard
+        if not paths:
+            messagebox.showinfo("File Manager", "Nothing to paste")
+            return
+        policy = 'rename'
+        clashes = [path for path in paths
+                   if os.path.dirname(os.path.abspath(path)) != os.path.abspath(self.current_path)
+                   and os.path.lexists(os.path.join(self.current_path, os.path.basename(path)))]
+        if clashes:
+            answer = messagebox.askyesnocancel(
+                "Paste", f"{len(clashes)} item(s) already exist here.\n\n"
+                         "Yes: replace them\nNo: keep both\nCancel: skip them")
+            policy = {True: 'overwrite', False: 'rename', None: 'skip'}[answer]
+        if kind == 'move':
+            file_operations.clipboard = ([], 'copy')
+        self.start_job(kind, paths, policy)
+    
+    def delete_file(self):
+        paths = self.selected_paths()
+        if not paths:
+            messagebox.showinfo("File Manager", "Select a file or folder first")
+            return
+        names = ", ".join(os.path.basename(path) for path in paths[:3])
+        if len(paths) > 3:
+            names += f" and {len(paths) - 3} more"
+        if messagebox.askyesno("Delete", f"Permanently delete {names}?"):
+            self.start_job('delete', paths)
+    
+    def start_job(self, kind, paths, policy='rename'):
+        """Queue a job; the strip's Pause and Cancel act on all of this window's jobs"""
+        job = file_operations.submit(self.window, kind, paths, self.current_path, policy,
+                                     on_progress=self.show_job, on_done=self.finish_job)
+        if any(queued.paused for queued in self.jobs):
+            job.pause()
+        self.jobs.append(job)
+        if len(self.jobs) == 1:
+            self.job_bar['value'] = 0
+            self.pause_btn.config(text="Pause")
+            self.job_frame.pack(fill='x', side='bottom', padx=10)
+    
+    def show_job(self, job):
+        if job not in self.jobs or not self.window.winfo_exists():
+            return
+        verb = {'copy': "Copying", 'move': "Moving", 'delete': "Deleting"}[job.kind]
+        text = f"{verb} {job.current}"
+        if job.total:
+            self.job_bar['value'] = job.done * 1000 // job.total
+            text += f"  {format_size(job.done)} of {format_size(job.total)}  {format_size(job.rate)}/s"
+            if job.eta is not None:
+                text += f"  ETA {job.eta:.0f}s"
+        if len(self.jobs) > 1:
+            text += f"  (+{len(self.jobs) - 1} queued)"
+        self.status.config(text=text)
+    
+    def toggle_pause(self):
+        if not self.jobs:
+            return
+        if any(job.paused for job in self.jobs):
+            for job in self.jobs:
+                job.resume()
+            self.pause_btn.config(text="Pause")
+        else:
+            for job in self.jobs:
+                job.pause()
+            self.pause_btn.config(text="Resume")
+    
+    def cancel_job(self):
+        for job in self.jobs:
+            job.cancel()
+    
+    def release_job(self, event):
+        # A paused job would hold up every queued job once its window is gone
+        if event.widget is self.window:
+            for job in self.jobs:
+                job.resume()
+    
+    def finish_job(self, job, error):
+        if job in self.jobs:
+            self.jobs.remove(job)
+        if not self.window.winfo_exists():
+            return
+        if not self.jobs:
+            self.job_frame.pack_forget()
+        self.load_directory(self.current_path)
+        if error is not None:
+            messagebox.showerror("File Manager", str(error))
+        elif job.cancelled.is_set():
+            self.status.config(text="Operation cancelled")
 
 class EnhancedSystemInfo(EnhancedWindow):
     def __init__(self, master):